@@ -0,0 +1,9 @@
+"""Modules shared by the friend agents and the scheduling host.
+
+Each agent runs from its own directory, so its entry point adds
+a2a_friend_scheduling/ to sys.path before importing from here. task_store,
+session_service and sqlite_session_service are also used by the other projects
+in this repository, which are installed separately and keep their own copies;
+the travel host's tests check that the copies stay identical apart from
+their imports.
+"""
@@ -0,0 +1,59 @@
+"""Agent executor whose heavy imports and set-up run in the background."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+
+logger = logging.getLogger(__name__)
+
+
+class LazyAgentExecutor(AgentExecutor):
+    """Delegates to an executor built by `factory` on a worker thread.
+
+    The factory imports the agent framework and creates the model client, which
+    can take seconds. Starting it from the server's startup hook with warm_up()
+    lets the port bind and the agent card be served right away; requests that
+    arrive before the executor is ready wait for it.
+    """
+
+    def __init__(self, factory: Callable[[], AgentExecutor]):
+        self._factory = factory
+        self._ready: asyncio.Future | None = None
+        self.executor: AgentExecutor | None = None
+
+    async def warm_up(self):
+        """Starts building the executor without waiting for it."""
+        self._build()
+
+    def _build(self) -> asyncio.Future:
+        if self._ready is None:
+            started = time.perf_counter()
+
+            def _create() -> AgentExecutor:
+                self.executor = self._factory()
+                logger.info(
+                    "Agent ready in %.0f ms", (time.perf_counter() - started) * 1000
+                )
+                return self.executor
+
+            self._ready = asyncio.get_running_loop().run_in_executor(None, _create)
+            self._ready.add_done_callback(self._retry_on_failure)
+        return self._ready
+
+    def _retry_on_failure(self, ready: asyncio.Future):
+        if not ready.cancelled() and ready.exception() is not None:
+            logger.error("Failed to build the agent: %s", ready.exception())
+            # The next request tries again.
+            self._ready = None
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        executor = await self._build()
+        await executor.execute(context, event_queue)
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        executor = await self._build()
+        await executor.cancel(context, event_queue)
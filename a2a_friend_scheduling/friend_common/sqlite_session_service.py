@@ -0,0 +1,325 @@
+"""Durable ADK session service backed by a local SQLite database.
+
+Sessions are served from memory exactly like BoundedSessionService; every
+change is also queued and written to SQLite in batches by a single writer
+thread, so appending an event never waits on the disk. Sessions missing from
+memory (after a restart or an eviction) are loaded from the database on first
+access.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from friend_common.session_service import BoundedSessionService
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.state import State
+
+DB_PATH = os.getenv("SESSION_DB_PATH", "sessions.db")
+# Queued writes are committed this often, or as soon as this many are waiting.
+FLUSH_INTERVAL = float(os.getenv("SESSION_FLUSH_INTERVAL", "0.05"))
+FLUSH_BATCH_SIZE = int(os.getenv("SESSION_FLUSH_BATCH_SIZE", "256"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    last_update_time REAL NOT NULL,
+    PRIMARY KEY (app_name, user_id, session_id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    event TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_session ON events (app_name, user_id, session_id);
+CREATE TABLE IF NOT EXISTS app_state (
+    app_name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_state (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (app_name, user_id)
+);
+"""
+
+_UPSERT_SESSION = (
+    "INSERT OR REPLACE INTO sessions "
+    "(app_name, user_id, session_id, state, last_update_time) VALUES (?, ?, ?, ?, ?)"
+)
+_DELETE_EVENTS = (
+    "DELETE FROM events WHERE app_name = ? AND user_id = ? AND session_id = ?"
+)
+_DELETE_SESSION = (
+    "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND session_id = ?"
+)
+_INSERT_EVENT = (
+    "INSERT INTO events (app_name, user_id, session_id, event) VALUES (?, ?, ?, ?)"
+)
+_UPSERT_APP_STATE = "INSERT OR REPLACE INTO app_state (app_name, state) VALUES (?, ?)"
+_UPSERT_USER_STATE = (
+    "INSERT OR REPLACE INTO user_state (app_name, user_id, state) VALUES (?, ?, ?)"
+)
+
+
+class SqliteSessionService(BoundedSessionService):
+    """BoundedSessionService that persists sessions to SQLite in WAL mode.
+
+    Writes are batched: one transaction per flush, committed with
+    synchronous=NORMAL, which in WAL mode does not fsync on every commit.
+    A crash can lose at most the writes queued in the last FLUSH_INTERVAL.
+    Evicting a session from memory keeps it on disk; delete_session removes it
+    from both.
+
+    Set `shared` when several processes use the same database: get_session then
+    always re-reads the session, so events appended by other workers are seen.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, shared: bool = False, **limits: Any):
+        super().__init__(**limits)
+        self.db_path = db_path
+        self.shared = shared
+        # All database access happens on this one thread, in submission order.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="session-db"
+        )
+        self._db: sqlite3.Connection | None = None
+        self._pending: list[tuple[str, tuple]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._background_flushes: set[asyncio.Task] = set()
+        self._loaded_states: set[tuple[str, str]] = set()
+        self.flushes = 0
+        self.flushed_writes = 0
+        self.loaded_sessions = 0
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        await self._load_shared_state(app_name, user_id)
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        stored = self.sessions[app_name][user_id][session.id]
+        key = (app_name, user_id, session.id)
+        self._queue(_DELETE_EVENTS, key)
+        self._queue(
+            _UPSERT_SESSION,
+            (*key, json.dumps(stored.state), stored.last_update_time),
+        )
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        if self.shared or session_id not in self.sessions.get(app_name, {}).get(
+            user_id, {}
+        ):
+            await self._load_session(app_name, user_id, session_id)
+        return await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        key = (app_name, user_id, session_id)
+        self._queue(_DELETE_EVENTS, key)
+        self._queue(_DELETE_SESSION, key)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        if event.partial:
+            return event
+        # A session evicted mid-run is still persisted, from the caller's copy.
+        stored = (
+            self.sessions.get(session.app_name, {})
+            .get(session.user_id, {})
+            .get(session.id, session)
+        )
+        key = (session.app_name, session.user_id, session.id)
+        self._queue(_INSERT_EVENT, (*key, event.model_dump_json(exclude_none=True)))
+        self._queue(
+            _UPSERT_SESSION,
+            (*key, json.dumps(stored.state), stored.last_update_time),
+        )
+        delta = event.actions.state_delta if event.actions else None
+        if delta and any(k.startswith(State.APP_PREFIX) for k in delta):
+            self._queue(
+                _UPSERT_APP_STATE,
+                (
+                    session.app_name,
+                    json.dumps(self.app_state.get(session.app_name, {})),
+                ),
+            )
+        if delta and any(k.startswith(State.USER_PREFIX) for k in delta):
+            user_state = self.user_state.get(session.app_name, {}).get(
+                session.user_id, {}
+            )
+            self._queue(
+                _UPSERT_USER_STATE,
+                (session.app_name, session.user_id, json.dumps(user_state)),
+            )
+        return event
+
+    def _queue(self, sql: str, params: tuple):
+        self._pending.append((sql, params))
+        if len(self._pending) >= FLUSH_BATCH_SIZE:
+            task = asyncio.create_task(self.flush())
+            self._background_flushes.add(task)
+            task.add_done_callback(self._background_flushes.discard)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_INTERVAL)
+        await self.flush()
+
+    async def flush(self):
+        """Commits every queued write in one transaction."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        await self._run(self._write, batch)
+        self.flushes += 1
+        self.flushed_writes += len(batch)
+
+    async def aclose(self):
+        """Flushes queued writes and closes the database."""
+        if self._flush_task:
+            self._flush_task.cancel()
+        await self.flush()
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _write(self, batch: list[tuple[str, tuple]]):
+        db = self._connect()
+        with db:
+            for sql, params in batch:
+                db.execute(sql, params)
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def _load_shared_state(self, app_name: str, user_id: str):
+        """Restores app: and user: state once per app and user after a restart."""
+        if (app_name, user_id) in self._loaded_states:
+            return
+        self._loaded_states.add((app_name, user_id))
+        app_state, user_state = await self._run(
+            self._read_shared_state, app_name, user_id
+        )
+        if app_state is not None and app_name not in self.app_state:
+            self.app_state[app_name] = app_state
+        if user_state is not None:
+            self.user_state.setdefault(app_name, {}).setdefault(user_id, user_state)
+
+    def _read_shared_state(self, app_name: str, user_id: str):
+        db = self._connect()
+        app_row = db.execute(
+            "SELECT state FROM app_state WHERE app_name = ?", (app_name,)
+        ).fetchone()
+        user_row = db.execute(
+            "SELECT state FROM user_state WHERE app_name = ? AND user_id = ?",
+            (app_name, user_id),
+        ).fetchone()
+        return (
+            json.loads(app_row[0]) if app_row else None,
+            json.loads(user_row[0]) if user_row else None,
+        )
+
+    async def _load_session(self, app_name: str, user_id: str, session_id: str):
+        # Queued writes for this session must land before it is read back.
+        await self.flush()
+        await self._load_shared_state(app_name, user_id)
+        session = await self._run(self._read_session, app_name, user_id, session_id)
+        key = (app_name, user_id, session_id)
+        if session is None:
+            if key in self._last_access:
+                # Deleted by another worker.
+                await self._evict(key)
+            return
+        self._trim(session)
+        self.sessions.setdefault(app_name, {}).setdefault(user_id, {})[
+            session_id
+        ] = session
+        self._touch(key)
+        self.loaded_sessions += 1
+        await self._enforce_limits()
+
+    def _read_session(
+        self, app_name: str, user_id: str, session_id: str
+    ) -> Session | None:
+        db = self._connect()
+        key = (app_name, user_id, session_id)
+        row = db.execute(
+            "SELECT state, last_update_time FROM sessions "
+            "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        events = [
+            Event.model_validate_json(event)
+            for (event,) in db.execute(
+                "SELECT event FROM events "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ? ORDER BY seq",
+                key,
+            )
+        ]
+        return Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=json.loads(row[0]),
+            events=events,
+            last_update_time=row[1],
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "db_path": self.db_path,
+            "pending_writes": len(self._pending),
+            "flushes": self.flushes,
+            "flushed_writes": self.flushed_writes,
+            "loaded_sessions": self.loaded_sessions,
+        }
@@ -0,0 +1,169 @@
+"""A2A task store shared by all worker processes of an agent through SQLite."""
+
+import asyncio
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore
+from a2a.types import Task
+from friend_common.task_store import ACTIVE_TTL, COMPACT, TERMINAL_STATES, TERMINAL_TTL
+
+DB_PATH = os.getenv("TASK_DB_PATH", "tasks.db")
+# Expired tasks are purged by whichever worker saves a task after this interval.
+CLEANUP_INTERVAL = float(os.getenv("TASK_STORE_CLEANUP_INTERVAL", "60"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    context_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    terminal INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    task TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_age ON tasks (terminal, updated_at);
+"""
+# Rows not yet expired, which cleanup may not have purged yet; takes the
+# terminal and the active cutoff as parameters.
+_LIVE = "updated_at >= CASE terminal WHEN 1 THEN ? ELSE ? END"
+
+
+class SqliteTaskStore(TaskStore):
+    """TaskStore backed by one SQLite file in WAL mode.
+
+    Every save is committed before it returns, so a follow-up `tasks/get` or an
+    input-required continuation can be served by any worker. Terminal tasks
+    expire and are compacted with the same settings as BoundedTaskStore.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        terminal_ttl: float = TERMINAL_TTL,
+        active_ttl: float = ACTIVE_TTL,
+        compact: bool = COMPACT,
+    ):
+        self.db_path = db_path
+        self.terminal_ttl = terminal_ttl
+        self.active_ttl = active_ttl
+        self.compact = compact
+        # The connection is only ever used from this thread.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-db")
+        self._db: sqlite3.Connection | None = None
+        self._last_cleanup = 0.0
+        self.expired = 0
+        self.compacted = 0
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        terminal = task.status.state in TERMINAL_STATES
+        if (
+            terminal
+            and self.compact
+            and (task.history or len(task.artifacts or []) > 1)
+        ):
+            task = task.model_copy(
+                update={"history": [], "artifacts": (task.artifacts or [])[-1:]}
+            )
+            self.compacted += 1
+        row = (
+            task.id,
+            task.contextId,
+            task.status.state.value,
+            int(terminal),
+            time.time(),
+            task.model_dump_json(exclude_none=True),
+        )
+        await self._run(self._write, row)
+
+    async def get(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> Task | None:
+        payload = await self._run(self._read, task_id)
+        return Task.model_validate_json(payload) if payload else None
+
+    async def delete(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> None:
+        await self._run(self._delete, task_id)
+
+    async def _run(self, fn: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _write(self, row: tuple):
+        db = self._connect()
+        with db:
+            db.execute("INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?)", row)
+            now = time.time()
+            if now - self._last_cleanup >= CLEANUP_INTERVAL:
+                self._last_cleanup = now
+                cursor = db.execute(
+                    "DELETE FROM tasks WHERE (terminal = 1 AND updated_at < ?) "
+                    "OR (terminal = 0 AND updated_at < ?)",
+                    (now - self.terminal_ttl, now - self.active_ttl),
+                )
+                self.expired += cursor.rowcount
+
+    def _cutoffs(self) -> tuple[float, float]:
+        now = time.time()
+        return now - self.terminal_ttl, now - self.active_ttl
+
+    def _read(self, task_id: str) -> str | None:
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT task FROM tasks WHERE id = ? AND {_LIVE}",
+                (task_id, *self._cutoffs()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def _delete(self, task_id: str):
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    async def stats(self) -> dict[str, Any]:
+        """Task counts by state across all workers, plus this worker's counters."""
+        states, size = await self._run(self._count)
+        terminal = sum(states.get(state.value, 0) for state in TERMINAL_STATES)
+        return {
+            "tasks": sum(states.values()),
+            "terminal": terminal,
+            "active": sum(states.values()) - terminal,
+            "by_state": states,
+            "bytes": size,
+            "db_path": self.db_path,
+            "expired": self.expired,
+            "compacted": self.compacted,
+        }
+
+    def _count(self) -> tuple[dict[str, int], int]:
+        db = self._connect()
+        cutoffs = self._cutoffs()
+        states = dict(
+            db.execute(
+                f"SELECT state, COUNT(*) FROM tasks WHERE {_LIVE} GROUP BY state",
+                cutoffs,
+            )
+        )
+        (size,) = db.execute(
+            f"SELECT COALESCE(SUM(LENGTH(task)), 0) FROM tasks WHERE {_LIVE}",
+            cutoffs,
+        ).fetchone()
+        return states, size
@@ -0,0 +1,155 @@
+"""Bounded in-memory A2A task store with TTL eviction and compaction."""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, OrderedDict
+from typing import Any, NamedTuple
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore
+from a2a.types import Task, TaskState
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+# Finished tasks are dropped this long after their last update; tasks that never
+# finish (abandoned input-required conversations) after ACTIVE_TTL.
+TERMINAL_TTL = float(os.getenv("TASK_STORE_TTL", "3600"))
+ACTIVE_TTL = float(os.getenv("TASK_STORE_ACTIVE_TTL", "86400"))
+MAX_BYTES = int(os.getenv("TASK_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Keep only the final artifact of a finished task, without its message history.
+COMPACT = os.getenv("TASK_STORE_COMPACT", "true").lower() == "true"
+
+TERMINAL_STATES = frozenset(
+    {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+)
+
+
+class _Entry(NamedTuple):
+    task: Task
+    size: int
+    saved_at: float
+
+
+class BoundedTaskStore(TaskStore):
+    """Drop-in replacement for InMemoryTaskStore that does not grow forever.
+
+    Tasks are evicted after a TTL (shorter once they are finished) and, when the
+    serialized size of all tasks exceeds `max_bytes`, oldest first, finished
+    tasks before active ones.
+    """
+
+    def __init__(
+        self,
+        terminal_ttl: float = TERMINAL_TTL,
+        active_ttl: float = ACTIVE_TTL,
+        max_bytes: int = MAX_BYTES,
+        compact: bool = COMPACT,
+    ):
+        self.terminal_ttl = terminal_ttl
+        self.active_ttl = active_ttl
+        self.max_bytes = max_bytes
+        self.compact = compact
+        # Each ordered by last save, so the entries to expire first come first.
+        self._terminal: OrderedDict[str, _Entry] = OrderedDict()
+        self._active: OrderedDict[str, _Entry] = OrderedDict()
+        self.lock = asyncio.Lock()
+        self.bytes = 0
+        self.expired = 0
+        self.evicted = 0
+        self.compacted = 0
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        async with self.lock:
+            self._remove(task.id)
+            if task.status.state in TERMINAL_STATES:
+                if self.compact and (task.history or len(task.artifacts or []) > 1):
+                    # Copy, so the caller's task (often the response) is untouched.
+                    task = task.model_copy(
+                        update={"history": [], "artifacts": (task.artifacts or [])[-1:]}
+                    )
+                    self.compacted += 1
+                entries = self._terminal
+            else:
+                entries = self._active
+            size = len(task.model_dump_json(exclude_none=True))
+            entries[task.id] = _Entry(task, size, time.monotonic())
+            self.bytes += size
+            self._enforce_limits()
+
+    async def get(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> Task | None:
+        async with self.lock:
+            self._expire()
+            entry = self._terminal.get(task_id) or self._active.get(task_id)
+            return entry.task if entry else None
+
+    async def delete(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> None:
+        async with self.lock:
+            if not self._remove(task_id):
+                logger.warning(
+                    "Attempted to delete nonexistent task with id: %s", task_id
+                )
+
+    def _remove(self, task_id: str) -> bool:
+        entry = self._terminal.pop(task_id, None) or self._active.pop(task_id, None)
+        if entry:
+            self.bytes -= entry.size
+        return entry is not None
+
+    def _expire(self):
+        now = time.monotonic()
+        for entries, ttl in (
+            (self._terminal, self.terminal_ttl),
+            (self._active, self.active_ttl),
+        ):
+            while entries:
+                task_id, entry = next(iter(entries.items()))
+                if now - entry.saved_at < ttl:
+                    break
+                self._remove(task_id)
+                self.expired += 1
+
+    def _enforce_limits(self):
+        self._expire()
+        while self.bytes > self.max_bytes and (self._terminal or self._active):
+            entries = self._terminal or self._active
+            self._remove(next(iter(entries)))
+            self.evicted += 1
+
+    async def stats(self) -> dict[str, Any]:
+        """Task counts by state, stored bytes and eviction counters."""
+        async with self.lock:
+            self._expire()
+            states = Counter(
+                entry.task.status.state.value
+                for entries in (self._terminal, self._active)
+                for entry in entries.values()
+            )
+        return {
+            "tasks": len(self._terminal) + len(self._active),
+            "terminal": len(self._terminal),
+            "active": len(self._active),
+            "by_state": dict(states),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "compacted": self.compacted,
+        }
+
+
+def mount_stats(app: Starlette, task_store: BoundedTaskStore, path: str = "/stats"):
+    """Serves the task store's counts as JSON at `path`."""
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse(await task_store.stats())
+
+    app.add_route(path, stats, methods=["GET"])
@@ -1,3 +1,9 @@
 """The Host agent package."""
 
+import sys
+from pathlib import Path
+
+# Modules shared with the friend agents live in a2a_friend_scheduling/friend_common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
 from .agent import root_agent
@@ -1,38 +1,111 @@
 import asyncio
 import json
+import logging
+import os
+import random
+import time
 import uuid
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, AsyncIterable, List
 
 import httpx
-import nest_asyncio
 from a2a.client import A2ACardResolver
 from a2a.types import (
     AgentCard,
+    Message,
     MessageSendParams,
+    Part,
     SendMessageRequest,
     SendMessageResponse,
     SendMessageSuccessResponse,
+    SendStreamingMessageRequest,
+    SendStreamingMessageSuccessResponse,
     Task,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
+    TextPart,
 )
 from dotenv import load_dotenv
+from friend_common.session_service import BoundedSessionService
 from google.adk import Agent
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
+from .agent_index import AgentIndex
+from .circuit_breaker import AgentUnavailableError, CircuitBreaker
+from .http_pool import close_http_client, get_http_client
+from .mock_llm import MOCK_LLM, MockLlm
 from .pickleball_tools import (
     book_pickleball_court,
+    cancel_pickleball_booking,
+    find_common_slots,
+    find_court_windows,
     list_court_availabilities,
 )
+from .progress import (
+    AGENT_CALL,
+    AGENT_PROGRESS,
+    THINKING,
+    ProgressCoalescer,
+    agent_result_event,
+    progress_event,
+)
 from .remote_agent_connection import RemoteAgentConnections
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
-nest_asyncio.apply()
+
+# Upper bound on remote agent calls in flight at once, and the deadline for each call.
+MAX_CONCURRENT_REMOTE_CALLS = int(os.getenv("MAX_CONCURRENT_REMOTE_CALLS", "8"))
+REMOTE_CALL_TIMEOUT = float(os.getenv("REMOTE_CALL_TIMEOUT", "30"))
+# Start-up budget for agent card discovery; slower agents are registered once they answer.
+DISCOVERY_TIMEOUT = float(os.getenv("DISCOVERY_TIMEOUT", "5"))
+# Race a second replica of an agent once the primary is slower than its recent p95.
+HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "true").lower() == "true"
+# Background card refresh; the interval stays below the pool's keep-alive expiry so
+# probes also keep each agent's connection warm. Agents failing
+# HEALTH_CHECK_FAILURES probes in a row are dropped until they answer again.
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", "20"))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5"))
+HEALTH_CHECK_FAILURES = int(os.getenv("HEALTH_CHECK_FAILURES", "3"))
+# Registries larger than ROUTING_MIN_AGENTS only list the ROUTING_TOP_K agents
+# most relevant to the current turn, plus those already contacted. Smaller ones
+# are listed in full, so a request needing every agent never loses one.
+ROUTING_MIN_AGENTS = int(os.getenv("ROUTING_MIN_AGENTS", "24"))
+ROUTING_TOP_K = int(os.getenv("ROUTING_TOP_K", "8"))
+
+
+# Queue of the HostAgent.stream call in progress, if any. Remote calls push typed
+# progress events (call, result, relayed agent status) into it.
+_progress_updates: ContextVar[asyncio.Queue | None] = ContextVar(
+    "progress_updates", default=None
+)
+_STREAM_DONE = object()
+
+
+def _ms(started: float) -> str:
+    return f"{(time.perf_counter() - started) * 1000:.0f} ms"
+
+
+def _is_error_response(response: list[dict[str, Any]]) -> bool:
+    return bool(response) and str(response[0].get("text", "")).startswith("Error:")
+
+
+def _remember_contacted(tool_context: ToolContext, agent_names: list[str]):
+    # Contacted agents stay listed in the prompt for the rest of the session.
+    contacted = list(tool_context.state.get("contacted_agents", []))
+    contacted += [name for name in agent_names if name not in contacted]
+    tool_context.state["contacted_agents"] = contacted
+
+
+def _text_of(parts: list[Part]) -> str:
+    return "\n".join(p.root.text for p in parts if isinstance(p.root, TextPart))
 
 
 class HostAgent:
@@ -40,42 +113,214 @@ class HostAgent:
 
     def __init__(
         self,
+        remote_agent_addresses: List[str] | None = None,
     ):
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ""
+        self._remote_call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REMOTE_CALLS)
+        self._pending_discovery: set[asyncio.Task] = set()
+        self.replica_connections: dict[str, dict[str, RemoteAgentConnections]] = {}
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.remote_agent_addresses: list[str] = list(remote_agent_addresses or [])
+        self._discovery_loop: asyncio.AbstractEventLoop | None = None
+        self._agent_names_by_address: dict[str, str] = {}
+        self._probe_failures: dict[str, int] = {}
+        self._health_task: asyncio.Task | None = None
+        self._agents_fingerprint: tuple | None = None
+        self._agent_lines: dict[str, str] = {}
+        self.agent_index = AgentIndex()
         self._agent = self.create_agent()
         self._user_id = "host_agent"
+        self.session_service = BoundedSessionService()
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
             artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            session_service=self.session_service,
             memory_service=InMemoryMemoryService(),
         )
 
     async def _async_init_components(self, remote_agent_addresses: List[str]):
-        async with httpx.AsyncClient(timeout=30) as client:
-            for address in remote_agent_addresses:
-                card_resolver = A2ACardResolver(client, address)
-                try:
-                    card = await card_resolver.get_agent_card()
-                    remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
-                    )
-                    self.remote_agent_connections[card.name] = remote_connection
-                    self.cards[card.name] = card
-                except httpx.ConnectError as e:
-                    print(f"ERROR: Failed to get agent card from {address}: {e}")
-                except Exception as e:
-                    print(f"ERROR: Failed to initialize connection for {address}: {e}")
-
-        agent_info = [
-            json.dumps({"name": card.name, "description": card.description})
+        self.remote_agent_addresses = list(remote_agent_addresses)
+        self.start_discovery()
+        await self.wait_for_discovery(DISCOVERY_TIMEOUT)
+        self._render_agents()
+
+    def start_discovery(self):
+        """Resolves the agent cards in the background, once per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._discovery_loop is loop:
+            return
+        self._discovery_loop = loop
+        client = get_http_client()
+        for address in self.remote_agent_addresses:
+            if address not in self._agent_names_by_address:
+                task = asyncio.create_task(self._discover_agent(client, address))
+                self._pending_discovery.add(task)
+                task.add_done_callback(self._pending_discovery.discard)
+
+    async def wait_for_discovery(self, timeout: float):
+        """Waits up to `timeout` for the cards still being resolved."""
+        if not self._pending_discovery:
+            return
+        _, pending = await asyncio.wait(self._pending_discovery, timeout=timeout)
+        if pending:
+            print(
+                f"WARNING: {len(pending)} agent card(s) not resolved "
+                f"within {timeout:g}s; they will be registered when they answer."
+            )
+
+    async def _discover_agent(self, client: httpx.AsyncClient, address: str):
+        started = time.perf_counter()
+        card_resolver = A2ACardResolver(client, address)
+        try:
+            card = await card_resolver.get_agent_card()
+            self._register_agent(card, address)
+            print(f"Resolved agent card {card.name} from {address} in {_ms(started)}")
+        except httpx.ConnectError as e:
+            print(
+                f"ERROR: Failed to get agent card from {address} after {_ms(started)}: {e}"
+            )
+        except Exception as e:
+            print(
+                f"ERROR: Failed to initialize connection for {address} "
+                f"after {_ms(started)}: {e}"
+            )
+
+    def _register_agent(self, card: AgentCard, address: str):
+        known_name = self._agent_names_by_address.get(address)
+        if known_name and known_name != card.name:
+            # The address now serves a different agent.
+            self._unregister_address(address)
+        primary = self.remote_agent_connections.get(card.name)
+        replicas = self.replica_connections.setdefault(card.name, {})
+        if (primary and primary.agent_url == address and primary.card == card) or (
+            address in replicas
+        ):
+            return
+        self._agent_names_by_address[address] = card.name
+        remote_connection = RemoteAgentConnections(agent_card=card, agent_url=address)
+        if primary and primary.agent_url != address:
+            # Another address serving the same card is a replica for hedging.
+            replicas[address] = remote_connection
+            return
+        self.remote_agent_connections[card.name] = remote_connection
+        self.cards[card.name] = card
+        # Late arrivals after start-up become visible to the model right away.
+        self._render_agents()
+
+    def _unregister_address(self, address: str):
+        name = self._agent_names_by_address.pop(address, None)
+        if name is None:
+            return
+        replicas = self.replica_connections.get(name, {})
+        if replicas.pop(address, None):
+            return
+        if replicas:
+            # Promote a replica so the agent stays reachable.
+            _, self.remote_agent_connections[name] = replicas.popitem()
+            return
+        self.remote_agent_connections.pop(name, None)
+        self.cards.pop(name, None)
+        self.replica_connections.pop(name, None)
+        self._render_agents()
+
+    def _render_agents(self):
+        """Rebuilds the agent listing and routing index when the cards changed."""
+        fingerprint = tuple(card.model_dump_json() for card in self.cards.values())
+        if fingerprint == self._agents_fingerprint:
+            return
+        self._agents_fingerprint = fingerprint
+        self._agent_lines = {
+            card.name: json.dumps({"name": card.name, "description": card.description})
             for card in self.cards.values()
+        }
+        print("agent_info:", list(self._agent_lines.values()))
+        self.agents = (
+            "\n".join(self._agent_lines.values())
+            if self._agent_lines
+            else "No friends found"
+        )
+        self.agent_index.rebuild(self.cards.values())
+
+    def _agents_for(self, context: ReadonlyContext) -> str:
+        """Lists the agents relevant to the current turn plus those already contacted."""
+        if len(self._agent_lines) <= max(ROUTING_MIN_AGENTS, ROUTING_TOP_K):
+            return self.agents
+        query = ""
+        if context.user_content and context.user_content.parts:
+            query = " ".join(p.text for p in context.user_content.parts if p.text)
+        contacted = [
+            name
+            for name in context.state.get("contacted_agents", [])
+            if name in self._agent_lines
         ]
-        print("agent_info:", agent_info)
-        self.agents = "\n".join(agent_info) if agent_info else "No friends found"
+        selected = self.agent_index.search(query, ROUTING_TOP_K)
+        if not selected and not contacted:
+            return self.agents
+        selected += [name for name in contacted if name not in selected]
+        return "\n".join(self._agent_lines[name] for name in selected)
+
+    def start_health_checks(self):
+        """Starts the background card refresh in the running event loop."""
+        if (
+            self._health_task is None
+            or self._health_task.done()
+            or self._health_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+            await asyncio.gather(
+                *(self._probe_agent(address) for address in self.remote_agent_addresses)
+            )
+
+    async def _probe_agent(self, address: str):
+        """Re-resolves one agent card, registering, updating or dropping the agent."""
+        card_resolver = A2ACardResolver(get_http_client(), address)
+        try:
+            card = await card_resolver.get_agent_card(
+                http_kwargs={"timeout": HEALTH_CHECK_TIMEOUT}
+            )
+        except Exception as e:
+            failures = self._probe_failures.get(address, 0) + 1
+            self._probe_failures[address] = failures
+            if (
+                failures == HEALTH_CHECK_FAILURES
+                and address in self._agent_names_by_address
+            ):
+                print(
+                    f"WARNING: Dropping {address} after {failures} failed checks: {e}"
+                )
+                self._unregister_address(address)
+            return
+        if self._probe_failures.pop(address, 0) >= HEALTH_CHECK_FAILURES:
+            print(f"{address} is healthy again")
+        self._register_agent(card, address)
+
+    async def add_remote_agent(self, address: str):
+        """Adds an agent address to the registry without a restart."""
+        if address not in self.remote_agent_addresses:
+            self.remote_agent_addresses.append(address)
+        await self._discover_agent(get_http_client(), address)
+
+    def remove_remote_agent(self, address: str):
+        """Removes an agent address from the registry without a restart."""
+        if address in self.remote_agent_addresses:
+            self.remote_agent_addresses.remove(address)
+        self._probe_failures.pop(address, None)
+        self._unregister_address(address)
+
+    async def aclose(self):
+        """Stops background work and closes the shared HTTP pool."""
+        for task in self._pending_discovery:
+            task.cancel()
+        if self._health_task:
+            self._health_task.cancel()
+        await close_http_client()
 
     @classmethod
     async def create(
@@ -88,31 +333,44 @@ class HostAgent:
 
     def create_agent(self) -> Agent:
         return Agent(
-            model="gemini-2.5-flash",
+            model=MockLlm() if MOCK_LLM else "gemini-2.5-flash",
             name="Host_Agent",
             instruction=self.root_instruction,
             description="This Host agent orchestrates scheduling pickleball with friends.",
             tools=[
                 self.send_message,
+                self.send_messages,
                 book_pickleball_court,
+                cancel_pickleball_booking,
+                find_common_slots,
+                find_court_windows,
                 list_court_availabilities,
             ],
         )
 
-    def root_instruction(self, context: ReadonlyContext) -> str:
+    async def root_instruction(self, context: ReadonlyContext) -> str:
+        # `adk web` owns the event loop, so discovery and background refresh
+        # start on first use at the latest.
+        self.start_discovery()
+        self.start_health_checks()
+        if not self.cards:
+            await self.wait_for_discovery(DISCOVERY_TIMEOUT)
+            self._render_agents()
         return f"""
         **Role:** You are the Host Agent, an expert scheduler for pickleball games. Your primary function is to coordinate with friend agents to find a suitable time to play and then book a court.
 
         **Core Directives:**
 
         *   **Initiate Planning:** When asked to schedule a game, first determine who to invite and the desired date range from the user.
-        *   **Task Delegation:** Use the `send_message` tool to ask each friend for their availability.
+        *   **Task Delegation:** Use the `send_messages` tool to ask all friends for their availability in a single call; the friends are contacted in parallel. Use `send_message` only to follow up with one friend.
             *   Frame your request clearly (e.g., "Are you available for pickleball between 2024-08-01 and 2024-08-03?").
             *   Make sure you pass in the official name of the friend agent for each message request.
-        *   **Analyze Responses:** Once you have availability from all friends, analyze the responses to find common timeslots.
-        *   **Check Court Availability:** Before proposing times to the user, use the `list_court_availabilities` tool to ensure the court is also free at the common timeslots.
+            *   If a friend times out, continue with the answers you have and mention who did not respond.
+        *   **Find Common Times:** Once you have availability from all friends, call the `find_common_slots` tool once, with one entry per friend: the friend's name, a colon, then their reply. It finds the times when the friends and a court are all free; do not compare the lists yourself. If no time suits everyone, call it again with `required` set to one fewer friend.
+        *   **Check Court Availability:** Use the `find_court_windows` tool only to look for free court time regardless of friends, and `list_court_availabilities` only to see one day's bookings.
         *   **Propose and Confirm:** Present the common, court-available timeslots to the user for confirmation.
         *   **Book the Court:** After the user confirms a time, use the `book_pickleball_court` tool to make the reservation. This tool requires a `start_time` and an `end_time`.
+        *   **Cancel a Booking:** If the user wants to cancel, use the `cancel_pickleball_booking` tool with the booking ID.
         *   **Transparent Communication:** Relay the final booking confirmation, including the booking ID, to the user. Do not ask for permission before contacting friend agents.
         *   **Tool Reliance:** Strictly rely on available tools to address user requests. Do not generate responses based on assumptions.
         *   **Readability:** Make sure to respond in a concise and easy to read format (bullet points are good).
@@ -123,7 +381,7 @@ class HostAgent:
         **Today's Date (YYYY-MM-DD):** {datetime.now().strftime("%Y-%m-%d")}
 
         <Available Agents>
-        {self.agents}
+        {self._agents_for(context)}
         </Available Agents>
         """
 
@@ -146,40 +404,209 @@ class HostAgent:
                 state={},
                 session_id=session_id,
             )
-        async for event in self._runner.run_async(
-            user_id=self._user_id, session_id=session.id, new_message=content
-        ):
-            if event.is_final_response():
-                response = ""
-                if (
-                    event.content
-                    and event.content.parts
-                    and event.content.parts[0].text
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _run_agent():
+            _progress_updates.set(queue)
+            try:
+                async for event in self._runner.run_async(
+                    user_id=self._user_id, session_id=session.id, new_message=content
                 ):
-                    response = "\n".join(
-                        [p.text for p in event.content.parts if p.text]
+                    await queue.put(event)
+            finally:
+                await queue.put(_STREAM_DONE)
+
+        progress = ProgressCoalescer()
+        runner_task = asyncio.create_task(_run_agent())
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), progress.wait_time())
+                except asyncio.TimeoutError:
+                    for update in progress.due():
+                        yield update
+                    continue
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, dict):
+                    # Remote calls and progress relayed from streaming agents.
+                    updates = progress.offer(item)
+                elif item.is_final_response():
+                    response = ""
+                    if (
+                        item.content
+                        and item.content.parts
+                        and item.content.parts[0].text
+                    ):
+                        response = "\n".join(
+                            [p.text for p in item.content.parts if p.text]
+                        )
+                    progress.discard()
+                    updates = [{"is_task_complete": True, "content": response}]
+                else:
+                    updates = progress.offer(
+                        progress_event(THINKING, "The host agent is thinking...")
                     )
-                yield {
-                    "is_task_complete": True,
-                    "content": response,
-                }
-            else:
-                yield {
-                    "is_task_complete": False,
-                    "updates": "The host agent is thinking...",
-                }
+                for update in updates:
+                    yield update
+            await runner_task
+        finally:
+            runner_task.cancel()
 
     async def send_message(self, agent_name: str, task: str, tool_context: ToolContext):
         """Sends a task to a remote friend agent."""
+        _remember_contacted(tool_context, [agent_name])
+        try:
+            return await self._send_task(agent_name, task, tool_context.state)
+        except asyncio.TimeoutError:
+            message = f"{agent_name} did not respond within {REMOTE_CALL_TIMEOUT:g}s."
+            print(message)
+            return [{"text": message}]
+        except AgentUnavailableError as e:
+            return [{"text": str(e)}]
+
+    async def send_messages(
+        self, agent_names: list[str], tasks: list[str], tool_context: ToolContext
+    ):
+        """Sends tasks to several remote friend agents in parallel.
+
+        Args:
+            agent_names: The official names of the friend agents to contact.
+            tasks: The task for each agent, in the same order as agent_names.
+
+        Returns:
+            One result per agent with its status ("success", "timeout",
+            "unavailable" or "error") and response. Slow agents do not hold back the answers of the others.
+        """
+        if len(agent_names) != len(tasks):
+            raise ValueError("agent_names and tasks must have the same length")
+        _remember_contacted(tool_context, agent_names)
+        return await self._fan_out(list(zip(agent_names, tasks)), tool_context.state)
+
+    async def _fan_out(
+        self, calls: list[tuple[str, str]], state: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Runs remote calls concurrently, each bounded by REMOTE_CALL_TIMEOUT."""
+
+        async def _call(agent_name: str, task: str) -> dict[str, Any]:
+            try:
+                response = await self._send_task(agent_name, task, state)
+                status = "success"
+            except asyncio.TimeoutError:
+                response = f"No response within {REMOTE_CALL_TIMEOUT:g}s."
+                status = "timeout"
+            except AgentUnavailableError as e:
+                response = str(e)
+                status = "unavailable"
+            except Exception as e:
+                response = str(e)
+                status = "error"
+            return {"agent_name": agent_name, "status": status, "response": response}
+
+        return await asyncio.gather(*(_call(name, task) for name, task in calls))
+
+    async def _send_task(self, agent_name: str, task: str, state: dict[str, Any]):
+        """Sends a task to one agent through its circuit breaker, the concurrency
+        cap and the deadline."""
         if agent_name not in self.remote_agent_connections:
             raise ValueError(f"Agent {agent_name} not found")
-        client = self.remote_agent_connections[agent_name]
+        started = time.perf_counter()
+        breaker = self._breaker_for(agent_name)
+        if not breaker.allow_request():
+            self._report(agent_result_event(agent_name, "unavailable", started))
+            raise AgentUnavailableError(
+                f"{agent_name} is temporarily unavailable. Continue without it."
+            )
+
+        async def _bounded():
+            async with self._remote_call_semaphore:
+                return await self._send_hedged(agent_name, task, state, breaker)
+
+        self._report(progress_event(AGENT_CALL, f"Calling {agent_name}...", agent_name))
+        try:
+            response = await asyncio.wait_for(_bounded(), timeout=REMOTE_CALL_TIMEOUT)
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except asyncio.TimeoutError:
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "timeout", started))
+            raise
+        except Exception:
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "error", started))
+            raise
+        if _is_error_response(response):
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "error", started))
+        else:
+            breaker.record_success(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "success", started))
+        return response
+
+    def _breaker_for(self, agent_name: str) -> CircuitBreaker:
+        if agent_name not in self.circuit_breakers:
+            self.circuit_breakers[agent_name] = CircuitBreaker(agent_name)
+        return self.circuit_breakers[agent_name]
+
+    async def _send_hedged(
+        self,
+        agent_name: str,
+        task: str,
+        state: dict[str, Any],
+        breaker: CircuitBreaker,
+    ):
+        """Sends to the primary and, past its p95 latency, also to a replica.
+
+        The first usable answer wins and the other request is cancelled.
+        """
+        replicas = list(self.replica_connections.get(agent_name, {}).values())
+        delay = breaker.hedge_delay()
+        if not HEDGE_REQUESTS or not replicas or delay is None:
+            return await self._send_task_unbounded(agent_name, task, state)
+
+        primary = asyncio.create_task(
+            self._send_task_unbounded(agent_name, task, state)
+        )
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                print(f"Hedging {agent_name} after {delay * 1000:.0f} ms")
+                pending.add(
+                    asyncio.create_task(
+                        self._send_task_unbounded(
+                            agent_name, task, state, client=random.choice(replicas)
+                        )
+                    )
+                )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    if not finished.exception() and not _is_error_response(
+                        finished.result()
+                    ):
+                        return finished.result()
+            return await primary
+        finally:
+            for request in pending:
+                request.cancel()
+
+    async def _send_task_unbounded(
+        self,
+        agent_name: str,
+        task: str,
+        state: dict[str, Any],
+        client: RemoteAgentConnections | None = None,
+    ):
+        client = client or self.remote_agent_connections.get(agent_name)
 
         if not client:
             raise ValueError(f"Client not available for {agent_name}")
 
         # Simplified task and context ID management
-        state = tool_context.state
         task_id = state.get("task_id", str(uuid.uuid4()))
         context_id = state.get("context_id", str(uuid.uuid4()))
         message_id = str(uuid.uuid4())
@@ -194,17 +621,23 @@ class HostAgent:
             },
         }
 
+        if client.supports_streaming:
+            return await self._stream_task(agent_name, client, message_id, payload)
+
         message_request = SendMessageRequest(
             id=message_id, params=MessageSendParams.model_validate(payload)
         )
         send_response: SendMessageResponse = await client.send_message(message_request)
-        print("send_response", send_response)
+        logger.debug("send_response %s", send_response)
 
         if not isinstance(
             send_response.root, SendMessageSuccessResponse
         ) or not isinstance(send_response.root.result, Task):
-            print("Received a non-success or non-task response. Cannot proceed.")
-            return
+            error_message = (
+                "Received a non-success or non-task response from remote agent."
+            )
+            print(error_message)
+            return [{"text": f"Error: {error_message}"}]
 
         response_content = send_response.root.model_dump_json(exclude_none=True)
         json_content = json.loads(response_content)
@@ -216,36 +649,88 @@ class HostAgent:
                     resp.extend(artifact["parts"])
         return resp
 
+    async def _stream_task(
+        self,
+        agent_name: str,
+        client: RemoteAgentConnections,
+        message_id: str,
+        payload: dict[str, Any],
+    ):
+        """Sends a task over message/stream, relaying status updates as they arrive.
 
-def _get_initialized_host_agent_sync():
-    """Synchronously creates and initializes the HostAgent."""
+        Returns the final artifact parts, or the last status message when the
+        agent finished without an artifact (e.g. it needs more input).
+        """
+        request = SendStreamingMessageRequest(
+            id=message_id, params=MessageSendParams.model_validate(payload)
+        )
+        artifacts: dict[str, list[Part]] = {}
+        last_message: list[Part] = []
+        async for response in client.send_message_streaming(request):
+            if not isinstance(response.root, SendStreamingMessageSuccessResponse):
+                error_message = f"Received an error response from {agent_name}."
+                print(error_message)
+                return [{"text": f"Error: {error_message}"}]
+            result = response.root.result
+            if isinstance(result, TaskArtifactUpdateEvent):
+                parts = artifacts.setdefault(result.artifact.artifactId, [])
+                if not result.append:
+                    parts.clear()
+                parts.extend(result.artifact.parts)
+            elif isinstance(result, TaskStatusUpdateEvent):
+                if result.status.message:
+                    last_message = result.status.message.parts
+                    self._report_progress(agent_name, _text_of(last_message))
+            elif isinstance(result, Task):
+                for artifact in result.artifacts or []:
+                    artifacts[artifact.artifactId] = list(artifact.parts)
+                if result.status.message:
+                    last_message = result.status.message.parts
+            elif isinstance(result, Message):
+                last_message = result.parts
 
-    async def _async_main():
-        # Hardcoded URLs for the friend agents
-        friend_agent_urls = [
-            "http://localhost:10002",  # Karley's Agent
-            "http://localhost:10003",  # Nate's Agent
-            "http://localhost:10004",  # Kaitlynn's Agent
+        parts = [part for parts in artifacts.values() for part in parts]
+        return [
+            part.model_dump(mode="json", exclude_none=True)
+            for part in parts or last_message
         ]
 
-        print("initializing host agent")
-        hosting_agent_instance = await HostAgent.create(
-            remote_agent_addresses=friend_agent_urls
-        )
-        print("HostAgent initialized")
-        return hosting_agent_instance.create_agent()
+    def _report_progress(self, agent_name: str, text: str):
+        if text:
+            self._report(
+                progress_event(AGENT_PROGRESS, f"{agent_name}: {text}", agent_name)
+            )
+
+    def _report(self, event: dict[str, Any]):
+        """Passes a progress event to the HostAgent.stream call in progress."""
+        updates = _progress_updates.get()
+        if updates is not None:
+            updates.put_nowait(event)
+
+
+# Friend agents contacted by the `adk web` host.
+FRIEND_AGENT_URLS = [
+    "http://localhost:10002",  # Karley's Agent
+    "http://localhost:10003",  # Nate's Agent
+    "http://localhost:10004",  # Kaitlynn's Agent
+]
 
+
+def _create_host_agent() -> HostAgent:
+    """Builds the HostAgent without touching the network.
+
+    Agent cards are resolved in the background: right away if the module is
+    imported inside a running event loop, otherwise when the agent renders its
+    first instruction.
+    """
+    host_agent = HostAgent(remote_agent_addresses=FRIEND_AGENT_URLS)
     try:
-        return asyncio.run(_async_main())
-    except RuntimeError as e:
-        if "asyncio.run() cannot be called from a running event loop" in str(e):
-            print(
-                f"Warning: Could not initialize HostAgent with asyncio.run(): {e}. "
-                "This can happen if an event loop is already running (e.g., in Jupyter). "
-                "Consider initializing HostAgent within an async function in your application."
-            )
-        else:
-            raise
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return host_agent
+    host_agent.start_discovery()
+    return host_agent
 
 
-root_agent = _get_initialized_host_agent_sync()
+host_agent = _create_host_agent()
+root_agent = host_agent.create_agent()
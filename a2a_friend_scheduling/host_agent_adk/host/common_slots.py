@@ -0,0 +1,255 @@
+"""Times when several friends and a court are all free, found with bitmasks.
+
+Each friend's availability on a day becomes a minute mask, as in
+court_schedule. Adding the masks up as binary counters, one mask per bit of the
+count, gives the minutes at which at least `required` friends are free in a
+handful of big-integer operations per friend, however many friends and minutes
+there are. Only game starts inside those minutes, and inside a time with a court
+free, are then checked friend by friend.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date
+
+from .court_schedule import (
+    MINUTES_PER_DAY,
+    CourtSchedule,
+    format_minutes,
+    parse_minutes,
+    range_mask,
+)
+
+# Friends report their free time as the start times of one-hour slots.
+SLOT_MINUTES = 60
+# Games start on this grid, in minutes.
+START_STEP = 15
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# 18:00, 6 PM, 6:30pm or 6 p.m.; a bare hour only counts as a range start.
+_CLOCK = r"(?<![\d:])\d{1,2}(?::\d{2})?(?!\d)(?:\s*[ap](?:\.m\.?|m\b))?"
+_TIMES = re.compile(
+    rf"(\d{{4}}-\d{{2}}-\d{{2}})|({_CLOCK})(?:\s*(?:-|–|to)\s*({_CLOCK}))?",
+    re.IGNORECASE,
+)
+_MERIDIEM = re.compile(r"\s*([ap])(?:\.m\.?|m)$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class CommonWindow:
+    day: date
+    start: int
+    end: int
+    available: tuple[str, ...]
+    missing: tuple[str, ...]
+    # Courts free for the whole window; empty when courts are not checked.
+    courts: tuple[int, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.day.isoformat(),
+            "start_time": format_minutes(self.start),
+            "end_time": format_minutes(self.end),
+            "available": list(self.available),
+            "missing": list(self.missing),
+            "courts": list(self.courts),
+        }
+
+
+def parse_availability(
+    lines: list[str],
+) -> tuple[dict[str, dict[date, int]], list[str]]:
+    """Minute masks per friend and day from "Name: <dates and times>" lines.
+
+    After the name, each YYYY-MM-DD date applies to the times that follow it.
+    A time, as 18:00 or 6 PM, is a one-hour slot starting then; 18:00-20:00 or
+    6-8 PM is a range. Other text is ignored, so a friend's reply can follow
+    their name unchanged. Lines for the same friend are merged.
+
+    Input that cannot be used, a line without a name or a time before any date
+    or invalid, is skipped rather than failing the other friends; the second
+    return value says what was skipped, one message per line or time.
+    """
+    availability: dict[str, dict[date, int]] = {}
+    skipped: list[str] = []
+    for line in lines:
+        name, separator, text = line.partition(":")
+        name = name.strip()
+        if not separator or not name or _DATE.search(name):
+            skipped.append(f"Expected 'Name: dates and times', got {line!r}")
+            continue
+        days = availability.setdefault(name, {})
+        day = None
+        for found_date, start_time, end_time in _TIMES.findall(text):
+            if found_date:
+                try:
+                    day = date.fromisoformat(found_date)
+                except ValueError:
+                    skipped.append(f"{name}: invalid date {found_date}")
+                    day = None
+                continue
+            if not (_is_clock(start_time) or _is_clock(end_time)):
+                # Bare numbers, such as a count, not times.
+                continue
+            times = f"{start_time}-{end_time}" if end_time else start_time
+            if day is None:
+                skipped.append(f"{name}: {times} comes before any date")
+                continue
+            try:
+                start, end = _time_range(start_time, end_time)
+            except ValueError as e:
+                skipped.append(f"{name}: {e}")
+                continue
+            days[day] = days.get(day, 0) | range_mask(start, end)
+    return availability, skipped
+
+
+def _is_clock(text: str) -> bool:
+    return ":" in text or _MERIDIEM.search(text) is not None
+
+
+def _time_range(start_time: str, end_time: str) -> tuple[int, int]:
+    """Start and end minutes of a time or range; raises ValueError if invalid."""
+    if not end_time:
+        start = _minutes(start_time)
+        return start, min(start + SLOT_MINUTES, MINUTES_PER_DAY)
+    end = _minutes(end_time)
+    meridiem = _MERIDIEM.search(end_time)
+    if meridiem and not _MERIDIEM.search(start_time):
+        # "6-8 PM": the start is in the end's half of the day if that fits,
+        # else a morning hour or a 24-hour time, as in "11-1 PM".
+        starts = [f"{start_time}{meridiem.group(1)}m"]
+        starts.append(start_time if ":" in start_time else f"{start_time}am")
+    else:
+        starts = [start_time]
+    for text in starts:
+        try:
+            start = _minutes(text)
+        except ValueError:
+            continue
+        if start < end:
+            return start, end
+    raise ValueError(f"Empty time range {start_time}-{end_time}")
+
+
+def _minutes(text: str) -> int:
+    """Minutes after midnight of 18:00, 6 PM or 6:30pm; ValueError if invalid."""
+    meridiem = _MERIDIEM.search(text)
+    if meridiem is None:
+        return parse_minutes(text)
+    hours, _, minutes = text[: meridiem.start()].partition(":")
+    hours, minutes = int(hours), int(minutes or 0)
+    if not 1 <= hours <= 12 or minutes >= 60:
+        raise ValueError(f"Invalid time: {text!r}")
+    # 12 AM is midnight and 12 PM noon.
+    hours %= 12
+    if meridiem.group(1).lower() == "p":
+        hours += 12
+    return hours * 60 + minutes
+
+
+def common_windows(
+    availability: dict[str, dict[date, int]],
+    schedule: CourtSchedule | None = None,
+    duration: int = 60,
+    required: int = 0,
+    limit: int = 5,
+) -> list[CommonWindow]:
+    """The best `limit` windows for a game of `duration` minutes.
+
+    A window is a continuous time in which the same friends, at least
+    `required` of them (0 for all), are free, and, with a `schedule`, the same
+    courts are free too; any game of `duration` minutes starting on the
+    START_STEP grid inside it works for all of them. Windows with more friends
+    come first, then earlier ones.
+    """
+    friends = list(availability)
+    required = len(friends) if required <= 0 else min(required, len(friends))
+    days = sorted({day for slots in availability.values() for day in slots})
+    windows: list[CommonWindow] = []
+    for day in days:
+        if schedule is not None and not schedule.is_open(day):
+            continue
+        masks = [availability[friend].get(day, 0) for friend in friends]
+        candidates = _at_least(_count(masks), required)
+        if schedule is not None:
+            candidates &= schedule.free_mask(day)
+        for run_start, run_end in _runs(candidates):
+            first = -(-run_start // START_STEP) * START_STEP
+            for start in range(first, run_end - duration + 1, START_STEP):
+                window = range_mask(start, start + duration)
+                free = tuple(
+                    friend
+                    for friend, mask in zip(friends, masks)
+                    if mask & window == window
+                )
+                if len(free) < required:
+                    continue
+                courts: tuple[int, ...] = ()
+                if schedule is not None:
+                    courts = tuple(schedule.free_courts(day, start, start + duration))
+                    if not courts:
+                        continue
+                last = windows[-1] if windows else None
+                if (
+                    last is not None
+                    and (last.day, last.available, last.courts) == (day, free, courts)
+                    and last.end - duration + START_STEP == start
+                ):
+                    windows[-1] = CommonWindow(
+                        day, last.start, start + duration, free, last.missing, courts
+                    )
+                    continue
+                missing = tuple(friend for friend in friends if friend not in free)
+                windows.append(
+                    CommonWindow(day, start, start + duration, free, missing, courts)
+                )
+    windows.sort(key=lambda window: (-len(window.available), window.day, window.start))
+    return windows[:limit]
+
+
+def _count(masks: list[int]) -> list[int]:
+    """Per-minute counts of set bits across masks, as binary digit masks.
+
+    Bit `m` of the i-th returned mask is bit i of the number of masks with
+    bit `m` set.
+    """
+    digits: list[int] = []
+    for carry in masks:
+        for index, digit in enumerate(digits):
+            digits[index], carry = digit ^ carry, digit & carry
+            if not carry:
+                break
+        if carry:
+            digits.append(carry)
+    return digits
+
+
+def _at_least(digits: list[int], threshold: int) -> int:
+    """Minutes whose count, as returned by _count, is at least `threshold`."""
+    if threshold <= 0:
+        return range_mask(0, MINUTES_PER_DAY)
+    if threshold.bit_length() > len(digits):
+        return 0
+    # Compare each minute's count with the threshold from the top digit down.
+    greater, equal = 0, range_mask(0, MINUTES_PER_DAY)
+    for index in reversed(range(len(digits))):
+        digit = digits[index]
+        if threshold >> index & 1:
+            equal &= digit
+        else:
+            greater |= equal & digit
+            equal &= ~digit
+    return greater | equal
+
+
+def _runs(mask: int) -> list[tuple[int, int]]:
+    """The (start, end) minute ranges of the runs of set bits in a mask."""
+    runs = []
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        rest = mask >> start
+        end = start + (rest ^ (rest + 1)).bit_length() - 1
+        runs.append((start, end))
+        mask &= ~range_mask(start, end)
+    return runs
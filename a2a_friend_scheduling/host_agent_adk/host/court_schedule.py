@@ -0,0 +1,410 @@
+"""Court bookings kept as one bitmask per court and day.
+
+Bit `m` of a court's mask for a day stands for the minute starting `m` minutes
+after midnight; a set bit means the minute is taken, either because the court
+is closed or because it is booked. Checking or claiming a time range is then a
+single AND or OR with the range's mask, however long the range is.
+
+Alongside the masks, each court and day keeps its sorted free intervals, split
+as bookings are made, so searches for free windows read them directly instead
+of scanning minutes.
+
+With a ReservationStore, every booking and cancellation is committed to SQLite
+before it takes effect, and the masks and intervals are rebuilt from the store
+when the schedule is created.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import sqlite3
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .reservation_store import ReservationStore
+
+logger = logging.getLogger(__name__)
+
+COURTS = int(os.getenv("PICKLEBALL_COURTS", "1"))
+# Days ahead, starting today, that can be booked.
+SCHEDULE_DAYS = int(os.getenv("PICKLEBALL_SCHEDULE_DAYS", "7"))
+OPENS = 8 * 60  # 8 AM
+CLOSES = 21 * 60  # 9 PM, after the last one-hour slot at 8 PM
+MINUTES_PER_DAY = 24 * 60
+
+
+class BookingError(Exception):
+    """Raised when a booking cannot be made; the message says why."""
+
+
+@dataclass(frozen=True)
+class Booking:
+    booking_id: str
+    court: int
+    day: date
+    # Minutes after midnight.
+    start: int
+    end: int
+    reservation_name: str
+
+    @property
+    def start_time(self) -> str:
+        return format_minutes(self.start)
+
+    @property
+    def end_time(self) -> str:
+        return format_minutes(self.end)
+
+    def to_dict(self) -> dict:
+        return {
+            "booking_id": self.booking_id,
+            "court": self.court,
+            "date": self.day.isoformat(),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "reservation_name": self.reservation_name,
+        }
+
+
+@dataclass(frozen=True)
+class FreeWindow:
+    day: date
+    start: int
+    end: int
+    # Courts free for the whole window.
+    courts: tuple[int, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.day.isoformat(),
+            "start_time": format_minutes(self.start),
+            "end_time": format_minutes(self.end),
+            "courts": list(self.courts),
+        }
+
+
+def parse_minutes(value: str) -> int:
+    """Minutes after midnight of an HH:MM time; raises ValueError if invalid."""
+    hours, _, minutes = value.strip().partition(":")
+    if not (hours.isdigit() and minutes.isdigit() and len(minutes) == 2):
+        raise ValueError(f"Invalid time: {value!r}")
+    total = int(hours) * 60 + int(minutes)
+    if int(minutes) >= 60 or total > MINUTES_PER_DAY:
+        raise ValueError(f"Invalid time: {value!r}")
+    return total
+
+
+def format_minutes(minutes: int) -> str:
+    return f"{minutes // 60:02}:{minutes % 60:02}"
+
+
+def range_mask(start: int, end: int) -> int:
+    """Mask with the bits of minutes start..end-1 set."""
+    return ((1 << (end - start)) - 1) << start
+
+
+class CourtSchedule:
+    """Bookings for `courts` courts over `days` days from `first_day`.
+
+    Courts are numbered from 1. book() and cancel() run under one asyncio
+    lock, including the write to `store`, so two sessions asking for the same
+    slot cannot both get it. The in-memory index is per process: processes
+    sharing a store do not see each other's bookings until they restart.
+    """
+
+    def __init__(
+        self,
+        courts: int = COURTS,
+        days: int = SCHEDULE_DAYS,
+        first_day: date | None = None,
+        opens: int = OPENS,
+        closes: int = CLOSES,
+        store: "ReservationStore | None" = None,
+    ):
+        first_day = first_day or date.today()
+        self.courts = courts
+        self.opens = opens
+        self.closes = closes
+        self._closed = range_mask(0, MINUTES_PER_DAY) & ~range_mask(opens, closes)
+        self._taken: dict[date, list[int]] = {
+            first_day + timedelta(days=offset): [self._closed] * courts
+            for offset in range(days)
+        }
+        self._bookings: dict[date, list[Booking]] = {day: [] for day in self._taken}
+        # Sorted (start, end) free intervals per day and court.
+        self._free: dict[date, list[list[tuple[int, int]]]] = {
+            day: [[(opens, closes)] for _ in range(courts)] for day in self._taken
+        }
+        self._by_id: dict[str, Booking] = {}
+        # Idempotency key to booking, and booking ID back to its key.
+        self._by_key: dict[str, Booking] = {}
+        self._keys: dict[str, str] = {}
+        self._lock = asyncio.Lock()
+        self.store = store
+        if store is not None:
+            self._restore(store.load(first_day, first_day + timedelta(days=days - 1)))
+
+    @property
+    def days(self) -> list[date]:
+        return list(self._taken)
+
+    def is_open(self, day: date) -> bool:
+        return day in self._taken
+
+    def bookings(self, day: date) -> list[Booking]:
+        return sorted(
+            self._bookings.get(day, []),
+            key=lambda booking: (booking.start, booking.court),
+        )
+
+    def free_courts(self, day: date, start: int, end: int) -> list[int]:
+        mask = range_mask(start, end)
+        return [
+            court
+            for court, taken in enumerate(self._taken.get(day, []), start=1)
+            if not taken & mask
+        ]
+
+    def free_mask(self, day: date) -> int:
+        """Mask of the minutes of a day at which at least one court is free."""
+        taken = range_mask(0, MINUTES_PER_DAY)
+        for court_taken in self._taken.get(day, []):
+            taken &= court_taken
+        return ~taken & range_mask(0, MINUTES_PER_DAY)
+
+    def free_slots(self, day: date, length: int = 60) -> list[str]:
+        """Start times of the `length`-minute slots with a court free."""
+        return [
+            format_minutes(start)
+            for start in range(self.opens, self.closes - length + 1, length)
+            if self.free_courts(day, start, start + length)
+        ]
+
+    def free_windows(
+        self,
+        first_day: date,
+        last_day: date,
+        duration: int,
+        earliest: int = 0,
+        latest: int = MINUTES_PER_DAY,
+        limit: int = 10,
+    ) -> list[FreeWindow]:
+        """The first `limit` free windows of at least `duration` minutes.
+
+        Windows lie between `earliest` and `latest` on days from `first_day` to
+        `last_day`, and come in date and time order. Each is a maximal free
+        interval; courts free over the same interval share one window.
+        """
+        windows: list[FreeWindow] = []
+        for day, courts in self._free.items():
+            if day < first_day or day > last_day:
+                continue
+            spans: dict[tuple[int, int], list[int]] = {}
+            for court, intervals in enumerate(courts, start=1):
+                for free_start, free_end in intervals:
+                    start, end = max(free_start, earliest), min(free_end, latest)
+                    if end - start >= duration:
+                        spans.setdefault((start, end), []).append(court)
+            for (start, end), free in sorted(spans.items()):
+                windows.append(FreeWindow(day, start, end, tuple(free)))
+                if len(windows) >= limit:
+                    return windows
+        return windows
+
+    async def book(
+        self,
+        day: date,
+        start: int,
+        end: int,
+        reservation_name: str,
+        court: int = 0,
+        idempotency_key: str | None = None,
+    ) -> Booking:
+        """Books `court`, or the first free court if 0, for start..end.
+
+        A request repeating the idempotency key of an active booking gets that
+        booking back instead of a new one, also when the booking is only in the
+        store, made by another process or outside the days loaded at startup.
+        Raises BookingError if the court is closed or already booked then, or
+        if the key was used for a different booking.
+        """
+        async with self._lock:
+            booking = None
+            if idempotency_key:
+                booking = self._by_key.get(idempotency_key)
+                if booking is None and self.store is not None:
+                    booking = await self._stored(idempotency_key)
+            if booking is not None:
+                if (booking.day, booking.start, booking.end) != (day, start, end) or (
+                    court and court != booking.court
+                ):
+                    raise BookingError(
+                        "This idempotency key was already used for a different "
+                        "booking."
+                    )
+                return booking
+            booking = self._claim(day, start, end, reservation_name, court)
+            if self.store is not None:
+                try:
+                    await self.store.add(self._row(booking, idempotency_key))
+                except sqlite3.Error:
+                    logger.exception("Failed to save booking %s", booking.booking_id)
+                    self._release(booking)
+                    raise BookingError(
+                        "The booking could not be saved. Please try again."
+                    )
+            if idempotency_key:
+                self._by_key[idempotency_key] = booking
+                self._keys[booking.booking_id] = idempotency_key
+            return booking
+
+    async def cancel(self, booking_id: str) -> Booking:
+        """Cancels a booking, freeing its court; raises BookingError if unknown."""
+        async with self._lock:
+            booking = self._by_id.get(booking_id)
+            if booking is None:
+                raise BookingError(f"There is no booking with ID {booking_id}.")
+            if self.store is not None:
+                try:
+                    await self.store.cancel(booking_id)
+                except sqlite3.Error:
+                    logger.exception("Failed to cancel booking %s", booking_id)
+                    raise BookingError(
+                        "The booking could not be cancelled. Please try again."
+                    )
+            self._release(booking)
+            return booking
+
+    def booking(self, booking_id: str) -> Booking | None:
+        return self._by_id.get(booking_id)
+
+    async def _stored(self, idempotency_key: str) -> Booking | None:
+        """The store's booking for a key unknown here, indexed if it fits."""
+        try:
+            row = await self.store.find(idempotency_key)
+        except sqlite3.Error:
+            logger.exception("Failed to look up idempotency key")
+            raise BookingError("The booking could not be saved. Please try again.")
+        if row is None:
+            return None
+        booking_id, _, court, day, start, end, name = row
+        if self.is_open(day):
+            self._restore([row])
+        return self._by_id.get(booking_id) or Booking(
+            booking_id, court, day, start, end, name
+        )
+
+    def _restore(self, rows: list[tuple]):
+        for booking_id, key, court, day, start, end, name in rows:
+            try:
+                booking = self._claim(day, start, end, name, court, booking_id)
+            except BookingError as e:
+                logger.warning("Skipping stored booking %s: %s", booking_id, e)
+                continue
+            if key:
+                self._by_key[key] = booking
+                self._keys[booking_id] = key
+
+    @staticmethod
+    def _row(booking: Booking, idempotency_key: str | None) -> tuple:
+        return (
+            booking.booking_id,
+            idempotency_key or None,
+            booking.court,
+            booking.day,
+            booking.start,
+            booking.end,
+            booking.reservation_name,
+        )
+
+    def _claim(
+        self,
+        day: date,
+        start: int,
+        end: int,
+        reservation_name: str,
+        court: int,
+        booking_id: str | None = None,
+    ) -> Booking:
+        if not self.is_open(day):
+            raise BookingError(f"The court is not open on {day.isoformat()}.")
+        if not 0 <= start < end <= MINUTES_PER_DAY:
+            raise BookingError("Start time must be before end time.")
+        if start < self.opens or end > self.closes:
+            raise BookingError(
+                f"The court is open from {format_minutes(self.opens)} to "
+                f"{format_minutes(self.closes)}."
+            )
+        if court and not 1 <= court <= self.courts:
+            raise BookingError(f"There is no court {court}.")
+        free = self.free_courts(day, start, end)
+        if not free and not court and self.courts > 1:
+            raise BookingError(
+                f"No court is free from {format_minutes(start)} to "
+                f"{format_minutes(end)} on {day.isoformat()}."
+            )
+        if not free or (court and court not in free):
+            raise BookingError(self._conflict(day, start, end, court or 1))
+        court = court or free[0]
+        self._taken[day][court - 1] |= range_mask(start, end)
+        self._split_free(day, court, start, end)
+        booking = Booking(
+            booking_id or secrets.token_hex(6).upper(),
+            court,
+            day,
+            start,
+            end,
+            reservation_name,
+        )
+        self._bookings[day].append(booking)
+        self._by_id[booking.booking_id] = booking
+        return booking
+
+    def _release(self, booking: Booking):
+        """Undoes _claim for a booking."""
+        self._taken[booking.day][booking.court - 1] &= ~range_mask(
+            booking.start, booking.end
+        )
+        self._merge_free(booking.day, booking.court, booking.start, booking.end)
+        self._bookings[booking.day].remove(booking)
+        del self._by_id[booking.booking_id]
+        key = self._keys.pop(booking.booking_id, None)
+        if key is not None:
+            del self._by_key[key]
+
+    def _split_free(self, day: date, court: int, start: int, end: int):
+        """Removes start..end, known to be free, from the court's free intervals."""
+        intervals = self._free[day][court - 1]
+        index = bisect_right(intervals, (start, MINUTES_PER_DAY)) - 1
+        free_start, free_end = intervals[index]
+        intervals[index : index + 1] = [
+            (span_start, span_end)
+            for span_start, span_end in ((free_start, start), (end, free_end))
+            if span_start < span_end
+        ]
+
+    def _merge_free(self, day: date, court: int, start: int, end: int):
+        """Adds start..end back to the court's free intervals, joining neighbours."""
+        intervals = self._free[day][court - 1]
+        index = bisect_right(intervals, (start, MINUTES_PER_DAY))
+        if index and intervals[index - 1][1] == start:
+            index -= 1
+            start = intervals.pop(index)[0]
+        if index < len(intervals) and intervals[index][0] == end:
+            end = intervals.pop(index)[1]
+        intervals.insert(index, (start, end))
+
+    def _conflict(self, day: date, start: int, end: int, court: int) -> str:
+        where = f"Court {court}" if self.courts > 1 else "The court"
+        for booking in self.bookings(day):
+            if booking.court == court and booking.start < end and start < booking.end:
+                return (
+                    f"{where} is already booked from {booking.start_time} to "
+                    f"{booking.end_time} on {day.isoformat()} by "
+                    f"{booking.reservation_name}."
+                )
+        return f"{where} is not free from {format_minutes(start)} to {format_minutes(end)}."
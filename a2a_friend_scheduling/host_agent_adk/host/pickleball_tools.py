@@ -1,24 +1,16 @@
-from datetime import date, datetime, timedelta
-from typing import Dict
+from datetime import datetime
 
-# In-memory database for court schedules, mapping date to a dictionary of time slots and party names
-COURT_SCHEDULE: Dict[str, Dict[str, str]] = {}
+from google.adk.tools.tool_context import ToolContext
 
+from .common_slots import common_windows, parse_availability
+from .court_schedule import BookingError, CourtSchedule, format_minutes, parse_minutes
+from .reservation_store import RESERVATION_DB_PATH, ReservationStore
 
-def generate_court_schedule():
-    """Generates a schedule for the pickleball court for the next 7 days."""
-    global COURT_SCHEDULE
-    today = date.today()
-    possible_times = [f"{h:02}:00" for h in range(8, 21)]  # 8 AM to 8 PM
-
-    for i in range(7):
-        current_date = today + timedelta(days=i)
-        date_str = current_date.strftime("%Y-%m-%d")
-        COURT_SCHEDULE[date_str] = {time: "unknown" for time in possible_times}
-
-
-# Initialize the schedule when the module is loaded
-generate_court_schedule()
+# Court bookings for the next few days, indexed in memory and, unless
+# RESERVATION_DB_PATH is empty, kept in SQLite across restarts.
+COURT_SCHEDULE = CourtSchedule(
+    store=ReservationStore() if RESERVATION_DB_PATH else None
+)
 
 
 def list_court_availabilities(date: str) -> dict:
@@ -32,64 +24,191 @@ def list_court_availabilities(date: str) -> dict:
         A dictionary with the status and the detailed schedule for the day.
     """
     try:
-        datetime.strptime(date, "%Y-%m-%d")
+        day = datetime.strptime(date, "%Y-%m-%d").date()
     except ValueError:
         return {
             "status": "error",
             "message": "Invalid date format. Please use YYYY-MM-DD.",
         }
 
-    daily_schedule = COURT_SCHEDULE.get(date)
-    if not daily_schedule:
+    if not COURT_SCHEDULE.is_open(day):
         return {
             "status": "success",
             "message": f"The court is not open on {date}.",
             "schedule": {},
         }
 
-    available_slots = [
-        time for time, party in daily_schedule.items() if party == "unknown"
-    ]
-    booked_slots = {
-        time: party for time, party in daily_schedule.items() if party != "unknown"
+    return {
+        "status": "success",
+        "message": f"Schedule for {date}.",
+        "available_slots": COURT_SCHEDULE.free_slots(day),
+        "booked_slots": [booking.to_dict() for booking in COURT_SCHEDULE.bookings(day)],
     }
 
+
+def find_court_windows(
+    start_date: str,
+    end_date: str,
+    duration: int = 60,
+    earliest: str = "08:00",
+    latest: str = "21:00",
+    limit: int = 10,
+) -> dict:
+    """
+    Finds free pickleball court windows across a date range in one call.
+
+    Args:
+        start_date: The first date to search, in YYYY-MM-DD format.
+        end_date: The last date to search, in YYYY-MM-DD format.
+        duration: The minimum length of a window, in minutes.
+        earliest: The earliest start time to consider, in HH:MM format.
+        latest: The latest end time to consider, in HH:MM format.
+        limit: The maximum number of windows to return.
+
+    Returns:
+        A dictionary with the free windows in date and time order. Each window
+        is a continuous free period on the listed courts; any booking of
+        `duration` minutes inside it is possible.
+    """
+    try:
+        first_day = datetime.strptime(start_date, "%Y-%m-%d").date()
+        last_day = datetime.strptime(end_date, "%Y-%m-%d").date()
+        earliest_minute = parse_minutes(earliest)
+        latest_minute = parse_minutes(latest)
+    except ValueError:
+        return {
+            "status": "error",
+            "message": "Invalid date or time format. Please use YYYY-MM-DD and HH:MM.",
+        }
+
+    if first_day > last_day:
+        return {
+            "status": "error",
+            "message": "Invalid date range. The start date cannot be after the end date.",
+        }
+
+    if duration <= 0 or limit <= 0:
+        return {
+            "status": "error",
+            "message": "The duration and limit must be positive.",
+        }
+
+    windows = COURT_SCHEDULE.free_windows(
+        first_day, last_day, duration, earliest_minute, latest_minute, limit
+    )
     return {
         "status": "success",
-        "message": f"Schedule for {date}.",
-        "available_slots": available_slots,
-        "booked_slots": booked_slots,
+        "message": (
+            f"Found {len(windows)} free window(s) of at least {duration} minutes "
+            f"between {format_minutes(earliest_minute)} and "
+            f"{format_minutes(latest_minute)} from {start_date} to {end_date}."
+        ),
+        "windows": [window.to_dict() for window in windows],
     }
 
 
-def book_pickleball_court(
-    date: str, start_time: str, end_time: str, reservation_name: str
+def find_common_slots(
+    availability: list[str],
+    duration: int = 60,
+    required: int = 0,
+    limit: int = 5,
+) -> dict:
+    """
+    Finds times when the friends are free and a pickleball court is too, in one call.
+
+    Args:
+        availability: One entry per friend: the friend's name, a colon, then
+            the dates and times they are free, such as
+            "Nate: 2026-10-20 08:00, 9 AM, 6-8 PM; 2026-10-21 10:00".
+            A single time is a one-hour slot starting then. A friend's reply
+            can follow their name as it is.
+        duration: The length of the game, in minutes.
+        required: The minimum number of friends who must be free, or 0 for all
+            of them.
+        limit: The maximum number of windows to return.
+
+    Returns:
+        A dictionary with the windows, best first: those with more friends
+        free, then earlier ones. Each window is a continuous period in which
+        the friends listed as available and the listed courts are all free;
+        any game of `duration` minutes inside it is possible. "skipped" lists
+        the entries or times that could not be read, such as a time given
+        without a date; ask those friends again if it matters.
+    """
+    if not availability:
+        return {
+            "status": "error",
+            "message": "Please give the availability of at least one friend.",
+        }
+
+    if duration <= 0 or limit <= 0:
+        return {
+            "status": "error",
+            "message": "The duration and limit must be positive.",
+        }
+
+    friend_slots, skipped = parse_availability(availability)
+    if not friend_slots:
+        return {
+            "status": "error",
+            "message": "None of the availability entries names a friend.",
+            "skipped": skipped,
+        }
+
+    windows = common_windows(friend_slots, COURT_SCHEDULE, duration, required, limit)
+    wanted = f"at least {required}" if 0 < required < len(friend_slots) else "all"
+    return {
+        "status": "success",
+        "message": (
+            f"Found {len(windows)} window(s) of at least {duration} minutes with "
+            f"{wanted} of {len(friend_slots)} friends and a court free."
+        ),
+        "windows": [window.to_dict() for window in windows],
+        "skipped": skipped,
+    }
+
+
+async def book_pickleball_court(
+    date: str,
+    start_time: str,
+    end_time: str,
+    reservation_name: str,
+    tool_context: ToolContext,
+    court: int = 0,
+    idempotency_key: str = "",
 ) -> dict:
     """
     Books a pickleball court for a given date and time range under a reservation name.
 
+    Retrying the same booking is safe: within one request, or with the same
+    idempotency key, it returns the existing booking instead of a new one.
+
     Args:
         date: The date of the reservation, in YYYY-MM-DD format.
         start_time: The start time of the reservation, in HH:MM format.
         end_time: The end time of the reservation, in HH:MM format.
         reservation_name: The name for the reservation.
+        court: The court number to book, or 0 for the first free court.
+        idempotency_key: Optional key identifying this booking request.
 
     Returns:
-        A dictionary confirming the booking or providing an error.
+        A dictionary confirming the booking, with its booking ID, or providing
+        an error.
     """
     try:
-        start_dt = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-        end_dt = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+        start = parse_minutes(start_time)
+        end = parse_minutes(end_time)
     except ValueError:
         return {
             "status": "error",
             "message": "Invalid date or time format. Please use YYYY-MM-DD and HH:MM.",
         }
 
-    if start_dt >= end_dt:
+    if start >= end:
         return {"status": "error", "message": "Start time must be before end time."}
 
-    if date not in COURT_SCHEDULE:
+    if not COURT_SCHEDULE.is_open(day):
         return {"status": "error", "message": f"The court is not open on {date}."}
 
     if not reservation_name:
@@ -98,25 +217,48 @@ def book_pickleball_court(
             "message": "Cannot book a court without a reservation name.",
         }
 
-    required_slots = []
-    current_time = start_dt
-    while current_time < end_dt:
-        required_slots.append(current_time.strftime("%H:%M"))
-        current_time += timedelta(hours=1)
+    # Without an explicit key, a repeat of the same call while answering the
+    # same user message is the model retrying, not a second booking.
+    key = idempotency_key or (
+        f"{tool_context.invocation_id}/{date}/{start_time}/{end_time}/"
+        f"{reservation_name}/{court}"
+    )
+    try:
+        booking = await COURT_SCHEDULE.book(
+            day, start, end, reservation_name, court, idempotency_key=key
+        )
+    except BookingError as e:
+        return {"status": "error", "message": str(e)}
+
+    booked = (
+        f"Court {booking.court}"
+        if COURT_SCHEDULE.courts > 1
+        else "The pickleball court"
+    )
+    return {
+        "status": "success",
+        "message": f"Success! {booked} has been booked for {reservation_name} from {booking.start_time} to {booking.end_time} on {date}. The booking ID is {booking.booking_id}.",
+        "booking": booking.to_dict(),
+    }
+
+
+async def cancel_pickleball_booking(booking_id: str) -> dict:
+    """
+    Cancels a pickleball court booking, freeing its time slot.
 
-    daily_schedule = COURT_SCHEDULE.get(date, {})
-    for slot in required_slots:
-        if daily_schedule.get(slot, "booked") != "unknown":
-            party = daily_schedule.get(slot)
-            return {
-                "status": "error",
-                "message": f"The time slot {slot} on {date} is already booked by {party}.",
-            }
+    Args:
+        booking_id: The booking ID returned when the court was booked.
 
-    for slot in required_slots:
-        COURT_SCHEDULE[date][slot] = reservation_name
+    Returns:
+        A dictionary confirming the cancellation or providing an error.
+    """
+    try:
+        booking = await COURT_SCHEDULE.cancel(booking_id.strip().upper())
+    except BookingError as e:
+        return {"status": "error", "message": str(e)}
 
     return {
         "status": "success",
-        "message": f"Success! The pickleball court has been booked for {reservation_name} from {start_time} to {end_time} on {date}.",
+        "message": f"Booking {booking.booking_id} for {booking.reservation_name} from {booking.start_time} to {booking.end_time} on {booking.day.isoformat()} has been cancelled.",
+        "booking": booking.to_dict(),
     }
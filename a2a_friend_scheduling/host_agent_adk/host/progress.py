@@ -0,0 +1,125 @@
+"""Typed progress events for HostAgent.stream, deduplicated and debounced."""
+
+import os
+import time
+from typing import Any
+
+# Chatty events from one source are sent at most once per interval, in seconds.
+PROGRESS_INTERVAL = float(os.getenv("PROGRESS_INTERVAL", "0.25"))
+
+# Event types; the text of each event is in "updates", as before.
+THINKING = "thinking"
+PLANNING = "planning"
+AGENT_CALL = "agent_call"
+AGENT_RESULT = "agent_result"
+AGENT_PROGRESS = "agent_progress"
+
+# Only these may be held back; calls and results are always sent at once.
+_DEBOUNCED = frozenset({THINKING, AGENT_PROGRESS})
+
+
+def progress_event(
+    kind: str, text: str, agent: str | None = None, **fields: Any
+) -> dict[str, Any]:
+    """A progress frame, e.g. progress_event(AGENT_CALL, "Calling X...", "X")."""
+    event = {"is_task_complete": False, "type": kind, "updates": text}
+    if agent:
+        event["agent"] = agent
+    event.update(fields)
+    return event
+
+
+def agent_result_event(
+    agent: str, status: str, started: float, cached: bool = False
+) -> dict[str, Any]:
+    """Reports how one remote call ended and how long it took."""
+    elapsed_ms = round((time.perf_counter() - started) * 1000)
+    if cached:
+        text = f"{agent} answered from cache"
+    elif status == "success":
+        text = f"{agent} returned in {elapsed_ms} ms"
+    else:
+        text = f"{agent} failed ({status}) after {elapsed_ms} ms"
+    return progress_event(
+        AGENT_RESULT,
+        text,
+        agent,
+        status=status,
+        elapsed_ms=elapsed_ms,
+        cached=cached,
+    )
+
+
+class ProgressCoalescer:
+    """Decides which progress events of one stream reach the client.
+
+    An event repeating the last one sent is dropped. Thinking and relayed agent
+    progress events arriving within `interval` of the last one sent from the
+    same source are held, and only the newest held event per source is sent
+    once its window has passed, unless a newer event made it stale first.
+    """
+
+    def __init__(self, interval: float = PROGRESS_INTERVAL):
+        self.interval = interval
+        self._sent_at: dict[tuple[str, str], float] = {}
+        self._held: dict[tuple[str, str], dict[str, Any]] = {}
+        self._last_text: str | None = None
+        self.suppressed = 0
+
+    def offer(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        """Returns the events to send now, which may include `event`."""
+        now = time.monotonic()
+        ready = self.due(now)
+        key = (event.get("type", ""), event.get("agent", ""))
+        if event.get("type") in _DEBOUNCED:
+            if now - self._sent_at.get(key, float("-inf")) < self.interval:
+                if key in self._held:
+                    self.suppressed += 1
+                self._held[key] = event
+                return ready
+        else:
+            # A call or result makes the held events of its agent stale.
+            if self._held.pop((AGENT_PROGRESS, key[1]), None) is not None:
+                self.suppressed += 1
+        return ready + self._send([(key, event)], now)
+
+    def due(self, now: float | None = None) -> list[dict[str, Any]]:
+        """Returns the held events whose window has passed."""
+        now = time.monotonic() if now is None else now
+        expired = [
+            (key, event)
+            for key, event in self._held.items()
+            if now - self._sent_at.get(key, float("-inf")) >= self.interval
+        ]
+        for key, _ in expired:
+            del self._held[key]
+        return self._send(expired, now)
+
+    def wait_time(self) -> float | None:
+        """Seconds until the next held event is due, or None if none is held."""
+        if not self._held:
+            return None
+        now = time.monotonic()
+        return max(
+            0.0,
+            min(self._sent_at[key] + self.interval - now for key in self._held),
+        )
+
+    def discard(self):
+        """Drops the held events, e.g. once the final answer is in."""
+        self.suppressed += len(self._held)
+        self._held.clear()
+
+    def _send(self, events, now: float) -> list[dict[str, Any]]:
+        sent = []
+        for key, event in events:
+            if event["updates"] == self._last_text:
+                self.suppressed += 1
+                continue
+            self._sent_at[key] = now
+            self._last_text = event["updates"]
+            sent.append(event)
+            # "Thinking" says nothing new once anything else has been sent.
+            if key[0] != THINKING and self._held.pop((THINKING, ""), None):
+                self.suppressed += 1
+        return sent
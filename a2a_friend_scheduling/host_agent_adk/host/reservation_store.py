@@ -0,0 +1,157 @@
+"""Court reservations persisted to SQLite, so bookings survive a restart."""
+
+import asyncio
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+# An empty path keeps reservations in memory only. The file is created with the
+# first booking, so importing the host leaves no file behind.
+RESERVATION_DB_PATH = os.getenv(
+    "RESERVATION_DB_PATH", str(Path(__file__).resolve().parent / "reservations.db")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    booking_id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    court INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    start_minute INTEGER NOT NULL,
+    end_minute INTEGER NOT NULL,
+    reservation_name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    cancelled_at REAL
+);
+CREATE INDEX IF NOT EXISTS reservations_by_day ON reservations (day);
+"""
+_COLUMNS = (
+    "booking_id, idempotency_key, court, day, start_minute, end_minute, "
+    "reservation_name"
+)
+
+
+class ReservationStore:
+    """Reservations in one SQLite file in WAL mode.
+
+    Every write is committed before it returns. The store is the record;
+    CourtSchedule keeps the in-memory index that availability checks use and
+    rebuilds it from load() on startup. Cancelling a reservation releases its
+    idempotency key.
+    """
+
+    def __init__(self, db_path: str = RESERVATION_DB_PATH):
+        self.db_path = db_path
+        # The connection is only ever used from this thread.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="reservation-db"
+        )
+        self._db: sqlite3.Connection | None = None
+
+    def load(self, first_day: date, last_day: date) -> list[tuple]:
+        """Active reservations between two days, oldest first.
+
+        Rows are (booking_id, idempotency_key, court, day, start_minute,
+        end_minute, reservation_name). Called once at startup, before the event
+        loop serves requests, so it blocks.
+        """
+        return self._executor.submit(self._load, first_day, last_day).result()
+
+    async def find(self, idempotency_key: str) -> tuple | None:
+        """The active reservation saved with an idempotency key, as load() rows."""
+        return await self._run(self._find, idempotency_key)
+
+    async def add(self, row: tuple) -> None:
+        """Saves a reservation row in the layout load() returns."""
+        await self._run(self._add, row)
+
+    async def cancel(self, booking_id: str) -> None:
+        await self._run(self._cancel, booking_id)
+
+    def close(self):
+        self._executor.submit(self._close).result()
+        self._executor.shutdown()
+
+    async def _run(self, fn: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+    def _existing(self) -> sqlite3.Connection | None:
+        """The connection, or None while nothing has been saved yet."""
+        if self._db is None and not os.path.exists(self.db_path):
+            return None
+        return self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _load(self, first_day: date, last_day: date) -> list[tuple]:
+        db = self._existing()
+        if db is None:
+            return []
+        rows = db.execute(
+            f"SELECT {_COLUMNS} FROM reservations "
+            "WHERE cancelled_at IS NULL AND day BETWEEN ? AND ? "
+            "ORDER BY created_at",
+            (first_day.isoformat(), last_day.isoformat()),
+        )
+        return [_row(row) for row in rows]
+
+    def _find(self, idempotency_key: str) -> tuple | None:
+        db = self._existing()
+        if db is None:
+            return None
+        # Cancelling clears the key, so only active reservations have one.
+        row = db.execute(
+            f"SELECT {_COLUMNS} FROM reservations WHERE idempotency_key = ?",
+            (idempotency_key,),
+        ).fetchone()
+        return _row(row) if row else None
+
+    def _add(self, row: tuple):
+        booking_id, key, court, day, start, end, name = row
+        db = self._connect()
+        with db:
+            db.execute(
+                "INSERT INTO reservations VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (
+                    booking_id,
+                    key,
+                    court,
+                    day.isoformat(),
+                    start,
+                    end,
+                    name,
+                    time.time(),
+                ),
+            )
+
+    def _cancel(self, booking_id: str):
+        db = self._connect()
+        with db:
+            db.execute(
+                "UPDATE reservations SET cancelled_at = ?, idempotency_key = NULL "
+                "WHERE booking_id = ?",
+                (time.time(), booking_id),
+            )
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def _row(row: tuple) -> tuple:
+    booking_id, key, court, day, start, end, name = row
+    return booking_id, key, court, date.fromisoformat(day), start, end, name
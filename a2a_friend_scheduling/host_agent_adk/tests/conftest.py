@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# The host is the `host` package in this directory, as when run with `adk web`.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Keep reservations in memory unless a test passes a store, and the model offline.
+os.environ.setdefault("RESERVATION_DB_PATH", "")
+os.environ.setdefault("A2A_MOCK_LLM", "true")
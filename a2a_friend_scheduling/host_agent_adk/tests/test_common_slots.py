@@ -0,0 +1,79 @@
+from datetime import date
+
+from host import pickleball_tools
+from host.common_slots import _runs, parse_availability
+from host.court_schedule import CourtSchedule, format_minutes
+
+DAY = date(2030, 6, 3)
+
+# Replies as the friend agents word them, relayed by their models.
+REPLIES = [
+    (
+        "Karley: On 2030-06-03, Karley is available at: 08:00, 09:00, 18:00. "
+        "Karley is not available on 2030-06-04."
+    ),
+    (
+        "Nate: Sure! I'm free tomorrow at 9 AM. On 2030-06-03 I can do 8 AM, "
+        "10:30 am and 6-8 PM, and on 2030-06-04 from 11 to 1 PM."
+    ),
+    (
+        "Kaitlynn: 7pm could work. On 2030-06-03, Kaitlyn is available at: "
+        "12 p.m., 25:00 and 18:00-17:00."
+    ),
+]
+
+
+def _times(days: dict[date, int]) -> dict[str, list[str]]:
+    return {
+        day.isoformat(): [
+            f"{format_minutes(start)}-{format_minutes(end)}"
+            for start, end in _runs(mask)
+        ]
+        for day, mask in days.items()
+    }
+
+
+def test_realistic_replies_are_read_per_friend():
+    availability, skipped = parse_availability(REPLIES)
+
+    assert _times(availability["Karley"]) == {
+        "2030-06-03": ["08:00-10:00", "18:00-19:00"]
+    }
+    assert _times(availability["Nate"]) == {
+        "2030-06-03": ["08:00-09:00", "10:30-11:30", "18:00-20:00"],
+        "2030-06-04": ["11:00-13:00"],
+    }
+    assert _times(availability["Kaitlynn"]) == {"2030-06-03": ["12:00-13:00"]}
+    assert skipped == [
+        "Nate: 9 AM comes before any date",
+        "Kaitlynn: 7pm comes before any date",
+        "Kaitlynn: Invalid time: '25:00'",
+        "Kaitlynn: Empty time range 18:00-17:00",
+    ]
+
+
+def test_numbers_that_are_not_times_are_ignored():
+    availability, skipped = parse_availability(
+        ["Nate: On 2030-06-03 I have 2 kids and 1 court booked, free at 18:00."]
+    )
+
+    assert _times(availability["Nate"]) == {"2030-06-03": ["18:00-19:00"]}
+    assert skipped == []
+
+
+def test_a_bad_entry_does_not_fail_the_other_friends(monkeypatch):
+    monkeypatch.setattr(
+        pickleball_tools, "COURT_SCHEDULE", CourtSchedule(first_day=DAY)
+    )
+
+    result = pickleball_tools.find_common_slots(
+        ["2030-06-03 08:00", *REPLIES[:2]], required=2
+    )
+
+    assert result["status"] == "success"
+    assert result["windows"][0]["available"] == ["Karley", "Nate"]
+    assert result["windows"][0]["start_time"] == "08:00"
+    assert result["skipped"] == [
+        "Expected 'Name: dates and times', got '2030-06-03 08:00'",
+        "Nate: 9 AM comes before any date",
+    ]
@@ -0,0 +1,269 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from host import pickleball_tools
+from host.court_schedule import (
+    CLOSES,
+    OPENS,
+    BookingError,
+    CourtSchedule,
+    range_mask,
+)
+from host.reservation_store import ReservationStore
+
+DAY = date(2030, 6, 3)
+NINE, TEN, ELEVEN = 9 * 60, 10 * 60, 11 * 60
+
+
+def _schedule(store: ReservationStore | None = None, courts: int = 1) -> CourtSchedule:
+    return CourtSchedule(courts=courts, days=7, first_day=DAY, store=store)
+
+
+def test_range_mask_sets_one_bit_per_minute():
+    assert range_mask(2, 5) == 0b11100
+
+
+def test_a_booking_takes_its_minutes_on_one_court_only():
+    async def book():
+        schedule = _schedule(courts=2)
+        booking = await schedule.book(DAY, NINE, TEN, "Karley")
+        return schedule, booking
+
+    schedule, booking = asyncio.run(book())
+
+    assert booking.court == 1
+    assert schedule.free_courts(DAY, NINE, TEN) == [2]
+    assert schedule.free_courts(DAY, NINE - 30, NINE) == [1, 2]
+    assert schedule.free_courts(DAY, TEN - 1, TEN + 1) == [2]
+
+
+def test_each_court_is_booked_before_a_slot_is_full():
+    async def book_three():
+        schedule = _schedule(courts=2)
+        first = await schedule.book(DAY, NINE, TEN, "Karley")
+        second = await schedule.book(DAY, NINE, TEN, "Nate")
+        with pytest.raises(BookingError, match="No court is free"):
+            await schedule.book(DAY, NINE, TEN, "Kaitlynn")
+        with pytest.raises(BookingError, match="Court 2 is already booked"):
+            await schedule.book(DAY, NINE + 30, TEN + 30, "Kaitlynn", court=2)
+        return schedule, first, second
+
+    schedule, first, second = asyncio.run(book_three())
+
+    assert (first.court, second.court) == (1, 2)
+    assert "09:00" not in schedule.free_slots(DAY)
+    assert schedule.free_mask(DAY) & range_mask(NINE, TEN) == 0
+
+
+def test_free_slots_and_mask_follow_opening_hours():
+    async def book():
+        schedule = _schedule()
+        await schedule.book(DAY, TEN, ELEVEN, "Karley")
+        return schedule
+
+    schedule = asyncio.run(book())
+    slots = schedule.free_slots(DAY)
+
+    assert slots[0] == "08:00" and slots[-1] == "20:00"
+    assert "10:00" not in slots and len(slots) == 12
+    assert schedule.free_mask(DAY) == range_mask(OPENS, TEN) | range_mask(
+        ELEVEN, CLOSES
+    )
+    assert schedule.free_mask(DAY + timedelta(days=30)) == 0
+
+
+@pytest.mark.parametrize(
+    "start, end, court, error",
+    [
+        (OPENS - 60, OPENS, 0, "open from 08:00 to 21:00"),
+        (TEN, NINE, 0, "before end time"),
+        (NINE, TEN, 3, "no court 3"),
+    ],
+)
+def test_invalid_bookings_are_rejected(start, end, court, error):
+    with pytest.raises(BookingError, match=error):
+        asyncio.run(_schedule(courts=2).book(DAY, start, end, "Karley", court))
+
+
+def test_an_overlapping_booking_is_rejected():
+    async def book_twice():
+        schedule = _schedule()
+        await schedule.book(DAY, NINE, TEN, "Karley")
+        with pytest.raises(BookingError):
+            await schedule.book(DAY, NINE + 30, TEN + 30, "Nate")
+        return schedule.bookings(DAY)
+
+    assert [booking.reservation_name for booking in asyncio.run(book_twice())] == [
+        "Karley"
+    ]
+
+
+def test_a_retry_with_the_same_key_returns_the_same_booking():
+    async def book_twice():
+        schedule = _schedule()
+        first = await schedule.book(DAY, NINE, TEN, "Karley", idempotency_key="k1")
+        again = await schedule.book(DAY, NINE, TEN, "Karley", idempotency_key="k1")
+        with pytest.raises(BookingError, match="different booking"):
+            await schedule.book(DAY, TEN, ELEVEN, "Karley", idempotency_key="k1")
+        return first, again, schedule.bookings(DAY)
+
+    first, again, bookings = asyncio.run(book_twice())
+    assert again == first
+    assert bookings == [first]
+
+
+def test_cancelling_frees_the_interval():
+    async def book_cancel_book():
+        schedule = _schedule()
+        booking = await schedule.book(DAY, NINE, TEN, "Karley")
+        await schedule.cancel(booking.booking_id)
+        return await schedule.book(DAY, NINE, TEN, "Nate")
+
+    assert asyncio.run(book_cancel_book()).reservation_name == "Nate"
+
+
+def test_bookings_survive_a_restart(tmp_path):
+    db_path = str(tmp_path / "reservations.db")
+
+    async def book(store: ReservationStore):
+        schedule = _schedule(store)
+        kept = await schedule.book(DAY, NINE, TEN, "Karley", idempotency_key="k1")
+        cancelled = await schedule.book(DAY, TEN, ELEVEN, "Nate")
+        await schedule.cancel(cancelled.booking_id)
+        return kept
+
+    store = ReservationStore(db_path)
+    kept = asyncio.run(book(store))
+    store.close()
+
+    async def after_restart(store: ReservationStore):
+        schedule = _schedule(store)
+        with pytest.raises(BookingError):
+            await schedule.book(DAY, NINE, TEN, "Nate")
+        retried = await schedule.book(DAY, NINE, TEN, "Karley", idempotency_key="k1")
+        freed = await schedule.book(DAY, TEN, ELEVEN, "Nate")
+        return retried, freed
+
+    store = ReservationStore(db_path)
+    retried, freed = asyncio.run(after_restart(store))
+    store.close()
+    assert retried == kept
+    assert freed.start == TEN
+
+
+def test_a_key_saved_outside_the_loaded_days_returns_its_booking(tmp_path):
+    db_path = str(tmp_path / "reservations.db")
+
+    async def book(schedule: CourtSchedule):
+        return await schedule.book(DAY, NINE, TEN, "Karley", idempotency_key="k1")
+
+    store = ReservationStore(db_path)
+    booked = asyncio.run(book(_schedule(store)))
+    store.close()
+
+    # A day later the booking's day is no longer loaded, but its key is kept.
+    store = ReservationStore(db_path)
+    later = CourtSchedule(courts=1, days=7, first_day=DAY + timedelta(days=1))
+    later.store = store
+    with pytest.raises(BookingError, match="not open"):
+        asyncio.run(later.book(DAY, NINE, TEN, "Karley"))
+    assert asyncio.run(book(later)) == booked
+    store.close()
+
+
+def test_the_store_creates_its_file_with_the_first_booking(tmp_path):
+    db_path = tmp_path / "reservations.db"
+    store = ReservationStore(str(db_path))
+    schedule = _schedule(store)
+    assert not db_path.exists()
+
+    asyncio.run(schedule.book(DAY, NINE, TEN, "Karley"))
+    store.close()
+    assert db_path.exists()
+
+
+def _spans(windows) -> list[tuple]:
+    return [(w.day.day, w.start // 60, w.end // 60, w.courts) for w in windows]
+
+
+def test_free_windows_skip_bookings_and_group_courts():
+    async def book():
+        schedule = _schedule(courts=2)
+        await schedule.book(DAY, TEN, ELEVEN, "Karley", court=1)
+        await schedule.book(DAY + timedelta(days=1), OPENS, CLOSES, "Nate", court=2)
+        return schedule
+
+    schedule = asyncio.run(book())
+    windows = schedule.free_windows(DAY, DAY + timedelta(days=1), 60)
+
+    assert _spans(windows) == [
+        (3, 8, 10, (1,)),
+        (3, 8, 21, (2,)),
+        (3, 11, 21, (1,)),
+        (4, 8, 21, (1,)),
+    ]
+
+
+def test_free_windows_are_clipped_filtered_and_limited():
+    async def book():
+        schedule = _schedule()
+        await schedule.book(DAY, TEN, ELEVEN, "Karley")
+        return schedule
+
+    schedule = asyncio.run(book())
+    last_day = DAY + timedelta(days=6)
+
+    # 09:00-10:00 is too short for 90 minutes once clipped to 09:00.
+    assert _spans(schedule.free_windows(DAY, DAY, 90, NINE, 18 * 60)) == [
+        (3, 11, 18, (1,))
+    ]
+    assert len(schedule.free_windows(DAY, last_day, 60, limit=3)) == 3
+
+
+def test_cancelling_joins_the_free_window_again():
+    async def book_and_cancel():
+        schedule = _schedule()
+        booking = await schedule.book(DAY, TEN, ELEVEN, "Karley")
+        await schedule.cancel(booking.booking_id)
+        return schedule
+
+    schedule = asyncio.run(book_and_cancel())
+
+    assert _spans(schedule.free_windows(DAY, DAY, 60)) == [(3, 8, 21, (1,))]
+
+
+def test_the_window_tool_formats_the_free_windows(monkeypatch):
+    monkeypatch.setattr(pickleball_tools, "COURT_SCHEDULE", _schedule(courts=2))
+
+    result = pickleball_tools.find_court_windows(
+        "2030-06-03", "2030-06-03", 60, "18:00", "21:00"
+    )
+
+    assert result["status"] == "success"
+    assert result["windows"] == [
+        {
+            "date": "2030-06-03",
+            "start_time": "18:00",
+            "end_time": "21:00",
+            "courts": [1, 2],
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "arguments, error",
+    [
+        (("2030-06-03", "2030-06-33"), "Invalid date or time"),
+        (("2030-06-03", "2030-06-03", 60, "8 AM"), "Invalid date or time"),
+        (("2030-06-04", "2030-06-03"), "Invalid date range"),
+        (("2030-06-03", "2030-06-03", 0), "must be positive"),
+    ],
+)
+def test_the_window_tool_rejects_bad_arguments(monkeypatch, arguments, error):
+    monkeypatch.setattr(pickleball_tools, "COURT_SCHEDULE", _schedule())
+
+    result = pickleball_tools.find_court_windows(*arguments)
+
+    assert result["status"] == "error"
+    assert error in result["message"]
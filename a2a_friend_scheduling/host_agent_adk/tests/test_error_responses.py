@@ -0,0 +1,48 @@
+import asyncio
+from types import SimpleNamespace
+
+from host.agent import HostAgent
+
+ERROR = [{"text": "Error: Received an error response from Karley_Agent."}]
+
+
+def _host(answer: list[dict]) -> HostAgent:
+    host = HostAgent()
+    host.remote_agent_connections["Karley_Agent"] = object()
+
+    async def send(agent_name, task, state, client=None):
+        return answer
+
+    host._send_task_unbounded = send
+    return host
+
+
+def test_an_error_reply_counts_as_a_failure():
+    host = _host(ERROR)
+
+    response = asyncio.run(host._send_task("Karley_Agent", "Free on Friday?", {}))
+
+    assert response == ERROR
+    assert host.circuit_breakers["Karley_Agent"].stats()["error_rate"] == 1.0
+
+
+def test_an_answer_counts_as_a_success():
+    host = _host([{"text": "Karley is free at 18:00."}])
+
+    asyncio.run(host._send_task("Karley_Agent", "Free on Friday?", {}))
+
+    assert host.circuit_breakers["Karley_Agent"].stats()["error_rate"] == 0.0
+
+
+def test_a_failed_stream_returns_an_error_reply():
+    class Client:
+        async def send_message_streaming(self, request):
+            yield SimpleNamespace(root=None)
+
+    payload = {"message": {"role": "user", "parts": [], "messageId": "m1"}}
+
+    response = asyncio.run(
+        HostAgent()._stream_task("Karley_Agent", Client(), "m1", payload)
+    )
+
+    assert response == ERROR
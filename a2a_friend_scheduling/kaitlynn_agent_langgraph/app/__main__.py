@@ -2,18 +2,8 @@ import logging
 import os
 import sys
 
-import httpx
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from app.agent import KaitlynAgent
-from app.agent_executor import KaitlynAgentExecutor
+from app.server import HOST, MOCK_LLM, PORT, WORKERS, create_app
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,42 +18,22 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Starts Kaitlyn's Agent server."""
-    host = "localhost"
-    port = 10004
     try:
-        if not os.getenv("GOOGLE_API_KEY"):
+        # The mock model needs no key.
+        if not os.getenv("GOOGLE_API_KEY") and not MOCK_LLM:
             raise MissingAPIKeyError("GOOGLE_API_KEY environment variable not set.")
 
-        capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
-        skill = AgentSkill(
-            id="schedule_pickleball",
-            name="Pickleball Scheduling Tool",
-            description="Helps with finding Kaitlyn's availability for pickleball",
-            tags=["scheduling", "pickleball"],
-            examples=["Are you free to play pickleball on Saturday?"],
-        )
-        agent_card = AgentCard(
-            name="Kaitlynn Agent",
-            description="Helps with scheduling pickleball games",
-            url=f"http://{host}:{port}/",
-            version="1.0.0",
-            defaultInputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
-            defaultOutputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        httpx_client = httpx.AsyncClient()
-        request_handler = DefaultRequestHandler(
-            agent_executor=KaitlynAgentExecutor(),
-            task_store=InMemoryTaskStore(),
-            push_notifier=InMemoryPushNotifier(httpx_client),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Worker processes build their own app from the importable factory.
+            uvicorn.run(
+                "app.server:create_app",
+                factory=True,
+                host=HOST,
+                port=PORT,
+                workers=WORKERS,
+            )
+        else:
+            uvicorn.run(create_app(), host=HOST, port=PORT)
 
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
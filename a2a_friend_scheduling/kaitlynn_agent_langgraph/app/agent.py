@@ -1,8 +1,10 @@
+import os
 import random
 from collections.abc import AsyncIterable
 from datetime import date, datetime, timedelta
 from typing import Any, List, Literal
 
+from app.mock_llm import MOCK_LLM, MockChatModel
 from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
@@ -11,13 +13,36 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field
 
-memory = MemorySaver()
+# Conversations are checkpointed to SQLite when a path is configured, so every
+# worker process of a multi-worker server sees the same threads.
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH") or (
+    "checkpoints.db" if int(os.getenv("WORKERS", "1")) > 1 else None
+)
+
+
+def create_checkpointer():
+    """Returns the graph checkpointer: SQLite if configured, else in memory."""
+    if not CHECKPOINT_DB_PATH:
+        return MemorySaver()
+    import sqlite3
+
+    # Optional dependency, only needed for a shared checkpoint database.
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    conn = sqlite3.connect(CHECKPOINT_DB_PATH, check_same_thread=False, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return SqliteSaver(conn)
+
+
+memory = create_checkpointer()
 
 
 def generate_kaitlyns_calendar() -> dict[str, list[str]]:
     """Generates Kaitlyn's calendar for the next 7 days."""
     calendar = {}
     today = date.today()
+    # Seeded by the day, so every worker process hands out the same calendar.
+    rng = random.Random(f"kaitlynn-{today.isoformat()}")
     # Kaitlyn's availability: evenings on weekdays, more free on weekends.
     for i in range(7):
         current_date = today + timedelta(days=i)
@@ -26,14 +51,10 @@ def generate_kaitlyns_calendar() -> dict[str, list[str]]:
 
         if day_of_week < 5:  # Weekday
             possible_times = [f"{h:02}:00" for h in range(18, 22)]  # 6 PM to 10 PM
-            available_slots = sorted(
-                random.sample(possible_times, random.randint(2, 3))
-            )
+            available_slots = sorted(rng.sample(possible_times, rng.randint(2, 3)))
         else:  # Weekend
             possible_times = [f"{h:02}:00" for h in range(10, 20)]  # 10 AM to 8 PM
-            available_slots = sorted(
-                random.sample(possible_times, random.randint(4, 6))
-            )
+            available_slots = sorted(rng.sample(possible_times, rng.randint(4, 6)))
 
         calendar[date_str] = available_slots
     return calendar
@@ -118,7 +139,11 @@ class KaitlynAgent:
     )
 
     def __init__(self):
-        self.model = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+        self.model = (
+            MockChatModel()
+            if MOCK_LLM
+            else ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+        )
         self.tools = [get_availability]
 
         self.graph = create_react_agent(
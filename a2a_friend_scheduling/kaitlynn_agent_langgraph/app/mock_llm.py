@@ -0,0 +1,134 @@
+"""Deterministic stand-in for Gemini, for offline benchmarks and tests.
+
+Enabled with A2A_MOCK_LLM=true. The mock plays the model's part of the ReAct
+graph: for a question it calls the agent's tool with the dates asked about (the
+next seven days if it names none), after the tool answers it replies with the
+tool's output, and when asked for the structured response it reports that
+answer as completed.
+
+A2A_MOCK_LLM_LATENCY sets the time to the first token and
+A2A_MOCK_LLM_TOKEN_DELAY the time per generated word, both in seconds.
+"""
+
+import os
+import re
+import time
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Any
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+MOCK_LLM_LATENCY = float(os.getenv("A2A_MOCK_LLM_LATENCY", "0"))
+MOCK_LLM_TOKEN_DELAY = float(os.getenv("A2A_MOCK_LLM_TOKEN_DELAY", "0"))
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Agents prefix the question with today's date. It is not a date asked about,
+# but relative dates count from it.
+_TODAY_NOTE = re.compile(r"Today's date is (\d{4}-\d{2}-\d{2})\.?")
+
+
+def date_range(question: str) -> tuple[str, str]:
+    """The first and last date a question asks about."""
+    dates = _DATE.findall(_TODAY_NOTE.sub("", question))
+    if dates:
+        return dates[0], dates[-1]
+    note = _TODAY_NOTE.search(question)
+    today = date.fromisoformat(note.group(1)) if note else date.today()
+    if "tomorrow" in question.lower():
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        return tomorrow, tomorrow
+    return today.isoformat(), (today + timedelta(days=6)).isoformat()
+
+
+class MockChatModel(BaseChatModel):
+    """Calls the agent's first tool for the asked dates, then relays its answer."""
+
+    latency: float = MOCK_LLM_LATENCY
+    token_delay: float = MOCK_LLM_TOKEN_DELAY
+
+    @property
+    def _llm_type(self) -> str:
+        return "mock"
+
+    def bind_tools(
+        self,
+        tools: Sequence[Any],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ):
+        if tool_choice:
+            kwargs["tool_choice"] = tool_choice
+        return self.bind(
+            tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._respond(messages, tools or [], tool_choice)
+        time.sleep(self.latency + self.token_delay * len(str(message.content).split()))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _respond(
+        self,
+        messages: list[BaseMessage],
+        tools: list[dict[str, Any]],
+        tool_choice: str | None,
+    ) -> AIMessage:
+        last = messages[-1] if messages else None
+        answer = next(
+            (
+                str(message.content)
+                for message in reversed(messages)
+                if isinstance(message, ToolMessage)
+            ),
+            "",
+        )
+        if tool_choice and tools:
+            # Structured output: the response schema is the only bound tool,
+            # and the conversation ends with the final answer.
+            if isinstance(last, AIMessage) and last.content:
+                answer = str(last.content)
+            return self._tool_call(
+                tools[0], {"status": "completed", "message": answer}, messages
+            )
+        if isinstance(last, HumanMessage) and tools:
+            function = tools[0]["function"]
+            argument = next(iter(function["parameters"]["properties"]))
+            start_date, end_date = date_range(str(last.content))
+            value = (
+                start_date if start_date == end_date else f"{start_date} to {end_date}"
+            )
+            return self._tool_call(tools[0], {argument: value}, messages)
+        if isinstance(last, ToolMessage):
+            return AIMessage(content=answer)
+        return AIMessage(content="I can only help with scheduling.")
+
+    @staticmethod
+    def _tool_call(
+        tool: dict[str, Any], args: dict[str, Any], messages: list[BaseMessage]
+    ) -> AIMessage:
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": tool["function"]["name"],
+                    "args": args,
+                    "id": f"call_{len(messages)}",
+                    "type": "tool_call",
+                }
+            ],
+        )
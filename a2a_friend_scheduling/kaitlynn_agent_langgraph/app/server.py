@@ -0,0 +1,94 @@
+"""ASGI application factory for Kaitlynn's agent.
+
+Running several uvicorn workers needs an importable factory instead of an app
+object built in `__main__`: each worker process imports and calls
+`create_app()` itself.
+
+The agent framework is imported by a background warm-up once the server has
+started, so the port is bound and the agent card served within moments.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import httpx
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryPushNotifier
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+
+# Modules shared by the friend agents and the host live in
+# a2a_friend_scheduling/friend_common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from friend_common.lazy_executor import LazyAgentExecutor
+from friend_common.sqlite_task_store import SqliteTaskStore
+from friend_common.task_store import BoundedTaskStore, mount_stats
+
+load_dotenv()
+
+HOST = "localhost"
+PORT = 10004
+# With more than one worker, tasks and graph checkpoints live in SQLite so that
+# any worker can serve a follow-up request.
+WORKERS = int(os.getenv("WORKERS", "1"))
+# Same as mock_llm.MOCK_LLM, without importing langchain.
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+# Same as KaitlynAgent.SUPPORTED_CONTENT_TYPES, without importing langgraph.
+SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+
+
+def create_agent_card() -> AgentCard:
+    capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
+    skill = AgentSkill(
+        id="schedule_pickleball",
+        name="Pickleball Scheduling Tool",
+        description="Helps with finding Kaitlyn's availability for pickleball",
+        tags=["scheduling", "pickleball"],
+        examples=["Are you free to play pickleball on Saturday?"],
+    )
+    return AgentCard(
+        name="Kaitlynn Agent",
+        description="Helps with scheduling pickleball games",
+        url=f"http://{HOST}:{PORT}/",
+        version="1.0.0",
+        defaultInputModes=SUPPORTED_CONTENT_TYPES,
+        defaultOutputModes=SUPPORTED_CONTENT_TYPES,
+        capabilities=capabilities,
+        skills=[skill],
+    )
+
+
+def create_executor() -> AgentExecutor:
+    """Builds the LangGraph agent; langgraph and langchain are only imported here."""
+    from app.agent_executor import KaitlynAgentExecutor
+
+    return KaitlynAgentExecutor()
+
+
+def create_app() -> Starlette:
+    agent_executor = LazyAgentExecutor(create_executor)
+    httpx_client = httpx.AsyncClient()
+    task_store = SqliteTaskStore() if WORKERS > 1 else BoundedTaskStore()
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=task_store,
+        # Push notification configs are kept per worker process.
+        push_notifier=InMemoryPushNotifier(httpx_client),
+    )
+    server = A2AStarletteApplication(
+        agent_card=create_agent_card(), http_handler=request_handler
+    )
+    app = server.build(
+        on_startup=[agent_executor.warm_up], on_shutdown=[httpx_client.aclose]
+    )
+    mount_stats(app, task_store)
+    return app
@@ -2,21 +2,8 @@ import logging
 import os
 
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from agent import create_agent
-from agent_executor import KarleyAgentExecutor
 from dotenv import load_dotenv
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from server import HOST, MOCK_LLM, PORT, WORKERS, create_app
 
 load_dotenv()
 
@@ -32,54 +19,26 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Starts the agent server."""
-    host = "localhost"
-    port = 10002
     try:
-        # Check for API key only if Vertex AI is not configured
-        if not os.getenv("GOOGLE_GENAI_USE_VERTEXAI") == "TRUE":
+        # Check for API key only if Vertex AI is not configured and the model is
+        # not mocked.
+        if not os.getenv("GOOGLE_GENAI_USE_VERTEXAI") == "TRUE" and not MOCK_LLM:
             if not os.getenv("GOOGLE_API_KEY"):
                 raise MissingAPIKeyError(
                     "GOOGLE_API_KEY environment variable not set and GOOGLE_GENAI_USE_VERTEXAI is not TRUE."
                 )
 
-        capabilities = AgentCapabilities(streaming=True)
-        skill = AgentSkill(
-            id="check_schedule",
-            name="Check Karley's Schedule",
-            description="Checks Karley's availability for a pickleball game on a given date.",
-            tags=["scheduling", "calendar"],
-            examples=["Is Karley free to play pickleball tomorrow?"],
-        )
-        agent_card = AgentCard(
-            name="Karley Agent",
-            description="An agent that manages Karley's schedule for pickleball games.",
-            url=f"http://{host}:{port}/",
-            version="1.0.0",
-            defaultInputModes=["text/plain"],
-            defaultOutputModes=["text/plain"],
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        adk_agent = create_agent()
-        runner = Runner(
-            app_name=agent_card.name,
-            agent=adk_agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
-        )
-        agent_executor = KarleyAgentExecutor(runner)
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=agent_executor,
-            task_store=InMemoryTaskStore(),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Worker processes build their own app from the importable factory.
+            uvicorn.run(
+                "server:create_app",
+                factory=True,
+                host=HOST,
+                port=PORT,
+                workers=WORKERS,
+            )
+        else:
+            uvicorn.run(create_app(), host=HOST, port=PORT)
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
         exit(1)
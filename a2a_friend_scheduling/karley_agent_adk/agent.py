@@ -2,12 +2,15 @@ import random
 from datetime import date, datetime, timedelta
 
 from google.adk.agents import LlmAgent
+from mock_llm import MOCK_LLM, MockLlm
 
 
 def generate_karley_calendar() -> dict[str, list[str]]:
     """Generates a random calendar for Karley for the next 7 days."""
     calendar = {}
     today = date.today()
+    # Seeded by the day, so every worker process hands out the same calendar.
+    rng = random.Random(f"karley-{today.isoformat()}")
     possible_times = [f"{h:02}:00" for h in range(8, 21)]  # 8 AM to 8 PM
 
     for i in range(7):
@@ -15,7 +18,7 @@ def generate_karley_calendar() -> dict[str, list[str]]:
         date_str = current_date.strftime("%Y-%m-%d")
 
         # Select 8 random unique time slots to increase availability
-        available_slots = sorted(random.sample(possible_times, 8))
+        available_slots = sorted(rng.sample(possible_times, 8))
         calendar[date_str] = available_slots
 
     print("Karley's calendar:", calendar)
@@ -67,7 +70,7 @@ def get_availability(start_date: str, end_date: str) -> str:
 def create_agent() -> LlmAgent:
     """Constructs the ADK agent for Karley."""
     return LlmAgent(
-        model="gemini-2.5-flash",
+        model=MockLlm() if MOCK_LLM else "gemini-2.5-flash",
         name="Karley_Agent",
         instruction="""
             **Role:** You are Karley's personal scheduling assistant. 
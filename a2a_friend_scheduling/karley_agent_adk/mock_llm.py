@@ -0,0 +1,106 @@
+"""Deterministic stand-in for Gemini, for offline benchmarks and tests.
+
+Enabled with A2A_MOCK_LLM=true. The mock answers a scheduling question the way
+the model would: it calls the availability tool for the dates in the question
+(the next seven days if it names none) and replies with the tool's answer.
+
+A2A_MOCK_LLM_LATENCY sets the time to the first token and
+A2A_MOCK_LLM_TOKEN_DELAY the time per generated word, both in seconds.
+"""
+
+import asyncio
+import os
+import re
+from collections.abc import AsyncGenerator
+from datetime import date, timedelta
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+MOCK_LLM_LATENCY = float(os.getenv("A2A_MOCK_LLM_LATENCY", "0"))
+MOCK_LLM_TOKEN_DELAY = float(os.getenv("A2A_MOCK_LLM_TOKEN_DELAY", "0"))
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Agents prefix the question with today's date. It is not a date asked about,
+# but relative dates count from it.
+_TODAY_NOTE = re.compile(r"Today's date is (\d{4}-\d{2}-\d{2})\.?")
+
+
+def date_range(question: str) -> tuple[str, str]:
+    """The first and last date a question asks about."""
+    dates = _DATE.findall(_TODAY_NOTE.sub("", question))
+    if dates:
+        return dates[0], dates[-1]
+    note = _TODAY_NOTE.search(question)
+    today = date.fromisoformat(note.group(1)) if note else date.today()
+    if "tomorrow" in question.lower():
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        return tomorrow, tomorrow
+    return today.isoformat(), (today + timedelta(days=6)).isoformat()
+
+
+class MockLlm(BaseLlm):
+    """Calls the agent's first tool for the asked dates, then relays its answer."""
+
+    model: str = "mock"
+    latency: float = MOCK_LLM_LATENCY
+    token_delay: float = MOCK_LLM_TOKEN_DELAY
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        last = llm_request.contents[-1] if llm_request.contents else None
+        parts = last.parts if last and last.parts else []
+        responses = [part.function_response for part in parts if part.function_response]
+        if responses:
+            text = "\n".join(
+                str((response.response or {}).get("result", ""))
+                for response in responses
+            )
+            async for response in self._text(text, stream):
+                yield response
+            return
+        question = " ".join(part.text for part in parts if part.text)
+        if not llm_request.tools_dict:
+            async for response in self._text(
+                "I can only help with scheduling.", stream
+            ):
+                yield response
+            return
+        tool = next(iter(llm_request.tools_dict))
+        start_date, end_date = date_range(question)
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            name=tool,
+                            args={"start_date": start_date, "end_date": end_date},
+                        )
+                    )
+                ],
+            )
+        )
+
+    async def _text(self, text: str, stream: bool) -> AsyncGenerator[LlmResponse, None]:
+        words = text.split(" ")
+        if stream:
+            for word in words:
+                await asyncio.sleep(self.token_delay)
+                yield LlmResponse(
+                    content=types.Content(
+                        role="model", parts=[types.Part(text=word + " ")]
+                    ),
+                    partial=True,
+                )
+        elif self.token_delay:
+            await asyncio.sleep(self.token_delay * len(words))
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)])
+        )
@@ -0,0 +1,105 @@
+"""ASGI application factory for Karley's agent.
+
+Running several uvicorn workers needs an importable factory instead of an app
+object built in `__main__`: each worker process imports and calls
+`create_app()` itself.
+
+The agent framework is imported by a background warm-up once the server has
+started, so the port is bound and the agent card served within moments.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+
+# Modules shared by the friend agents and the host live in
+# a2a_friend_scheduling/friend_common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from friend_common.lazy_executor import LazyAgentExecutor
+from friend_common.sqlite_task_store import SqliteTaskStore
+from friend_common.task_store import BoundedTaskStore, mount_stats
+
+load_dotenv()
+
+HOST = "localhost"
+PORT = 10002
+# With more than one worker, tasks and sessions live in SQLite so that any
+# worker can serve a follow-up request.
+WORKERS = int(os.getenv("WORKERS", "1"))
+# Same as mock_llm.MOCK_LLM, without importing google.adk.
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+
+
+def create_agent_card() -> AgentCard:
+    capabilities = AgentCapabilities(streaming=True)
+    skill = AgentSkill(
+        id="check_schedule",
+        name="Check Karley's Schedule",
+        description="Checks Karley's availability for a pickleball game on a given date.",
+        tags=["scheduling", "calendar"],
+        examples=["Is Karley free to play pickleball tomorrow?"],
+    )
+    return AgentCard(
+        name="Karley Agent",
+        description="An agent that manages Karley's schedule for pickleball games.",
+        url=f"http://{HOST}:{PORT}/",
+        version="1.0.0",
+        defaultInputModes=["text/plain"],
+        defaultOutputModes=["text/plain"],
+        capabilities=capabilities,
+        skills=[skill],
+    )
+
+
+def create_executor(shared: bool) -> AgentExecutor:
+    """Builds the ADK runner; google.adk is only imported here."""
+    from agent import create_agent
+    from agent_executor import KarleyAgentExecutor
+    from friend_common.sqlite_session_service import SqliteSessionService
+    from google.adk.artifacts import InMemoryArtifactService
+    from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+    from google.adk.runners import Runner
+
+    runner = Runner(
+        app_name=create_agent_card().name,
+        agent=create_agent(),
+        artifact_service=InMemoryArtifactService(),
+        session_service=SqliteSessionService(shared=shared),
+        memory_service=InMemoryMemoryService(),
+    )
+    return KarleyAgentExecutor(runner)
+
+
+def create_app() -> Starlette:
+    shared = WORKERS > 1
+    agent_executor = LazyAgentExecutor(lambda: create_executor(shared))
+
+    async def close_sessions():
+        if agent_executor.executor is not None:
+            await agent_executor.executor.runner.session_service.aclose()
+
+    task_store = SqliteTaskStore() if shared else BoundedTaskStore()
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=task_store,
+    )
+    server = A2AStarletteApplication(
+        agent_card=create_agent_card(), http_handler=request_handler
+    )
+    app = server.build(
+        on_startup=[agent_executor.warm_up], on_shutdown=[close_sessions]
+    )
+    mount_stats(app, task_store)
+    return app
@@ -8,17 +8,8 @@ import logging
 import os
 
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from agent import SchedulingAgent
-from agent_executor import SchedulingAgentExecutor
 from dotenv import load_dotenv
+from server import HOST, MOCK_LLM, PORT, WORKERS, create_app
 
 load_dotenv()
 
@@ -32,45 +23,22 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Entry point for Nate's Scheduling Agent."""
-    host = "localhost"
-    port = 10003
     try:
-        if not os.getenv("GOOGLE_API_KEY"):
+        # The mock model needs no key.
+        if not os.getenv("GOOGLE_API_KEY") and not MOCK_LLM:
             raise MissingAPIKeyError("GOOGLE_API_KEY environment variable not set.")
 
-        capabilities = AgentCapabilities(streaming=False)
-        skill = AgentSkill(
-            id="availability_checker",
-            name="Availability Checker",
-            description="Check my calendar to see when I'm available for a pickleball game.",
-            tags=["schedule", "availability", "calendar"],
-            examples=[
-                "Are you free tomorrow?",
-                "Can you play pickleball next Tuesday at 5pm?",
-            ],
-        )
-
-        agent_host_url = os.getenv("HOST_OVERRIDE") or f"http://{host}:{port}/"
-        agent_card = AgentCard(
-            name="Nate Agent",
-            description="A friendly agent to help you schedule a pickleball game with Nate.",
-            url=agent_host_url,
-            version="1.0.0",
-            defaultInputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
-            defaultOutputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=SchedulingAgentExecutor(),
-            task_store=InMemoryTaskStore(),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Worker processes build their own app from the importable factory.
+            uvicorn.run(
+                "server:create_app",
+                factory=True,
+                host=HOST,
+                port=PORT,
+                workers=WORKERS,
+            )
+        else:
+            uvicorn.run(create_app(), host=HOST, port=PORT)
 
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
@@ -6,6 +6,7 @@ from typing import Type
 from crewai import LLM, Agent, Crew, Process, Task
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
+from mock_llm import MOCK_LLM, MockLLM
 from pydantic import BaseModel, Field
 
 load_dotenv()
@@ -15,12 +16,14 @@ def generate_calendar() -> dict[str, list[str]]:
     """Generates a random calendar for the next 7 days."""
     calendar = {}
     today = date.today()
+    # Seeded by the day, so every worker process hands out the same calendar.
+    rng = random.Random(f"nate-{today.isoformat()}")
     possible_times = [f"{h:02}:00" for h in range(8, 21)]  # 8 AM to 8 PM
 
     for i in range(7):
         current_date = today + timedelta(days=i)
         date_str = current_date.strftime("%Y-%m-%d")
-        available_slots = sorted(random.sample(possible_times, 8))
+        available_slots = sorted(rng.sample(possible_times, 8))
         calendar[date_str] = available_slots
     print("---- Nate's Generated Calendar ----")
     print(calendar)
@@ -91,7 +94,9 @@ class SchedulingAgent:
 
     def __init__(self):
         """Initializes the SchedulingAgent."""
-        if os.getenv("GOOGLE_API_KEY"):
+        if MOCK_LLM:
+            self.llm = MockLLM()
+        elif os.getenv("GOOGLE_API_KEY"):
             self.llm = LLM(
                 model="gemini/gemini-2.0-flash",
                 api_key=os.getenv("GOOGLE_API_KEY"),
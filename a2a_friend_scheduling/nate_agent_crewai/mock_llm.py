@@ -0,0 +1,99 @@
+"""Deterministic stand-in for Gemini, for offline benchmarks and tests.
+
+Enabled with A2A_MOCK_LLM=true. The mock answers in CrewAI's ReAct format the
+way the model would: its first reply calls the agent's tool for the dates in
+the question (the next seven days if it names none), and once the tool's
+observation is in the conversation it gives that as the final answer.
+
+A2A_MOCK_LLM_LATENCY sets the time to the first token and
+A2A_MOCK_LLM_TOKEN_DELAY the time per generated word, both in seconds.
+"""
+
+import json
+import os
+import re
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from crewai import BaseLLM
+
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+MOCK_LLM_LATENCY = float(os.getenv("A2A_MOCK_LLM_LATENCY", "0"))
+MOCK_LLM_TOKEN_DELAY = float(os.getenv("A2A_MOCK_LLM_TOKEN_DELAY", "0"))
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Agents prefix the question with today's date. It is not a date asked about,
+# but relative dates count from it.
+_TODAY_NOTE = re.compile(r"Today's date is (\d{4}-\d{2}-\d{2})\.?")
+# CrewAI describes each tool as "Tool Name: ...\nTool Arguments: {'arg': ...".
+_TOOL = re.compile(r"Tool Name: (.+)\nTool Arguments: \{'(\w+)'")
+_OBSERVATION = "Observation:"
+
+
+def date_range(question: str) -> tuple[str, str]:
+    """The first and last date a question asks about."""
+    dates = _DATE.findall(_TODAY_NOTE.sub("", question))
+    if dates:
+        return dates[0], dates[-1]
+    note = _TODAY_NOTE.search(question)
+    today = date.fromisoformat(note.group(1)) if note else date.today()
+    if "tomorrow" in question.lower():
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        return tomorrow, tomorrow
+    return today.isoformat(), (today + timedelta(days=6)).isoformat()
+
+
+class MockLLM(BaseLLM):
+    """Calls the agent's first tool for the asked dates, then relays its answer."""
+
+    def __init__(
+        self,
+        latency: float = MOCK_LLM_LATENCY,
+        token_delay: float = MOCK_LLM_TOKEN_DELAY,
+    ):
+        super().__init__(model="mock")
+        self.latency = latency
+        self.token_delay = token_delay
+
+    def call(
+        self,
+        messages: str | list[dict[str, str]],
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+    ) -> str:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        answer = self._answer(messages)
+        time.sleep(self.latency + self.token_delay * len(answer.split()))
+        return answer
+
+    def _answer(self, messages: list[dict[str, str]]) -> str:
+        observations = [
+            message["content"].split(_OBSERVATION, 1)[1].strip()
+            for message in messages
+            if message["role"] == "assistant" and _OBSERVATION in message["content"]
+        ]
+        if observations:
+            return (
+                "Thought: I now know the final answer\n"
+                f"Final Answer: {observations[-1]}"
+            )
+        tool = _TOOL.search("\n".join(message["content"] for message in messages))
+        if tool is None:
+            return (
+                "Thought: I have no tool for this.\n"
+                "Final Answer: I can only help with scheduling."
+            )
+        name, argument = tool.groups()
+        question = "\n".join(
+            message["content"] for message in messages if message["role"] == "user"
+        )
+        start_date, end_date = date_range(question)
+        value = start_date if start_date == end_date else f"{start_date} to {end_date}"
+        return (
+            "Thought: I should check the calendar for the requested dates.\n"
+            f"Action: {name.strip()}\n"
+            f"Action Input: {json.dumps({argument: value})}"
+        )
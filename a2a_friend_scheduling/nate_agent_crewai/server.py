@@ -0,0 +1,92 @@
+"""ASGI application factory for Nate's agent.
+
+Running several uvicorn workers needs an importable factory instead of an app
+object built in `__main__`: each worker process imports and calls
+`create_app()` itself.
+
+The agent framework is imported by a background warm-up once the server has
+started, so the port is bound and the agent card served within moments.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+
+# Modules shared by the friend agents and the host live in
+# a2a_friend_scheduling/friend_common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from friend_common.lazy_executor import LazyAgentExecutor
+from friend_common.sqlite_task_store import SqliteTaskStore
+from friend_common.task_store import BoundedTaskStore, mount_stats
+
+load_dotenv()
+
+HOST = "localhost"
+PORT = 10003
+# With more than one worker, tasks live in SQLite so that any worker can serve
+# a follow-up request.
+WORKERS = int(os.getenv("WORKERS", "1"))
+# Same as mock_llm.MOCK_LLM, without importing crewai.
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+# Same as SchedulingAgent.SUPPORTED_CONTENT_TYPES, without importing crewai.
+SUPPORTED_CONTENT_TYPES = ["text/plain"]
+
+
+def create_agent_card() -> AgentCard:
+    capabilities = AgentCapabilities(streaming=False)
+    skill = AgentSkill(
+        id="availability_checker",
+        name="Availability Checker",
+        description="Check my calendar to see when I'm available for a pickleball game.",
+        tags=["schedule", "availability", "calendar"],
+        examples=[
+            "Are you free tomorrow?",
+            "Can you play pickleball next Tuesday at 5pm?",
+        ],
+    )
+
+    agent_host_url = os.getenv("HOST_OVERRIDE") or f"http://{HOST}:{PORT}/"
+    return AgentCard(
+        name="Nate Agent",
+        description="A friendly agent to help you schedule a pickleball game with Nate.",
+        url=agent_host_url,
+        version="1.0.0",
+        defaultInputModes=SUPPORTED_CONTENT_TYPES,
+        defaultOutputModes=SUPPORTED_CONTENT_TYPES,
+        capabilities=capabilities,
+        skills=[skill],
+    )
+
+
+def create_executor() -> AgentExecutor:
+    """Builds the CrewAI agent; crewai is only imported here."""
+    from agent_executor import SchedulingAgentExecutor
+
+    return SchedulingAgentExecutor()
+
+
+def create_app() -> Starlette:
+    agent_executor = LazyAgentExecutor(create_executor)
+    task_store = SqliteTaskStore() if WORKERS > 1 else BoundedTaskStore()
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=task_store,
+    )
+    server = A2AStarletteApplication(
+        agent_card=create_agent_card(), http_handler=request_handler
+    )
+    app = server.build(on_startup=[agent_executor.warm_up])
+    mount_stats(app, task_store)
+    return app
@@ -1,9 +1,9 @@
 import uvicorn
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
 from agent_executor import GreetingAgentExecutor
+from task_store import BoundedTaskStore, mount_stats
 
 
 def main():
@@ -26,9 +26,10 @@ def main():
         capabilities=AgentCapabilities(),
     )
 
+    task_store = BoundedTaskStore()
     request_handler = DefaultRequestHandler(
         agent_executor=GreetingAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+        task_store=task_store,
     )
 
     server = A2AStarletteApplication(
@@ -36,7 +37,9 @@ def main():
         agent_card=agent_card,
     )
 
-    uvicorn.run(server.build(), host="0.0.0.0", port=9999)
+    app = server.build()
+    mount_stats(app, task_store)
+    uvicorn.run(app, host="0.0.0.0", port=9999)
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Benchmarks for the agents in this repository; run each with `python -m benchmarks.<name>`."""
@@ -0,0 +1,151 @@
+"""Speed of the friend host's common-slot search for many friends and days.
+
+    python -m benchmarks.common_slots --friends 36 --days 28
+    python -m benchmarks.common_slots --friends 12 --days 14 --required 9
+
+Builds availability lines for --friends friends over --days days, in the form
+the find_common_slots tool takes, each friend free in a random --free share of
+the one-hour slots. --bookings random one-hour bookings fill a CourtSchedule
+with --courts courts. It then times parsing the lines and --searches searches
+for the best windows in which --required friends (0 for all) and a court are
+free, with a random game length of 30 to 120 minutes.
+"""
+
+import argparse
+import asyncio
+import importlib.machinery
+import importlib.util
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# The host package's __init__ imports the ADK agent; registering the package
+# by hand loads only the scheduling modules, which need nothing beyond Python.
+_host = importlib.machinery.ModuleSpec("host", None, is_package=True)
+_host.submodule_search_locations = [
+    str(
+        Path(__file__).resolve().parent.parent
+        / "a2a_friend_scheduling"
+        / "host_agent_adk"
+        / "host"
+    )
+]
+sys.modules.setdefault("host", importlib.util.module_from_spec(_host))
+
+from host.common_slots import common_windows, parse_availability
+from host.court_schedule import BookingError, CourtSchedule
+
+
+def availability_lines(
+    schedule: CourtSchedule, friends: int, free: float, seed: int
+) -> list[str]:
+    rng = random.Random(seed)
+    lines = []
+    for friend in range(friends):
+        days = []
+        for day in schedule.days:
+            slots = [
+                f"{start // 60:02}:00"
+                for start in range(schedule.opens, schedule.closes, 60)
+                if rng.random() < free
+            ]
+            days.append(f"On {day.isoformat()}, available at: {', '.join(slots)}.")
+        lines.append(f"Friend {friend}: {' '.join(days)}")
+    return lines
+
+
+async def book_courts(schedule: CourtSchedule, bookings: int, seed: int) -> int:
+    rng = random.Random(seed)
+    accepted = 0
+    for _ in range(bookings):
+        start = rng.randrange(schedule.opens, schedule.closes - 60, 30)
+        try:
+            await schedule.book(rng.choice(schedule.days), start, start + 60, "other")
+            accepted += 1
+        except BookingError:
+            pass
+    return accepted
+
+
+async def run(args: argparse.Namespace) -> dict:
+    schedule = CourtSchedule(courts=args.courts, days=args.days)
+    booked = await book_courts(schedule, args.bookings, args.seed)
+    lines = availability_lines(schedule, args.friends, args.free, args.seed)
+
+    started = time.perf_counter()
+    for _ in range(args.parses):
+        availability, _ = parse_availability(lines)
+    parse_elapsed = time.perf_counter() - started
+
+    rng = random.Random(args.seed)
+    found = attendees = 0
+    started = time.perf_counter()
+    for _ in range(args.searches):
+        windows = common_windows(
+            availability,
+            schedule,
+            duration=rng.choice((30, 60, 90, 120)),
+            required=args.required,
+            limit=args.limit,
+        )
+        found += len(windows)
+        attendees += sum(len(window.available) for window in windows)
+    search_elapsed = time.perf_counter() - started
+
+    return {
+        "friends": args.friends,
+        "days": args.days,
+        "courts": args.courts,
+        "free_share": args.free,
+        "court_bookings": booked,
+        "required": args.required,
+        "parses": args.parses,
+        "parse_ms": round(parse_elapsed / args.parses * 1000, 3),
+        "searches": args.searches,
+        "search_ms": round(search_elapsed / args.searches * 1000, 3),
+        "searches_per_second": round(args.searches / search_elapsed),
+        "windows_per_search": round(found / args.searches, 2),
+        "friends_per_window": round(attendees / found, 2) if found else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--friends", type=int, default=36)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--courts", type=int, default=4)
+    parser.add_argument(
+        "--free",
+        type=float,
+        default=0.9,
+        help="Share of one-hour slots in which each friend is free.",
+    )
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--required", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--parses", type=int, default=100)
+    parser.add_argument("--searches", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(
+        f"{result['friends']} friends over {result['days']} days, "
+        f"{result['court_bookings']} court bookings on {result['courts']} court(s)"
+    )
+    print(f"parse: {result['parse_ms']:.3f} ms")
+    print(
+        f"search: {result['search_ms']:.3f} ms "
+        f"({result['searches_per_second']} per second), "
+        f"{result['windows_per_search']} windows with "
+        f"{result['friends_per_window']} friends each on average"
+    )
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
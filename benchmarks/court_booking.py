@@ -0,0 +1,183 @@
+"""Throughput and correctness of the friend host's court booking engine.
+
+    python -m benchmarks.court_booking --requests 100000 --courts 4
+    python -m benchmarks.court_booking --requests 20000 --db /tmp/courts.db
+
+Fires --requests random booking attempts (start times on a 15-minute grid,
+30 to 120 minutes long, any free court) at a fresh CourtSchedule from
+--concurrency tasks, and reports attempts per second and how many were
+accepted. It then times --searches free-window searches over the whole booked
+schedule, as made by the find_court_windows tool. Finally it checks that no
+two accepted bookings overlap on the same court, and that of --contenders
+simultaneous requests for one slot exactly one per court succeeds.
+
+With --db, accepted bookings are also committed to a ReservationStore at that
+path (which must not exist yet), as the host does by default.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# court_schedule is imported on its own: the host package pulls in ADK.
+sys.path.insert(
+    0,
+    str(
+        Path(__file__).resolve().parent.parent
+        / "a2a_friend_scheduling"
+        / "host_agent_adk"
+        / "host"
+    ),
+)
+
+from court_schedule import BookingError, CourtSchedule
+from reservation_store import ReservationStore
+
+
+async def attempt_bookings(
+    schedule: CourtSchedule, requests: int, concurrency: int, seed: int
+) -> int:
+    rng = random.Random(seed)
+    attempts = [
+        (
+            rng.choice(schedule.days),
+            start := rng.randrange(schedule.opens, schedule.closes - 30, 15),
+            min(schedule.closes, start + rng.choice((30, 60, 90, 120))),
+        )
+        for _ in range(requests)
+    ]
+    accepted = 0
+
+    async def worker(index: int):
+        nonlocal accepted
+        for day, start, end in attempts[index::concurrency]:
+            try:
+                await schedule.book(day, start, end, f"party-{index}")
+                accepted += 1
+            except BookingError:
+                pass
+
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return accepted
+
+
+def search_windows(schedule: CourtSchedule, searches: int, seed: int) -> int:
+    rng = random.Random(seed)
+    found = 0
+    for _ in range(searches):
+        earliest = rng.randrange(schedule.opens, schedule.closes - 60, 30)
+        found += len(
+            schedule.free_windows(
+                schedule.days[0],
+                schedule.days[-1],
+                duration=rng.choice((30, 60, 90)),
+                earliest=earliest,
+                latest=min(schedule.closes, earliest + 240),
+            )
+        )
+    return found
+
+
+def overlapping_bookings(schedule: CourtSchedule) -> int:
+    overlaps = 0
+    for day in schedule.days:
+        last_end: dict[int, int] = {}
+        for booking in schedule.bookings(day):
+            if booking.start < last_end.get(booking.court, 0):
+                overlaps += 1
+            last_end[booking.court] = max(last_end.get(booking.court, 0), booking.end)
+    return overlaps
+
+
+async def contended_winners(courts: int, contenders: int) -> int:
+    schedule = CourtSchedule(courts=courts)
+    day = schedule.days[0]
+
+    async def contend(index: int) -> bool:
+        try:
+            await schedule.book(day, 18 * 60, 19 * 60, f"contender-{index}")
+            return True
+        except BookingError:
+            return False
+
+    results = await asyncio.gather(*(contend(index) for index in range(contenders)))
+    return sum(results)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    store = ReservationStore(args.db) if args.db else None
+    schedule = CourtSchedule(courts=args.courts, days=args.days, store=store)
+    started = time.perf_counter()
+    accepted = await attempt_bookings(
+        schedule, args.requests, args.concurrency, args.seed
+    )
+    elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    windows = search_windows(schedule, args.searches, args.seed)
+    search_elapsed = time.perf_counter() - started
+    winners = await contended_winners(args.courts, args.contenders)
+    if store is not None:
+        store.close()
+    return {
+        "requests": args.requests,
+        "courts": args.courts,
+        "days": args.days,
+        "concurrency": args.concurrency,
+        "durable": bool(args.db),
+        "seconds": round(elapsed, 3),
+        "attempts_per_second": round(args.requests / elapsed),
+        "accepted": accepted,
+        "rejected": args.requests - accepted,
+        "searches": args.searches,
+        "searches_per_second": round(args.searches / search_elapsed),
+        "windows_found": windows,
+        "overlapping_bookings": overlapping_bookings(schedule),
+        "contenders": args.contenders,
+        "contended_winners": winners,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--courts", type=int, default=4)
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=365,
+        help="Days open for booking; more days leave room for more bookings.",
+    )
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--searches", type=int, default=10_000)
+    parser.add_argument("--contenders", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", help="Persist bookings to this new SQLite file.")
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(
+        f"{result['requests']} attempts in {result['seconds']:.2f}s "
+        f"({result['attempts_per_second']} per second): "
+        f"{result['accepted']} accepted, {result['rejected']} rejected"
+    )
+    print(
+        f"{result['searches']} window searches "
+        f"({result['searches_per_second']} per second), "
+        f"{result['windows_found']} windows found"
+    )
+    print(
+        f"overlapping bookings: {result['overlapping_bookings']}; "
+        f"{result['contended_winners']} of {result['contenders']} contenders "
+        f"won one slot on {result['courts']} court(s)"
+    )
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
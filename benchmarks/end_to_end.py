@@ -0,0 +1,227 @@
+"""Offline end-to-end benchmark of a host and its agents.
+
+    python -m benchmarks.end_to_end --target travel --sessions 32 --messages 4
+    python -m benchmarks.end_to_end --target friends --mock-latency 0.2 --json out.json
+    python -m benchmarks.end_to_end --target friends --friends real
+
+Starts everything locally with every model replaced by the agents' mock_llm.py
+(A2A_MOCK_LLM=true), so no API key or network access is needed:
+
+- travel: the nine travel agents on ports 10001-10009 and the travel planner
+  host on --port.
+- friends: Karley's, Nate's and Kaitlynn's agents on ports 10002-10004 and the
+  friend host behind benchmarks/friend_host_server.py on --port. With
+  --friends real these are the real ADK, CrewAI and LangGraph agents on their
+  own mock models; with --friends stub, model-free stand-ins
+  (benchmarks/stub_friends.py) that need none of those frameworks installed.
+
+Then --sessions concurrent websocket sessions each send --messages messages and
+the run reports latency percentiles, requests per second and a per-agent
+breakdown. With --mode fast the travel requests are fully specified and
+planned by the host's rule-based fast path; with --mode model they go through
+the (mock) model and its send_messages tool call.
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.load import drive
+from benchmarks.processes import ROOT, ProcessGroup
+from benchmarks.startup import ENTRY_POINTS
+from benchmarks.stub_friends import FRIENDS
+from benchmarks.travel_agents import TRAVEL_AGENTS, TRAVEL_DIR
+from benchmarks.worker_scaling import DESTINATIONS, travel_request
+
+FRIEND_HOST_DIR = ROOT / "a2a_friend_scheduling" / "host_agent_adk"
+
+
+def card_url(port: int) -> str:
+    return f"http://127.0.0.1:{port}/.well-known/agent.json"
+
+
+def messages_for(args: argparse.Namespace):
+    def travel(session: int) -> list[str]:
+        if args.mode == "fast":
+            return [
+                travel_request(session, message) for message in range(args.messages)
+            ]
+        return [
+            f"I'd like some ideas for a trip to "
+            f"{DESTINATIONS[(session + message) % len(DESTINATIONS)]}"
+            for message in range(args.messages)
+        ]
+
+    def friends(session: int) -> list[str]:
+        return [
+            f"Who is free to play pickleball in the next {1 + message % 7} days?"
+            for message in range(args.messages)
+        ]
+
+    return travel if args.target == "travel" else friends
+
+
+def start_travel(group: ProcessGroup, args: argparse.Namespace, env: dict):
+    for name in TRAVEL_AGENTS:
+        group.start(name, ["__main__.py"], TRAVEL_DIR / f"{name}_agent", env)
+    for name, port in TRAVEL_AGENTS.items():
+        group.wait_for(name, card_url(port), args.timeout)
+    group.start(
+        "host",
+        [
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+        ],
+        TRAVEL_DIR / "travel_planner_host",
+        env,
+    )
+
+
+def start_friends(group: ProcessGroup, args: argparse.Namespace, env: dict):
+    if args.friends == "real":
+        friends = {
+            entry.name: (entry.command, ROOT / entry.directory, entry.port)
+            for entry in ENTRY_POINTS
+            if entry.name in ("karley", "nate", "kaitlynn")
+        }
+    else:
+        friends = {
+            name: (["-m", "benchmarks.stub_friends", "--name", name], ROOT, port)
+            for name, port in FRIENDS.items()
+        }
+    for name, (command, directory, _) in friends.items():
+        group.start(name, command, directory, env)
+    for name, (_, _, port) in friends.items():
+        group.wait_for(name, card_url(port), args.timeout)
+    group.start(
+        "host",
+        [
+            "-m",
+            "uvicorn",
+            "benchmarks.friend_host_server:app",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+        ],
+        FRIEND_HOST_DIR,
+        {**env, "PYTHONPATH": str(ROOT)},
+    )
+
+
+def run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = {
+            "A2A_MOCK_LLM": "true",
+            "A2A_MOCK_LLM_LATENCY": str(args.mock_latency),
+            "A2A_MOCK_LLM_TOKEN_DELAY": str(args.mock_token_delay),
+            "GOOGLE_API_KEY": "end-to-end-benchmark",
+            "SESSION_DB_PATH": str(Path(data_dir) / "sessions.db"),
+        }
+        if not args.cache:
+            env["RESPONSE_CACHE_TTL"] = "0"
+        logs = Path(args.logs or data_dir)
+        logs.mkdir(parents=True, exist_ok=True)
+        with ProcessGroup(logs) as group:
+            if args.target == "travel":
+                start_travel(group, args, env)
+            else:
+                start_friends(group, args, env)
+            group.wait_for("host", f"http://127.0.0.1:{args.port}/stats", args.timeout)
+            result = asyncio.run(
+                drive(
+                    f"ws://127.0.0.1:{args.port}",
+                    args.sessions,
+                    messages_for(args),
+                    timeout=args.timeout,
+                    run_id=f"e2e-{int(time.time())}",
+                )
+            )
+    return {
+        "target": args.target,
+        "mode": args.mode,
+        "sessions": args.sessions,
+        "messages": args.messages,
+        "friends": args.friends if args.target == "friends" else None,
+        "mock_latency": args.mock_latency,
+        "mock_token_delay": args.mock_token_delay,
+        "cache": args.cache,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **result.report(),
+    }
+
+
+def print_report(report: dict):
+    latency = report["latency"]
+    print(
+        f"{report['target']} ({report['mode']}): {report['requests']} requests in "
+        f"{report['seconds']:.2f}s, {report['requests_per_second']:.1f} req/s, "
+        f"errors {report['errors'] or 'none'}"
+    )
+    print(
+        f"  latency p50 {latency['p50_ms']:.1f} ms  p95 {latency['p95_ms']:.1f} ms  "
+        f"p99 {latency['p99_ms']:.1f} ms"
+    )
+    for agent, stats in report["per_agent"].items():
+        print(
+            f"  {agent:>24}: {stats['count']:>5} calls  p50 {stats['p50_ms']:>8.1f} ms"
+            f"  p95 {stats['p95_ms']:>8.1f} ms  {stats['statuses']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=["travel", "friends"], default="travel")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--messages", type=int, default=4)
+    parser.add_argument("--mode", choices=["fast", "model"], default="fast")
+    parser.add_argument(
+        "--mock-latency",
+        type=float,
+        default=0.0,
+        help="Seconds before each mock model call's first token.",
+    )
+    parser.add_argument(
+        "--mock-token-delay",
+        type=float,
+        default=0.0,
+        help="Seconds per word the mock models generate.",
+    )
+    parser.add_argument(
+        "--friends",
+        choices=["stub", "real"],
+        default="stub",
+        help="Friend agents to run with --target friends.",
+    )
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="Disable the travel host's response cache.",
+    )
+    parser.add_argument("--logs", help="Keep the servers' logs in this directory.")
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+    if args.target == "friends":
+        # The friend host has no rule-based fast path.
+        args.mode = "model"
+
+    report = run(args)
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
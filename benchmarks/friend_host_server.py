@@ -0,0 +1,61 @@
+"""Websocket front end for the friend scheduling host, for load tests.
+
+The friend host normally runs under `adk web`. This serves its HostAgent.stream
+on `/ws/{session_id}` with the same frames as the travel planner host, so one
+load driver can measure both:
+
+    cd a2a_friend_scheduling/host_agent_adk
+    PYTHONPATH=../.. python -m uvicorn benchmarks.friend_host_server:app --port 8100
+"""
+
+import logging
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from host.agent import DISCOVERY_TIMEOUT, host_agent
+
+logger = logging.getLogger(__name__)
+
+app = FastAPI()
+
+
+@app.on_event("startup")
+async def startup_event():
+    host_agent.start_discovery()
+    await host_agent.wait_for_discovery(DISCOVERY_TIMEOUT)
+    host_agent.start_health_checks()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await host_agent.aclose()
+
+
+@app.get("/stats")
+async def stats():
+    return {
+        "agents": list(host_agent.cards),
+        "sessions": host_agent.session_service.stats(),
+    }
+
+
+@app.websocket("/ws/{session_id}")
+async def websocket_endpoint(websocket: WebSocket, session_id: str):
+    await websocket.accept()
+    try:
+        while True:
+            data = await websocket.receive_text()
+            try:
+                async for response in host_agent.stream(data, session_id):
+                    await websocket.send_json(response)
+            except WebSocketDisconnect:
+                raise
+            except Exception:
+                logger.exception("Failed to answer a message for %s", session_id)
+                await websocket.send_json(
+                    {
+                        "is_task_complete": True,
+                        "content": "Sorry, something went wrong. Please try again.",
+                    }
+                )
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,107 @@
+"""Websocket load driver: concurrent sessions against a host's /ws endpoint.
+
+Each session opens `/ws/<session_id>`, sends its messages one after another
+and waits for the final frame of each. Progress frames of type "agent_result"
+(see the hosts' progress.py) give the per-agent breakdown.
+"""
+
+import asyncio
+import json
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import websockets
+
+from benchmarks.stats import summarize
+
+
+@dataclass
+class LoadResult:
+    latencies: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+    frames: int = 0
+    elapsed: float = 0.0
+    agent_seconds: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    agent_statuses: dict[str, Counter[str]] = field(
+        default_factory=lambda: defaultdict(Counter)
+    )
+
+    def report(self) -> dict[str, Any]:
+        requests = len(self.latencies)
+        return {
+            "requests": requests,
+            "errors": dict(self.errors),
+            "seconds": round(self.elapsed, 3),
+            "requests_per_second": (
+                round(requests / self.elapsed, 2) if self.elapsed else 0.0
+            ),
+            "frames_per_request": round(self.frames / requests, 2) if requests else 0,
+            "latency": summarize(self.latencies),
+            "per_agent": {
+                agent: {
+                    **summarize(seconds),
+                    "statuses": dict(self.agent_statuses[agent]),
+                }
+                for agent, seconds in sorted(self.agent_seconds.items())
+            },
+        }
+
+
+async def run_session(
+    ws_url: str,
+    session_id: str,
+    messages: list[str],
+    result: LoadResult,
+    timeout: float,
+):
+    try:
+        async with websockets.connect(f"{ws_url}/ws/{session_id}") as websocket:
+            for message in messages:
+                started = time.perf_counter()
+                await websocket.send(message)
+                while True:
+                    frame = json.loads(
+                        await asyncio.wait_for(websocket.recv(), timeout)
+                    )
+                    result.frames += 1
+                    if frame.get("type") == "agent_result":
+                        agent = frame.get("agent", "unknown")
+                        result.agent_seconds[agent].append(
+                            frame.get("elapsed_ms", 0) / 1000
+                        )
+                        status = "cached" if frame.get("cached") else frame["status"]
+                        result.agent_statuses[agent][status] += 1
+                    if frame.get("is_task_complete"):
+                        break
+                result.latencies.append(time.perf_counter() - started)
+    except asyncio.TimeoutError:
+        result.errors["timeout"] += 1
+    except (OSError, websockets.WebSocketException) as e:
+        result.errors[type(e).__name__] += 1
+
+
+async def drive(
+    ws_url: str,
+    sessions: int,
+    messages_for: Callable[[int], list[str]],
+    timeout: float = 120,
+    run_id: str = "bench",
+) -> LoadResult:
+    """Runs `sessions` concurrent sessions; session i sends messages_for(i)."""
+    result = LoadResult()
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_session(
+                ws_url, f"{run_id}-{session}", messages_for(session), result, timeout
+            )
+            for session in range(sessions)
+        )
+    )
+    result.elapsed = time.perf_counter() - started
+    return result
@@ -0,0 +1,75 @@
+"""Starting and stopping the local servers a benchmark runs against."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class ProcessGroup:
+    """Servers started for one benchmark run, stopped together on exit.
+
+    Each server's output goes to `<log_dir>/<name>.log` so a failed run can be
+    diagnosed.
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = log_dir
+        self._processes: dict[str, subprocess.Popen] = {}
+
+    def __enter__(self) -> "ProcessGroup":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(
+        self, name: str, args: list[str], cwd: Path, env: dict[str, str] | None = None
+    ) -> subprocess.Popen:
+        """Runs `python <args>` in `cwd`, with `env` added to the environment."""
+        log = open(self.log_dir / f"{name}.log", "wb")
+        process = subprocess.Popen(
+            [sys.executable, *args],
+            cwd=cwd,
+            env={**os.environ, **(env or {})},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        log.close()
+        self._processes[name] = process
+        return process
+
+    def wait_for(self, name: str, url: str, timeout: float = 60):
+        """Polls `url` until it answers 200, failing early if the server exits."""
+        process = self._processes[name]
+        deadline = time.monotonic() + timeout
+        with httpx.Client(timeout=1) as client:
+            while time.monotonic() < deadline:
+                if process.poll() is not None:
+                    raise RuntimeError(
+                        f"{name} exited with {process.returncode}; "
+                        f"see {self.log_dir / f'{name}.log'}"
+                    )
+                try:
+                    if client.get(url).status_code == 200:
+                        return
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.05)
+        raise TimeoutError(f"{name} did not answer {url} within {timeout:g}s")
+
+    def stop(self):
+        for process in self._processes.values():
+            process.terminate()
+        for process in self._processes.values():
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._processes.clear()
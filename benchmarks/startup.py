@@ -0,0 +1,183 @@
+"""Cold-start cost of every agent entry point in the repository.
+
+    python -m benchmarks.startup --runs 3
+    python -m benchmarks.startup --only karley nate kaitlynn
+
+For each agent this reports two medians over --runs fresh processes:
+
+- import: time to execute the entry point's top-level imports (its
+  `__main__` module run without calling main()).
+- first card: time from spawning the server until its agent card is served at
+  /.well-known/agent.json.
+
+Agents are started one at a time, so agents sharing a port do not collide. A
+placeholder GOOGLE_API_KEY is set when none is configured; no model is called.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class EntryPoint(NamedTuple):
+    name: str
+    directory: str
+    # Arguments to `python` that start the server.
+    command: list[str]
+    # Module run by `command`, executed as a file path or a module name.
+    main: str
+    port: int
+
+
+ENTRY_POINTS = [
+    EntryPoint("greeting", "a2a_simple", ["__main__.py"], "__main__.py", 9999),
+    EntryPoint(
+        "karley",
+        "a2a_friend_scheduling/karley_agent_adk",
+        ["__main__.py"],
+        "__main__.py",
+        10002,
+    ),
+    EntryPoint(
+        "nate",
+        "a2a_friend_scheduling/nate_agent_crewai",
+        ["__main__.py"],
+        "__main__.py",
+        10003,
+    ),
+    EntryPoint(
+        "kaitlynn",
+        "a2a_friend_scheduling/kaitlynn_agent_langgraph",
+        ["-m", "app"],
+        "app.__main__",
+        10004,
+    ),
+] + [
+    EntryPoint(
+        name,
+        f"easy_my_trip_holidays/{name}_agent",
+        ["__main__.py"],
+        "__main__.py",
+        port,
+    )
+    for name, port in (
+        ("flight", 10001),
+        ("hotel", 10002),
+        ("cab", 10003),
+        ("activity", 10004),
+        ("weather", 10005),
+        ("budget", 10006),
+        ("document", 10007),
+        ("food", 10008),
+        ("currency", 10009),
+    )
+]
+
+_IMPORT_SCRIPT = """
+import runpy, sys, time
+started = time.perf_counter()
+if sys.argv[1].endswith(".py"):
+    runpy.run_path(sys.argv[1], run_name="startup_benchmark")
+else:
+    runpy.run_module(sys.argv[1], run_name="startup_benchmark")
+print(time.perf_counter() - started)
+"""
+
+
+def _env() -> dict[str, str]:
+    return {"GOOGLE_API_KEY": "startup-benchmark", **os.environ}
+
+
+def import_seconds(entry: EntryPoint) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT, entry.main],
+        cwd=ROOT / entry.directory,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def first_card_seconds(entry: EntryPoint, timeout: float) -> float:
+    url = f"http://localhost:{entry.port}/.well-known/agent.json"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, *entry.command],
+        cwd=ROOT / entry.directory,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=1) as client:
+            while time.perf_counter() - started < timeout:
+                if server.poll() is not None:
+                    raise RuntimeError(f"{entry.name} exited with {server.returncode}")
+                try:
+                    if client.get(url).status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise TimeoutError(f"{entry.name} served no card within {timeout:g}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[entry.name for entry in ENTRY_POINTS],
+        help="Benchmark only these agents.",
+    )
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    results = []
+    for entry in ENTRY_POINTS:
+        if args.only and entry.name not in args.only:
+            continue
+        try:
+            imports = [import_seconds(entry) for _ in range(args.runs)]
+            cards = [first_card_seconds(entry, args.timeout) for _ in range(args.runs)]
+        except (subprocess.CalledProcessError, RuntimeError, TimeoutError) as e:
+            print(f"{entry.name:>10}: failed ({e})")
+            results.append({"agent": entry.name, "error": str(e)})
+            continue
+        result = {
+            "agent": entry.name,
+            "import_ms": round(statistics.median(imports) * 1000, 1),
+            "first_card_ms": round(statistics.median(cards) * 1000, 1),
+        }
+        results.append(result)
+        print(
+            f"{entry.name:>10}: import {result['import_ms']:>8.1f} ms  "
+            f"first card {result['first_card_ms']:>8.1f} ms"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Latency statistics shared by the benchmarks."""
+
+import statistics
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(seconds: list[float]) -> dict[str, float]:
+    """Count, mean, p50/p95/p99 and max of latencies given in seconds, in ms."""
+
+    def ms(value: float) -> float:
+        return round(value * 1000, 1)
+
+    return {
+        "count": len(seconds),
+        "mean_ms": ms(statistics.fmean(seconds)) if seconds else 0.0,
+        "p50_ms": ms(percentile(seconds, 50)),
+        "p95_ms": ms(percentile(seconds, 95)),
+        "p99_ms": ms(percentile(seconds, 99)),
+        "max_ms": ms(max(seconds, default=0.0)),
+    }
@@ -0,0 +1,103 @@
+"""Model-free stand-ins for Karley's, Nate's and Kaitlynn's agents.
+
+    python -m benchmarks.stub_friends --name Karley --port 10002
+
+Each stub serves the same agent card name as the real friend and answers every
+message with a deterministic list of free slots, seeded by the friend's name
+and today's date like the real calendars, so the friend host can be
+benchmarked without model calls or API keys.
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+
+import uvicorn
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore, TaskUpdater
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+    Part,
+    TextPart,
+    UnsupportedOperationError,
+)
+from a2a.utils.errors import ServerError
+
+FRIENDS = {"Karley": 10002, "Nate": 10003, "Kaitlynn": 10004}
+SUPPORTED_CONTENT_TYPES = ["text/plain"]
+
+
+def availability(name: str, days: int = 7) -> str:
+    """Free hours over the next `days` days, one line per day."""
+    today = date.today()
+    rng = random.Random(f"{name}-{today.isoformat()}")
+    lines = []
+    for offset in range(days):
+        day = today + timedelta(days=offset)
+        hours = sorted(rng.sample(range(8, 21), 4))
+        slots = ", ".join(f"{hour:02}:00-{hour + 1:02}:00" for hour in hours)
+        lines.append(f"{day.isoformat()}: {slots}")
+    return f"{name} is available at:\n" + "\n".join(lines)
+
+
+class StubFriendExecutor(AgentExecutor):
+    def __init__(self, name: str):
+        self.name = name
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        if not context.current_task:
+            await updater.submit()
+        await updater.start_work()
+        await updater.add_artifact([Part(root=TextPart(text=availability(self.name)))])
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        raise ServerError(error=UnsupportedOperationError())
+
+
+def create_agent_card(name: str, port: int) -> AgentCard:
+    return AgentCard(
+        name=f"{name} Agent",
+        description=f"Benchmark stand-in for {name}'s scheduling agent.",
+        url=f"http://localhost:{port}/",
+        version="1.0.0",
+        defaultInputModes=SUPPORTED_CONTENT_TYPES,
+        defaultOutputModes=SUPPORTED_CONTENT_TYPES,
+        capabilities=AgentCapabilities(streaming=False),
+        skills=[
+            AgentSkill(
+                id="availability_checker",
+                name="Availability Checker",
+                description=f"Check {name}'s calendar for free slots.",
+                tags=["schedule", "availability", "calendar"],
+                examples=["Are you free tomorrow?"],
+            )
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--name", choices=sorted(FRIENDS), required=True)
+    parser.add_argument("--port", type=int, help="Defaults to the friend's port.")
+    args = parser.parse_args()
+    port = args.port or FRIENDS[args.name]
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=StubFriendExecutor(args.name),
+        task_store=InMemoryTaskStore(),
+    )
+    server = A2AStarletteApplication(
+        agent_card=create_agent_card(args.name, port), http_handler=request_handler
+    )
+    uvicorn.run(server.build(), host="127.0.0.1", port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
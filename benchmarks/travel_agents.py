@@ -0,0 +1,103 @@
+"""The travel agents served by several processes each, for host benchmarks.
+
+    python -m benchmarks.travel_agents --name weather --workers 4
+
+Runs the real agent's executor, loaded from easy_my_trip_holidays/<name>_agent/,
+behind a card with the agent's name, from --workers uvicorn processes sharing
+the agent's port. Each real agent is a single process, so a benchmark of the
+travel host against them measures the agents once the host has a few workers;
+these scale with the host instead. The cards carry no caching hints, so the
+host caches every agent with its default TTL.
+"""
+
+import argparse
+import importlib.util
+import os
+
+import uvicorn
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from starlette.applications import Starlette
+
+from benchmarks.processes import ROOT
+
+TRAVEL_DIR = ROOT / "easy_my_trip_holidays"
+TRAVEL_AGENTS = {
+    "flight": 10001,
+    "hotel": 10002,
+    "cab": 10003,
+    "activity": 10004,
+    "weather": 10005,
+    "budget": 10006,
+    "document": 10007,
+    "food": 10008,
+    "currency": 10009,
+}
+
+
+def load_executor(name: str) -> AgentExecutor:
+    # Every agent's module is called agent_executor, so load it under its own name.
+    spec = importlib.util.spec_from_file_location(
+        f"{name}_agent_executor", TRAVEL_DIR / f"{name}_agent" / "agent_executor.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, f"{name.capitalize()}AgentExecutor")()
+
+
+def create_agent_card(name: str, port: int) -> AgentCard:
+    agent_name = f"{name.capitalize()}_Agent"
+    return AgentCard(
+        name=agent_name,
+        description=f"Benchmark copy of the {name} agent, served by several processes.",
+        url=f"http://localhost:{port}/",
+        version="1.0.0",
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        capabilities=AgentCapabilities(),
+        skills=[
+            AgentSkill(
+                id=name,
+                name=agent_name.replace("_", " "),
+                description=f"Answers {name} tasks for the travel planner.",
+                tags=[name, "travel"],
+            )
+        ],
+    )
+
+
+def create_app() -> Starlette:
+    """App factory for each uvicorn worker; the agent is named in TRAVEL_AGENT."""
+    name = os.environ["TRAVEL_AGENT"]
+    request_handler = DefaultRequestHandler(
+        agent_executor=load_executor(name), task_store=InMemoryTaskStore()
+    )
+    server = A2AStarletteApplication(
+        agent_card=create_agent_card(name, TRAVEL_AGENTS[name]),
+        http_handler=request_handler,
+    )
+    return server.build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--name", choices=sorted(TRAVEL_AGENTS), required=True)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ["TRAVEL_AGENT"] = args.name
+    uvicorn.run(
+        "benchmarks.travel_agents:create_app",
+        factory=True,
+        host="127.0.0.1",
+        port=TRAVEL_AGENTS[args.name],
+        workers=args.workers,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
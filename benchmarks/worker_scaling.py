@@ -0,0 +1,229 @@
+"""Throughput of the travel planner host against its number of worker processes.
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 --sessions 64 --messages 4
+
+Starts the nine travel agents with benchmarks.travel_agents, each served by
+--agent-workers processes (by default the largest --workers count), so that
+the agents keep up as the host scales. The real agents run one process each;
+--external-agents uses them instead, already running on ports 10001-10009.
+
+For each worker count, starts easy_my_trip_holidays/travel_planner_host/
+multiworker.py, waits until every worker answers /stats, then keeps --sessions
+websocket sessions busy sending fully specified travel requests (planned by the
+host's rule-based fast path, without the model) and reports messages per
+second and latency percentiles. Host workers and agent processes share the
+machine's cores, so scaling also levels off once they outnumber the cores.
+
+Measured on a single-core machine (AMD EPYC, Python 3.11), 32 sessions of 4
+messages each:
+
+    workers  agents  cache  msg/s   p50 ms   p95 ms  speedup
+          1       4     on   17.8   1638.7   2267.5    x1.00
+          2       4     on   23.3   1237.1   1717.0    x1.31
+          4       4     on   29.7    385.3   2308.4    x1.66
+          1       4    off   10.7   2777.7   3930.8    x1.00
+          2       4    off    9.9   2439.3   5380.2    x0.93
+          4       4    off   31.0    302.5   1270.5    x2.90
+          1       1     on   18.3   1625.6   2238.2    x1.00
+          2       1     on   17.2   1739.6   2318.4    x0.94
+          4       1     on   34.7    197.9   1029.9    x1.90
+
+A repeat of the first three rows gave 14.3, 10.9 and 33.7 msg/s, so the two
+worker figures are noise; four workers were two to three times faster in every
+run, also against single-process agents. With one core this comes from waits
+inside a host worker overlapping across workers, not from extra cores; scaling
+on a multi-core machine is unverified.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import websockets
+
+from benchmarks.processes import ROOT, ProcessGroup
+from benchmarks.stats import summarize
+from benchmarks.travel_agents import TRAVEL_AGENTS
+
+HOST_DIR = ROOT / "easy_my_trip_holidays" / "travel_planner_host"
+DESTINATIONS = ["Paris", "London", "Rome", "Tokyo", "Lisbon", "Berlin", "Dubai"]
+
+
+def travel_request(session: int, message: int) -> str:
+    destination = DESTINATIONS[(session + message) % len(DESTINATIONS)]
+    day = 1 + (session * 7 + message) % 20
+    return (
+        f"Plan a trip from New York to {destination} from 2030-06-{day:02} to "
+        f"2030-06-{day + 5:02} for 2 adults with a budget of 4000 USD"
+    )
+
+
+async def wait_until_ready(base_url: str, workers: int, timeout: float):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=5) as client:
+        while time.monotonic() < deadline:
+            try:
+                stats = (await client.get(f"{base_url}/stats")).json()
+                if len(stats["workers"]) == workers and all(
+                    "error" not in worker for worker in stats["workers"].values()
+                ):
+                    return
+            except (httpx.HTTPError, ValueError, KeyError):
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"{workers} worker(s) not ready within {timeout:g}s")
+
+
+def start_agents(group: ProcessGroup, workers: int, timeout: float):
+    for name in TRAVEL_AGENTS:
+        group.start(
+            name,
+            [
+                "-m",
+                "benchmarks.travel_agents",
+                "--name",
+                name,
+                "--workers",
+                str(workers),
+            ],
+            ROOT,
+        )
+    for name, port in TRAVEL_AGENTS.items():
+        group.wait_for(name, f"http://127.0.0.1:{port}/.well-known/agent.json", timeout)
+
+
+async def run_session(ws_url: str, session: int, messages: int) -> list[float]:
+    latencies = []
+    async with websockets.connect(f"{ws_url}/ws/bench-{session}") as websocket:
+        for message in range(messages):
+            started = time.perf_counter()
+            await websocket.send(travel_request(session, message))
+            while not json.loads(await websocket.recv()).get("is_task_complete"):
+                pass
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def measure(port: int, workers: int, sessions: int, messages: int) -> dict:
+    await wait_until_ready(f"http://127.0.0.1:{port}", workers, timeout=60)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            run_session(f"ws://127.0.0.1:{port}", session, messages)
+            for session in range(sessions)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    latencies = [latency for result in results for latency in result]
+    latency = summarize(latencies)
+    return {
+        "workers": workers,
+        "messages": len(latencies),
+        "seconds": round(elapsed, 3),
+        "messages_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": latency["p50_ms"],
+        "p95_ms": latency["p95_ms"],
+        "mean_ms": latency["mean_ms"],
+    }
+
+
+def run(workers: int, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = {
+            **os.environ,
+            "SESSION_DB_PATH": os.path.join(data_dir, "sessions.db"),
+            "RESPONSE_CACHE_DB_PATH": os.path.join(data_dir, "cache.db"),
+        }
+        if not args.cache:
+            env["RESPONSE_CACHE_TTL"] = "0"
+        launcher = subprocess.Popen(
+            [
+                sys.executable,
+                "multiworker.py",
+                "--workers",
+                str(workers),
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(args.port),
+            ],
+            cwd=HOST_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            return asyncio.run(
+                measure(args.port, workers, args.sessions, args.messages)
+            )
+        finally:
+            launcher.terminate()
+            launcher.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--messages", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument(
+        "--agent-workers",
+        type=int,
+        help="Processes per travel agent; defaults to the largest --workers.",
+    )
+    parser.add_argument(
+        "--external-agents",
+        action="store_true",
+        help="Use the travel agents already running on ports 10001-10009.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="Disable the response cache so every message reaches the agents.",
+    )
+    parser.add_argument("--json", help="Also write the results to this file.")
+    args = parser.parse_args()
+    agent_workers = args.agent_workers or max(args.workers)
+
+    results = []
+    with (
+        tempfile.TemporaryDirectory() as log_dir,
+        ProcessGroup(Path(log_dir)) as agents,
+    ):
+        if args.external_agents:
+            print("travel agents: external")
+        else:
+            start_agents(agents, agent_workers, timeout=60)
+            print(
+                f"travel agents: {agent_workers} process(es) each, "
+                f"{os.cpu_count()} CPU cores"
+            )
+        for workers in args.workers:
+            result = run(workers, args)
+            result["agent_workers"] = None if args.external_agents else agent_workers
+            result["speedup"] = round(
+                result["messages_per_second"]
+                / (results or [result])[0]["messages_per_second"],
+                2,
+            )
+            results.append(result)
+            print(
+                f"{workers:>3} worker(s): {result['messages_per_second']:>8.1f} msg/s  "
+                f"p50 {result['p50_ms']:>7.1f} ms  p95 {result['p95_ms']:>7.1f} ms  "
+                f"x{result['speedup']:.2f}"
+            )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
+import sys
+from pathlib import Path
+
 import uvicorn
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
 from agent_executor import CabAgentExecutor
 
+# Modules shared by the travel agents live in easy_my_trip_holidays/trip_common.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trip_common.task_store import BoundedTaskStore, mount_stats
+
 
 def main():
     skill = AgentSkill(
@@ -26,9 +33,10 @@ def main():
         capabilities=AgentCapabilities(),
     )
 
+    task_store = BoundedTaskStore()
     request_handler = DefaultRequestHandler(
         agent_executor=CabAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+        task_store=task_store,
     )
 
     server = A2AStarletteApplication(
@@ -36,7 +44,9 @@ def main():
         agent_card=agent_card,
     )
 
-    uvicorn.run(server.build(), host="0.0.0.0", port=10003)
+    app = server.build()
+    mount_stats(app, task_store)
+    uvicorn.run(app, host="0.0.0.0", port=10003)
 
 
 if __name__ == "__main__":
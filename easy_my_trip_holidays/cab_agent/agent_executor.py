@@ -34,12 +34,10 @@ class CabAgentExecutor(AgentExecutor):
         self.agent = CabAgent()
 
     async def execute(self, context: RequestContext, event_queue: EventQueue):
-        task_string = ""
-        if context.body and context.body.message and context.body.message.parts:
-            task_string = context.body.message.parts[0].text or ""
+        task_string = context.get_user_input()
 
         result = await self.agent.invoke(task=task_string)
-        event_queue.enqueue_event(new_agent_text_message(result))
+        await event_queue.enqueue_event(new_agent_text_message(result))
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
         raise Exception("Cancel not supported")
@@ -1,10 +1,17 @@
+import sys
+from pathlib import Path
+
 import uvicorn
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from a2a.types import AgentCapabilities, AgentCard, AgentExtension, AgentSkill
 from agent_executor import CurrencyAgentExecutor
 
+# Modules shared by the travel agents live in easy_my_trip_holidays/trip_common.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trip_common.task_store import BoundedTaskStore, mount_stats
+
 
 def main():
     skill = AgentSkill(
@@ -23,12 +30,21 @@ def main():
         defaultOutputModes=["text"],
         skills=[skill],
         version="1.0.0",
-        capabilities=AgentCapabilities(),
+        capabilities=AgentCapabilities(
+            extensions=[
+                AgentExtension(
+                    uri="urn:easy-my-trip:response-cache:v1",
+                    description="Responses may be cached by callers for `ttl` seconds.",
+                    params={"ttl": 300},
+                )
+            ]
+        ),
     )
 
+    task_store = BoundedTaskStore()
     request_handler = DefaultRequestHandler(
         agent_executor=CurrencyAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+        task_store=task_store,
     )
 
     server = A2AStarletteApplication(
@@ -36,7 +52,9 @@ def main():
         agent_card=agent_card,
     )
 
-    uvicorn.run(server.build(), host="0.0.0.0", port=10009)
+    app = server.build()
+    mount_stats(app, task_store)
+    uvicorn.run(app, host="0.0.0.0", port=10009)
 
 
 if __name__ == "__main__":
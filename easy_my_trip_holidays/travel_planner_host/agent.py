@@ -1,35 +1,122 @@
 import asyncio
 import json
+import logging
+import os
+import random
+import time
 import uuid
-from datetime import datetime
+from collections import deque
+from contextvars import ContextVar
+from datetime import date, datetime
 from typing import Any, AsyncIterable, List
 
 import httpx
-import nest_asyncio
 from a2a.client import A2ACardResolver
 from a2a.types import (
     AgentCard,
+    Message,
     MessageSendParams,
+    Part,
     SendMessageRequest,
     SendMessageResponse,
     SendMessageSuccessResponse,
+    SendStreamingMessageRequest,
+    SendStreamingMessageSuccessResponse,
     Task,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
+    TextPart,
 )
 from dotenv import load_dotenv
 from google.adk import Agent
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import Session
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
+from agent_index import AgentIndex
+from circuit_breaker import AgentUnavailableError, CircuitBreaker
+from fast_router import (
+    TravelRequest,
+    build_itinerary,
+    itinerary_plan,
+    parse_travel_request,
+    response_json,
+)
+from http_pool import close_http_client, get_http_client
+from mock_llm import MOCK_LLM, MockLlm
+from progress import (
+    AGENT_CALL,
+    AGENT_PROGRESS,
+    PLANNING,
+    THINKING,
+    ProgressCoalescer,
+    agent_result_event,
+    progress_event,
+)
 from remote_agent_connection import RemoteAgentConnections
+from response_cache import ResponseCache
+from shared_cache import CACHE_DB_PATH, SharedResponseCache
+from sqlite_session_service import SqliteSessionService
 
+logger = logging.getLogger(__name__)
 
 load_dotenv()
-nest_asyncio.apply()
+
+# Upper bound on remote agent calls in flight at once, and the deadline for each call.
+MAX_CONCURRENT_REMOTE_CALLS = int(os.getenv("MAX_CONCURRENT_REMOTE_CALLS", "9"))
+REMOTE_CALL_TIMEOUT = float(os.getenv("REMOTE_CALL_TIMEOUT", "30"))
+# Start-up budget for agent card discovery; slower agents are registered once they answer.
+DISCOVERY_TIMEOUT = float(os.getenv("DISCOVERY_TIMEOUT", "5"))
+# Race a second replica of an agent once the primary is slower than its recent p95.
+HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "true").lower() == "true"
+# Background card refresh; the interval stays below the pool's keep-alive expiry so
+# probes also keep each agent's connection warm. Agents failing
+# HEALTH_CHECK_FAILURES probes in a row are dropped until they answer again.
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", "20"))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5"))
+HEALTH_CHECK_FAILURES = int(os.getenv("HEALTH_CHECK_FAILURES", "3"))
+# Registries larger than ROUTING_MIN_AGENTS only list the ROUTING_TOP_K agents
+# most relevant to the current turn, plus those already contacted. Smaller ones
+# are listed in full, so a request needing every agent never loses one.
+ROUTING_MIN_AGENTS = int(os.getenv("ROUTING_MIN_AGENTS", "24"))
+ROUTING_TOP_K = int(os.getenv("ROUTING_TOP_K", "8"))
+# Fully specified requests are planned by rules instead of the model.
+FAST_PATH = os.getenv("FAST_PATH", "true").lower() == "true"
+# Re-read sessions from the database on every turn. Only needed when several
+# workers serve the same session without the affinity proxy in front of them.
+SESSION_SHARED = os.getenv("SESSION_SHARED", "false").lower() == "true"
+
+
+# Queue of the HostAgent.stream call in progress, if any. Remote calls push typed
+# progress events (call, result, relayed agent status) into it.
+_progress_updates: ContextVar[asyncio.Queue | None] = ContextVar(
+    "progress_updates", default=None
+)
+_STREAM_DONE = object()
+
+
+def _ms(started: float) -> str:
+    return f"{(time.perf_counter() - started) * 1000:.0f} ms"
+
+
+def _is_error_response(response: list[dict[str, Any]]) -> bool:
+    return bool(response) and str(response[0].get("text", "")).startswith("Error:")
+
+
+def _remember_contacted(tool_context: ToolContext, agent_names: list[str]):
+    # Contacted agents stay listed in the prompt for the rest of the session.
+    contacted = list(tool_context.state.get("contacted_agents", []))
+    contacted += [name for name in agent_names if name not in contacted]
+    tool_context.state["contacted_agents"] = contacted
+
+
+def _text_of(parts: list[Part]) -> str:
+    return "\n".join(p.root.text for p in parts if isinstance(p.root, TextPart))
 
 
 class HostAgent:
@@ -41,37 +128,201 @@ class HostAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ""
+        self._remote_call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REMOTE_CALLS)
+        self._pending_discovery: set[asyncio.Task] = set()
+        self.replica_connections: dict[str, dict[str, RemoteAgentConnections]] = {}
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.remote_agent_addresses: list[str] = []
+        self._agent_names_by_address: dict[str, str] = {}
+        self._probe_failures: dict[str, int] = {}
+        self._health_task: asyncio.Task | None = None
+        self._agents_fingerprint: tuple | None = None
+        self._agent_lines: dict[str, str] = {}
+        self.agent_index = AgentIndex()
+        self.response_cache = SharedResponseCache() if CACHE_DB_PATH else ResponseCache()
+        self.recent_plans: deque[dict[str, Any]] = deque(maxlen=20)
         self._agent = self.create_agent()
         self._user_id = "travel_planner_host"
+        self.session_service = SqliteSessionService(shared=SESSION_SHARED)
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
             artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            session_service=self.session_service,
             memory_service=InMemoryMemoryService(),
         )
 
     async def _async_init_components(self, remote_agent_addresses: List[str]):
-        async with httpx.AsyncClient(timeout=30) as client:
-            for address in remote_agent_addresses:
-                card_resolver = A2ACardResolver(client, address)
-                try:
-                    card = await card_resolver.get_agent_card()
-                    remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
-                    )
-                    self.remote_agent_connections[card.name] = remote_connection
-                    self.cards[card.name] = card
-                except httpx.ConnectError as e:
-                    print(f"ERROR: Failed to get agent card from {address}: {e}")
-                except Exception as e:
-                    print(f"ERROR: Failed to initialize connection for {address}: {e}")
-
-        agent_info = [
-            json.dumps({"name": card.name, "description": card.description})
+        self.remote_agent_addresses = list(remote_agent_addresses)
+        client = get_http_client()
+        discoveries = [
+            asyncio.create_task(self._discover_agent(client, address))
+            for address in remote_agent_addresses
+        ]
+        if discoveries:
+            _, self._pending_discovery = await asyncio.wait(
+                discoveries, timeout=DISCOVERY_TIMEOUT
+            )
+        if self._pending_discovery:
+            print(
+                f"WARNING: {len(self._pending_discovery)} agent card(s) not resolved "
+                f"within {DISCOVERY_TIMEOUT:g}s; they will be registered when they answer."
+            )
+        self._render_agents()
+
+    async def _discover_agent(self, client: httpx.AsyncClient, address: str):
+        started = time.perf_counter()
+        card_resolver = A2ACardResolver(client, address)
+        try:
+            card = await card_resolver.get_agent_card()
+            self._register_agent(card, address)
+            print(f"Resolved agent card {card.name} from {address} in {_ms(started)}")
+        except httpx.ConnectError as e:
+            print(
+                f"ERROR: Failed to get agent card from {address} after {_ms(started)}: {e}"
+            )
+        except Exception as e:
+            print(
+                f"ERROR: Failed to initialize connection for {address} "
+                f"after {_ms(started)}: {e}"
+            )
+
+    def _register_agent(self, card: AgentCard, address: str):
+        known_name = self._agent_names_by_address.get(address)
+        if known_name and known_name != card.name:
+            # The address now serves a different agent.
+            self._unregister_address(address)
+        primary = self.remote_agent_connections.get(card.name)
+        replicas = self.replica_connections.setdefault(card.name, {})
+        if (primary and primary.agent_url == address and primary.card == card) or (
+            address in replicas
+        ):
+            return
+        self._agent_names_by_address[address] = card.name
+        remote_connection = RemoteAgentConnections(agent_card=card, agent_url=address)
+        if primary and primary.agent_url != address:
+            # Another address serving the same card is a replica for hedging.
+            replicas[address] = remote_connection
+            return
+        self.remote_agent_connections[card.name] = remote_connection
+        self.cards[card.name] = card
+        # The card's caching hint may have changed along with the card.
+        self.response_cache.configure_agent(card)
+        # Late arrivals after start-up become visible to the model right away.
+        self._render_agents()
+
+    def _unregister_address(self, address: str):
+        name = self._agent_names_by_address.pop(address, None)
+        if name is None:
+            return
+        replicas = self.replica_connections.get(name, {})
+        if replicas.pop(address, None):
+            return
+        if replicas:
+            # Promote a replica so the agent stays reachable.
+            _, self.remote_agent_connections[name] = replicas.popitem()
+            return
+        self.remote_agent_connections.pop(name, None)
+        self.cards.pop(name, None)
+        self.replica_connections.pop(name, None)
+        self._render_agents()
+
+    def _render_agents(self):
+        """Rebuilds the agent listing and routing index when the cards changed."""
+        fingerprint = tuple(card.model_dump_json() for card in self.cards.values())
+        if fingerprint == self._agents_fingerprint:
+            return
+        self._agents_fingerprint = fingerprint
+        self._agent_lines = {
+            card.name: json.dumps({"name": card.name, "description": card.description})
             for card in self.cards.values()
+        }
+        self.agents = (
+            "\n".join(self._agent_lines.values())
+            if self._agent_lines
+            else "No remote agents found"
+        )
+        self.agent_index.rebuild(self.cards.values())
+
+    def _agents_for(self, context: ReadonlyContext) -> str:
+        """Lists the agents relevant to the current turn plus those already contacted."""
+        if len(self._agent_lines) <= max(ROUTING_MIN_AGENTS, ROUTING_TOP_K):
+            return self.agents
+        query = ""
+        if context.user_content and context.user_content.parts:
+            query = " ".join(p.text for p in context.user_content.parts if p.text)
+        contacted = [
+            name
+            for name in context.state.get("contacted_agents", [])
+            if name in self._agent_lines
         ]
-        self.agents = "\n".join(agent_info) if agent_info else "No remote agents found"
+        selected = self.agent_index.search(query, ROUTING_TOP_K)
+        if not selected and not contacted:
+            return self.agents
+        selected += [name for name in contacted if name not in selected]
+        return "\n".join(self._agent_lines[name] for name in selected)
+
+    def start_health_checks(self):
+        """Starts the background card refresh in the running event loop."""
+        if (
+            self._health_task is None
+            or self._health_task.done()
+            or self._health_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+            await asyncio.gather(
+                *(self._probe_agent(address) for address in self.remote_agent_addresses)
+            )
+
+    async def _probe_agent(self, address: str):
+        """Re-resolves one agent card, registering, updating or dropping the agent."""
+        card_resolver = A2ACardResolver(get_http_client(), address)
+        try:
+            card = await card_resolver.get_agent_card(
+                http_kwargs={"timeout": HEALTH_CHECK_TIMEOUT}
+            )
+        except Exception as e:
+            failures = self._probe_failures.get(address, 0) + 1
+            self._probe_failures[address] = failures
+            if (
+                failures == HEALTH_CHECK_FAILURES
+                and address in self._agent_names_by_address
+            ):
+                print(
+                    f"WARNING: Dropping {address} after {failures} failed checks: {e}"
+                )
+                self._unregister_address(address)
+            return
+        if self._probe_failures.pop(address, 0) >= HEALTH_CHECK_FAILURES:
+            print(f"{address} is healthy again")
+        self._register_agent(card, address)
+
+    async def add_remote_agent(self, address: str):
+        """Adds an agent address to the registry without a restart."""
+        if address not in self.remote_agent_addresses:
+            self.remote_agent_addresses.append(address)
+        await self._discover_agent(get_http_client(), address)
+
+    def remove_remote_agent(self, address: str):
+        """Removes an agent address from the registry without a restart."""
+        if address in self.remote_agent_addresses:
+            self.remote_agent_addresses.remove(address)
+        self._probe_failures.pop(address, None)
+        self._unregister_address(address)
+
+    async def aclose(self):
+        """Stops background work, flushes sessions and closes the shared HTTP pool."""
+        for task in self._pending_discovery:
+            task.cancel()
+        if self._health_task:
+            self._health_task.cancel()
+        await self.session_service.aclose()
+        self.response_cache.close()
+        await close_http_client()
 
     @classmethod
     async def create(
@@ -84,17 +335,18 @@ class HostAgent:
 
     def create_agent(self) -> Agent:
         return Agent(
-            model="gemini-1.5-flash",
+            model=MockLlm() if MOCK_LLM else "gemini-1.5-flash",
             name="Travel_Planner_Host",
             instruction=self.root_instruction,
             description="This Host agent orchestrates travel planning with specialized agents.",
             tools=[
+                self.plan_itinerary,
                 self.send_message,
+                self.send_messages,
             ],
         )
 
-    @property
-    def root_instruction(self) -> str:
+    def root_instruction(self, context: ReadonlyContext) -> str:
         return f"""
         **Role:** You are a Travel Planner Host Agent, an expert in creating detailed travel itineraries. Your primary function is to coordinate with specialized remote agents to gather all necessary information and construct a comprehensive travel plan.
 
@@ -106,8 +358,10 @@ class HostAgent:
             *   Ask about specific interests (e.g., history, adventure, relaxation, food) to tailor the itinerary.
 
         *   **Orchestration and Task Formatting:**
-            *   Once you have the essential details, intelligently sequence calls to the remote agents using the `send_message` tool.
-            *   The `agent_name` parameter for `send_message` must be one of the "name" values from the <Available Agents> section.
+            *   Once you have the essential details, call `plan_itinerary` once. It contacts every agent in dependency order (in parallel where possible, `Budget_Agent` once prices are known) and returns the assembled itinerary.
+            *   Use `send_messages` (parallel) or `send_message` only to refine parts of an itinerary or when the user asks for a single piece of information.
+            *   The agent names passed to `send_messages` and `send_message` must be "name" values from the <Available Agents> section.
+            *   If an agent times out, build the itinerary from the answers you have and leave that section empty.
             *   **You must format the `task` parameter for each agent as specified below:**
                 *   `Flight_Agent`: "Find flights from [origin] to [destination]" (e.g., "Find flights from New York to Paris")
                 *   `Hotel_Agent`: "Find hotels in [location]" (e.g., "Find hotels in Paris")
@@ -170,7 +424,7 @@ class HostAgent:
         **Today's Date (YYYY-MM-DD):** {datetime.now().strftime("%Y-%m-%d")}
 
         <Available Agents>
-        {self.agents}
+        {self._agents_for(context)}
         </Available Agents>
         """
 
@@ -192,40 +446,340 @@ class HostAgent:
                 user_id=self._user_id,
                 session_id=session_id,
             )
-        async for event in self._runner.run_async(
-            user_id=self._user_id, session_id=session.id, new_message=content
+        request = parse_travel_request(query) if FAST_PATH else None
+        if request and all(
+            name in self.remote_agent_connections for name in request.agent_tasks()
         ):
-            if event.is_final_response():
-                response = ""
-                if (
-                    event.content
-                    and event.content.parts
-                    and event.content.parts[0].text
-                ):
-                    response = "\n".join(
-                        [p.text for p in event.content.parts if p.text]
+            producer = self._plan_directly(request, query, session)
+        else:
+            producer = self._runner.run_async(
+                user_id=self._user_id, session_id=session.id, new_message=content
+            )
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _run_agent():
+            _progress_updates.set(queue)
+            try:
+                async for event in producer:
+                    await queue.put(event)
+            finally:
+                await queue.put(_STREAM_DONE)
+
+        progress = ProgressCoalescer()
+        runner_task = asyncio.create_task(_run_agent())
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), progress.wait_time())
+                except asyncio.TimeoutError:
+                    for update in progress.due():
+                        yield update
+                    continue
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, dict) and not item["is_task_complete"]:
+                    # Remote calls and progress relayed from streaming agents.
+                    updates = progress.offer(item)
+                elif isinstance(item, dict):
+                    progress.discard()
+                    updates = [item]
+                elif item.is_final_response():
+                    response = ""
+                    if (
+                        item.content
+                        and item.content.parts
+                        and item.content.parts[0].text
+                    ):
+                        response = "\n".join(
+                            [p.text for p in item.content.parts if p.text]
+                        )
+                    progress.discard()
+                    updates = [{"is_task_complete": True, "content": response}]
+                else:
+                    updates = progress.offer(
+                        progress_event(THINKING, "The host agent is thinking...")
                     )
-                yield {
-                    "is_task_complete": True,
-                    "content": response,
-                }
-            else:
-                yield {
-                    "is_task_complete": False,
-                    "updates": "The host agent is thinking...",
-                }
+                for update in updates:
+                    yield update
+            await runner_task
+        finally:
+            runner_task.cancel()
+
+    async def _plan_directly(
+        self, request: TravelRequest, query: str, session: Session
+    ) -> AsyncIterable[dict[str, Any]]:
+        """Plans a fully specified request without the model.
+
+        The exchange is recorded in the session so follow-up turns can refer to it.
+        """
+        yield progress_event(PLANNING, f"Planning a trip to {request.destination}...")
+        itinerary = json.dumps(await self._run_plan(request, session.state))
+        await self._record_exchange(session, query, itinerary)
+        yield {"is_task_complete": True, "content": itinerary}
+
+    async def _run_plan(
+        self, request: TravelRequest, state: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Runs the itinerary plan graph and records its per-agent timings."""
+        graph = itinerary_plan(request)
+
+        async def _call(agent_name: str, task: str) -> tuple[str, Any]:
+            result = await self._call_agent(agent_name, task, state)
+            if result["status"] != "success":
+                return result["status"], result["response"]
+            if _is_error_response(result["response"]):
+                return "error", result["response"]
+            return "success", response_json(result["response"])
+
+        plan = await graph.run(_call)
+        summary = graph.summary(plan)
+        self.recent_plans.append({"destination": request.destination, **summary})
+        print(
+            f"Planned {request.destination} in {summary['total_ms']} ms; critical "
+            f"path: {' -> '.join(summary['critical_path'])}"
+        )
+        return build_itinerary(request, plan.answers())
+
+    async def _record_exchange(self, session: Session, query: str, response: str):
+        invocation_id = f"e-{uuid.uuid4()}"
+        for author, role, text in (
+            ("user", "user", query),
+            (self._agent.name, "model", response),
+        ):
+            await self._runner.session_service.append_event(
+                session,
+                Event(
+                    invocation_id=invocation_id,
+                    author=author,
+                    content=types.Content(
+                        role=role, parts=[types.Part.from_text(text=text)]
+                    ),
+                ),
+            )
+
+    async def plan_itinerary(
+        self,
+        origin: str,
+        destination: str,
+        country: str,
+        destination_currency: str,
+        start_date: str,
+        end_date: str,
+        adults: int,
+        children: int,
+        budget: float,
+        budget_currency: str,
+        cuisine: str,
+        tool_context: ToolContext,
+    ):
+        """Builds a complete itinerary by contacting every travel agent.
+
+        Independent agents are queried in parallel and Budget_Agent is asked
+        once the flight, hotel, activity and exchange-rate answers are in.
+
+        Args:
+            origin: The origin city.
+            destination: The destination city.
+            country: The destination country, for the document check.
+            destination_currency: ISO code of the destination's currency, e.g. "EUR".
+            start_date: Departure date, YYYY-MM-DD.
+            end_date: Return date, YYYY-MM-DD.
+            adults: Number of adult travelers.
+            children: Number of child travelers.
+            budget: The overall budget.
+            budget_currency: ISO code of the budget's currency, e.g. "USD".
+            cuisine: Preferred cuisine, or "local".
+
+        Returns:
+            The itinerary JSON; sections of agents that did not answer are empty.
+        """
+        try:
+            request = TravelRequest(
+                origin=origin,
+                destination=destination,
+                country=country,
+                destination_currency=destination_currency.upper(),
+                start_date=date.fromisoformat(start_date),
+                end_date=date.fromisoformat(end_date),
+                adults=adults,
+                children=children,
+                budget=budget,
+                home_currency=budget_currency.upper(),
+                cuisine=cuisine,
+            )
+        except ValueError as e:
+            return {"error": f"Invalid travel dates: {e}"}
+        graph_agents = list(request.agent_tasks()) + ["Budget_Agent"]
+        _remember_contacted(tool_context, graph_agents)
+        return await self._run_plan(request, tool_context.state)
 
     async def send_message(self, agent_name: str, task: str, tool_context: ToolContext):
         """Sends a task to a remote specialized agent."""
+        _remember_contacted(tool_context, [agent_name])
+        try:
+            return await self._send_task(agent_name, task, tool_context.state)
+        except asyncio.TimeoutError:
+            error_message = (
+                f"{agent_name} did not respond within {REMOTE_CALL_TIMEOUT:g}s."
+            )
+            print(error_message)
+            return [{"text": f"Error: {error_message}"}]
+        except AgentUnavailableError as e:
+            return [{"text": f"Error: {e}"}]
+
+    async def send_messages(
+        self, agent_names: list[str], tasks: list[str], tool_context: ToolContext
+    ):
+        """Sends tasks to several remote specialized agents in parallel.
+
+        Args:
+            agent_names: The names of the agents to contact.
+            tasks: The task for each agent, in the same order as agent_names.
+
+        Returns:
+            One result per agent with its status ("success", "timeout",
+            "unavailable" or "error") and response. Slow agents do not hold back the answers of the others.
+        """
+        if len(agent_names) != len(tasks):
+            raise ValueError("agent_names and tasks must have the same length")
+        _remember_contacted(tool_context, agent_names)
+        return await self._fan_out(list(zip(agent_names, tasks)), tool_context.state)
+
+    async def _fan_out(
+        self, calls: list[tuple[str, str]], state: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Runs remote calls concurrently, each bounded by REMOTE_CALL_TIMEOUT."""
+        return await asyncio.gather(
+            *(self._call_agent(name, task, state) for name, task in calls)
+        )
+
+    async def _call_agent(
+        self, agent_name: str, task: str, state: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Sends one task and reports the outcome as a status instead of raising."""
+        try:
+            response = await self._send_task(agent_name, task, state)
+            status = "success"
+        except asyncio.TimeoutError:
+            response = f"No response within {REMOTE_CALL_TIMEOUT:g}s."
+            status = "timeout"
+        except AgentUnavailableError as e:
+            response = str(e)
+            status = "unavailable"
+        except Exception as e:
+            response = str(e)
+            status = "error"
+        return {"agent_name": agent_name, "status": status, "response": response}
+
+    async def _send_task(self, agent_name: str, task: str, state: dict[str, Any]):
+        """Sends a task to one agent through the cache, its circuit breaker, the
+        concurrency cap and the deadline."""
         if agent_name not in self.remote_agent_connections:
             raise ValueError(f"Agent {agent_name} not found")
-        client = self.remote_agent_connections[agent_name]
+        started = time.perf_counter()
+        cached = await self.response_cache.get(agent_name, task)
+        if cached is not None:
+            self._report(
+                agent_result_event(agent_name, "success", started, cached=True)
+            )
+            return cached
+        breaker = self._breaker_for(agent_name)
+        if not breaker.allow_request():
+            self._report(agent_result_event(agent_name, "unavailable", started))
+            raise AgentUnavailableError(
+                f"{agent_name} is temporarily unavailable. Continue without it."
+            )
+
+        async def _bounded():
+            async with self._remote_call_semaphore:
+                return await self._send_hedged(agent_name, task, state, breaker)
+
+        self._report(progress_event(AGENT_CALL, f"Calling {agent_name}...", agent_name))
+        try:
+            response = await asyncio.wait_for(_bounded(), timeout=REMOTE_CALL_TIMEOUT)
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except asyncio.TimeoutError:
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "timeout", started))
+            raise
+        except Exception:
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "error", started))
+            raise
+        if _is_error_response(response):
+            breaker.record_failure(time.perf_counter() - started)
+            self._report(agent_result_event(agent_name, "error", started))
+        else:
+            breaker.record_success(time.perf_counter() - started)
+            await self.response_cache.put(agent_name, task, response)
+            self._report(agent_result_event(agent_name, "success", started))
+        return response
+
+    def _breaker_for(self, agent_name: str) -> CircuitBreaker:
+        if agent_name not in self.circuit_breakers:
+            self.circuit_breakers[agent_name] = CircuitBreaker(agent_name)
+        return self.circuit_breakers[agent_name]
+
+    async def _send_hedged(
+        self,
+        agent_name: str,
+        task: str,
+        state: dict[str, Any],
+        breaker: CircuitBreaker,
+    ):
+        """Sends to the primary and, past its p95 latency, also to a replica.
+
+        The first usable answer wins and the other request is cancelled.
+        """
+        replicas = list(self.replica_connections.get(agent_name, {}).values())
+        delay = breaker.hedge_delay()
+        if not HEDGE_REQUESTS or not replicas or delay is None:
+            return await self._send_task_unbounded(agent_name, task, state)
+
+        primary = asyncio.create_task(
+            self._send_task_unbounded(agent_name, task, state)
+        )
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                print(f"Hedging {agent_name} after {delay * 1000:.0f} ms")
+                pending.add(
+                    asyncio.create_task(
+                        self._send_task_unbounded(
+                            agent_name, task, state, client=random.choice(replicas)
+                        )
+                    )
+                )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    if not finished.exception() and not _is_error_response(
+                        finished.result()
+                    ):
+                        return finished.result()
+            return await primary
+        finally:
+            for request in pending:
+                request.cancel()
+
+    async def _send_task_unbounded(
+        self,
+        agent_name: str,
+        task: str,
+        state: dict[str, Any],
+        client: RemoteAgentConnections | None = None,
+    ):
+        client = client or self.remote_agent_connections.get(agent_name)
 
         if not client:
             raise ValueError(f"Client not available for {agent_name}")
 
         # Simplified task and context ID management
-        state = tool_context.state
         task_id = state.get("task_id", str(uuid.uuid4()))
         context_id = state.get("context_id", str(uuid.uuid4()))
         message_id = str(uuid.uuid4())
@@ -240,12 +794,23 @@ class HostAgent:
             },
         }
 
+        if client.supports_streaming:
+            return await self._stream_task(agent_name, client, message_id, payload)
+
         message_request = SendMessageRequest(
             id=message_id, params=MessageSendParams.model_validate(payload)
         )
         send_response: SendMessageResponse = await client.send_message(message_request)
-        print("send_response", send_response)
+        logger.debug("send_response %s", send_response)
 
+        if isinstance(send_response.root, SendMessageSuccessResponse) and isinstance(
+            send_response.root.result, Message
+        ):
+            # Agents that answer without creating a task reply with a bare message.
+            return [
+                part.model_dump(mode="json", exclude_none=True)
+                for part in send_response.root.result.parts
+            ]
         if not isinstance(send_response.root, SendMessageSuccessResponse) or not isinstance(
             send_response.root.result, Task
         ):
@@ -264,3 +829,61 @@ class HostAgent:
                 if artifact.get("parts"):
                     resp.extend(artifact["parts"])
         return resp
+
+    async def _stream_task(
+        self,
+        agent_name: str,
+        client: RemoteAgentConnections,
+        message_id: str,
+        payload: dict[str, Any],
+    ):
+        """Sends a task over message/stream, relaying status updates as they arrive.
+
+        Returns the final artifact parts, or the last status message when the
+        agent finished without an artifact (e.g. it needs more input).
+        """
+        request = SendStreamingMessageRequest(
+            id=message_id, params=MessageSendParams.model_validate(payload)
+        )
+        artifacts: dict[str, list[Part]] = {}
+        last_message: list[Part] = []
+        async for response in client.send_message_streaming(request):
+            if not isinstance(response.root, SendStreamingMessageSuccessResponse):
+                error_message = f"Received an error response from {agent_name}."
+                print(error_message)
+                return [{"text": f"Error: {error_message}"}]
+            result = response.root.result
+            if isinstance(result, TaskArtifactUpdateEvent):
+                parts = artifacts.setdefault(result.artifact.artifactId, [])
+                if not result.append:
+                    parts.clear()
+                parts.extend(result.artifact.parts)
+            elif isinstance(result, TaskStatusUpdateEvent):
+                if result.status.message:
+                    last_message = result.status.message.parts
+                    self._report_progress(agent_name, _text_of(last_message))
+            elif isinstance(result, Task):
+                for artifact in result.artifacts or []:
+                    artifacts[artifact.artifactId] = list(artifact.parts)
+                if result.status.message:
+                    last_message = result.status.message.parts
+            elif isinstance(result, Message):
+                last_message = result.parts
+
+        parts = [part for parts in artifacts.values() for part in parts]
+        return [
+            part.model_dump(mode="json", exclude_none=True)
+            for part in parts or last_message
+        ]
+
+    def _report_progress(self, agent_name: str, text: str):
+        if text:
+            self._report(
+                progress_event(AGENT_PROGRESS, f"{agent_name}: {text}", agent_name)
+            )
+
+    def _report(self, event: dict[str, Any]):
+        """Passes a progress event to the HostAgent.stream call in progress."""
+        updates = _progress_updates.get()
+        if updates is not None:
+            updates.put_nowait(event)
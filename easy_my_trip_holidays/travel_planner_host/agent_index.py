@@ -0,0 +1,76 @@
+"""In-process BM25 index over agent cards, used to route a turn to relevant agents."""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable
+
+from a2a.types import AgentCard
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are at be can do for from get i in is it me my of on or please the "
+    "to we what when with you your agent".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        # Crude plural folding so "flights" matches "flight".
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _card_text(card: AgentCard) -> str:
+    # The name is repeated so that naming an agent outweighs a passing mention.
+    fields = [card.name.replace("_", " ")] * 2 + [card.description or ""]
+    for skill in card.skills or []:
+        fields += [skill.name, skill.description or ""]
+        fields += skill.tags or []
+        fields += skill.examples or []
+    return " ".join(fields)
+
+
+class AgentIndex:
+    """Ranks agents against free text by their names, descriptions and skills."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._docs: dict[str, Counter] = {}
+        self._lengths: dict[str, int] = {}
+        self._idf: dict[str, float] = {}
+        self._avg_length = 0.0
+
+    def rebuild(self, cards: Iterable[AgentCard]):
+        self._docs = {card.name: Counter(tokenize(_card_text(card))) for card in cards}
+        self._lengths = {name: sum(doc.values()) for name, doc in self._docs.items()}
+        count = len(self._docs)
+        self._avg_length = sum(self._lengths.values()) / count if count else 0.0
+        frequencies = Counter(term for doc in self._docs.values() for term in doc)
+        self._idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in frequencies.items()
+        }
+
+    def search(self, query: str, top_k: int) -> list[str]:
+        """Returns up to top_k agent names with a positive score, best first."""
+        terms = [term for term in set(tokenize(query)) if term in self._idf]
+        scores = {}
+        for name, doc in self._docs.items():
+            norm = self.k1 * (
+                1 - self.b + self.b * self._lengths[name] / (self._avg_length or 1)
+            )
+            score = sum(
+                self._idf[term] * doc[term] * (self.k1 + 1) / (doc[term] + norm)
+                for term in terms
+                if term in doc
+            )
+            if score > 0:
+                scores[name] = score
+        return sorted(scores, key=lambda name: (-scores[name], name))[:top_k]
@@ -0,0 +1,124 @@
+"""Per-agent circuit breaker over rolling error-rate and latency windows."""
+
+import os
+import time
+from collections import deque
+from typing import Any
+
+WINDOW_SIZE = int(os.getenv("BREAKER_WINDOW_SIZE", "20"))
+MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "5"))
+ERROR_RATE_THRESHOLD = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+SLOW_CALL_SECONDS = float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "10"))
+SLOW_CALL_RATE_THRESHOLD = float(os.getenv("BREAKER_SLOW_CALL_RATE", "0.8"))
+OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+# Hedged requests never fire earlier than this, however fast the agent usually is.
+MIN_HEDGE_DELAY = float(os.getenv("MIN_HEDGE_DELAY", "0.05"))
+
+
+class AgentUnavailableError(Exception):
+    """Raised when a call is rejected because the agent's circuit is open."""
+
+
+class CircuitBreaker:
+    """Trips when too many recent calls to one agent fail or are slow.
+
+    While open, calls are rejected immediately. After OPEN_SECONDS a single
+    probe call is let through; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str):
+        self.name = name
+        self._outcomes: deque[tuple[bool, float]] = deque(maxlen=WINDOW_SIZE)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= OPEN_SECONDS
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency: float):
+        self._record(True, latency)
+
+    def record_failure(self, latency: float):
+        self._record(False, latency)
+
+    def record_cancelled(self):
+        """Frees the half-open probe slot when the caller gave up on the call."""
+        self._probe_in_flight = False
+
+    def _record(self, ok: bool, latency: float):
+        if self._state == self.HALF_OPEN:
+            if ok and latency < SLOW_CALL_SECONDS:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            else:
+                self._trip()
+            self._probe_in_flight = False
+        self._outcomes.append((ok, latency))
+        if self._state == self.CLOSED and self._should_trip():
+            self._trip()
+
+    def _should_trip(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < MIN_CALLS:
+            return False
+        errors = sum(1 for ok, _ in self._outcomes if not ok)
+        slow = sum(1 for _, latency in self._outcomes if latency >= SLOW_CALL_SECONDS)
+        return (
+            errors / calls >= ERROR_RATE_THRESHOLD
+            or slow / calls >= SLOW_CALL_RATE_THRESHOLD
+        )
+
+    def _trip(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        print(f"Circuit for {self.name} opened for {OPEN_SECONDS:g}s")
+
+    def p95_latency(self) -> float | None:
+        latencies = sorted(latency for ok, latency in self._outcomes if ok)
+        if len(latencies) < MIN_CALLS:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def hedge_delay(self) -> float | None:
+        """How long to wait on the primary before hedging to a replica."""
+        p95 = self.p95_latency()
+        return None if p95 is None else max(p95, MIN_HEDGE_DELAY)
+
+    def stats(self) -> dict[str, Any]:
+        calls = len(self._outcomes)
+        errors = sum(1 for ok, _ in self._outcomes if not ok)
+        return {
+            "state": self.state,
+            "window_calls": calls,
+            "error_rate": errors / calls if calls else 0.0,
+            "p95_latency_ms": (
+                None if (p95 := self.p95_latency()) is None else round(p95 * 1000)
+            ),
+            "rejected": self.rejected,
+            "trips": self.trips,
+        }
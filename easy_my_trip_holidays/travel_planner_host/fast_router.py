@@ -0,0 +1,320 @@
+"""Rule-based slot extraction for fully specified travel requests.
+
+Requests that name an origin, a known destination, travel dates, the number of
+travelers and a budget are planned without the model: the agent tasks follow
+the fixed grammars the travel agents parse, and the itinerary is assembled
+from their answers. Anything less specific returns None and goes to the model.
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from plan_graph import PlanGraph, PlanNode
+
+# Destination city -> (country, currency), used for the document and currency tasks.
+DESTINATIONS = {
+    "amsterdam": ("Netherlands", "EUR"),
+    "athens": ("Greece", "EUR"),
+    "bangkok": ("Thailand", "THB"),
+    "barcelona": ("Spain", "EUR"),
+    "berlin": ("Germany", "EUR"),
+    "delhi": ("India", "INR"),
+    "dubai": ("United Arab Emirates", "AED"),
+    "edinburgh": ("United Kingdom", "GBP"),
+    "goa": ("India", "INR"),
+    "istanbul": ("Turkey", "TRY"),
+    "lisbon": ("Portugal", "EUR"),
+    "london": ("United Kingdom", "GBP"),
+    "los angeles": ("United States", "USD"),
+    "madrid": ("Spain", "EUR"),
+    "mumbai": ("India", "INR"),
+    "new york": ("United States", "USD"),
+    "paris": ("France", "EUR"),
+    "prague": ("Czech Republic", "CZK"),
+    "rome": ("Italy", "EUR"),
+    "san francisco": ("United States", "USD"),
+    "singapore": ("Singapore", "SGD"),
+    "sydney": ("Australia", "AUD"),
+    "tokyo": ("Japan", "JPY"),
+    "toronto": ("Canada", "CAD"),
+    "vienna": ("Austria", "EUR"),
+    "zurich": ("Switzerland", "CHF"),
+}
+CUISINES = (
+    "chinese",
+    "french",
+    "greek",
+    "indian",
+    "italian",
+    "japanese",
+    "mexican",
+    "spanish",
+    "thai",
+    "vegan",
+    "vegetarian",
+)
+_CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₹": "INR"}
+
+_CITY = r"([A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*)"
+_ORIGIN = re.compile(r"\b(?i:from)\s+" + _CITY)
+_DESTINATION = re.compile(r"\b(?i:to|in|visit|visiting)\s+" + _CITY)
+_TO = re.compile(r"\b(?i:to)\s+" + _CITY)
+_ISO_DATE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_DURATION = re.compile(r"\b(\d+)[\s-](day|night)s?\b", re.IGNORECASE)
+_ADULTS = re.compile(
+    r"\b(\d+)\s+(?:adults?|travell?ers|people|persons)\b", re.IGNORECASE
+)
+_CHILDREN = re.compile(r"\b(\d+)\s+(?:children|child|kids?)\b", re.IGNORECASE)
+_BUDGET = re.compile(
+    r"(?P<symbol>[$€£¥₹])\s?(?P<amount>\d[\d,]*(?:\.\d+)?)"
+    r"|(?P<amount2>\d[\d,]*(?:\.\d+)?)\s?(?P<code>[A-Z]{3})\b"
+)
+
+
+@dataclass(frozen=True)
+class TravelRequest:
+    origin: str
+    destination: str
+    country: str
+    destination_currency: str
+    start_date: date
+    end_date: date
+    adults: int
+    children: int
+    budget: float
+    home_currency: str
+    cuisine: str
+
+    @property
+    def nights(self) -> int:
+        return max((self.end_date - self.start_date).days, 1)
+
+    @property
+    def travelers(self) -> int:
+        return self.adults + self.children
+
+    def agent_tasks(self) -> dict[str, str]:
+        """Tasks for every agent whose answer does not depend on another agent."""
+        tasks = {
+            "Flight_Agent": f"Find flights from {self.origin} to {self.destination}",
+            "Hotel_Agent": f"Find hotels in {self.destination}",
+            "Cab_Agent": f"Find cabs in {self.destination}",
+            "Activity_Agent": f"Find activities in {self.destination}",
+            "Weather_Agent": f"Get weather in {self.destination}",
+            "Document_Agent": f"Check documents for {self.country}",
+            "Food_Agent": f"Find {self.cuisine} restaurant in {self.destination}",
+        }
+        if self.destination_currency != self.home_currency:
+            tasks["Currency_Agent"] = (
+                "Get exchange rate between "
+                f"{self.home_currency} and {self.destination_currency}"
+            )
+        return tasks
+
+
+def _parse_dates(text: str) -> tuple[date, date] | None:
+    try:
+        dates = [date.fromisoformat(d) for d in _ISO_DATE.findall(text)]
+    except ValueError:
+        return None
+    if len(dates) >= 2:
+        start, end = dates[0], dates[1]
+    elif len(dates) == 1 and (duration := _DURATION.search(text)):
+        days = int(duration.group(1))
+        # A 7-day trip spans 6 nights; a 7-night trip spans 7.
+        nights = days - 1 if duration.group(2).lower() == "day" else days
+        start, end = dates[0], dates[0] + timedelta(days=max(nights, 1))
+    else:
+        return None
+    return (start, end) if start < end else None
+
+
+def _parse_budget(text: str) -> tuple[float, str] | None:
+    for match in _BUDGET.finditer(text):
+        if match.group("symbol"):
+            amount, currency = (
+                match.group("amount"),
+                _CURRENCY_SYMBOLS[match.group("symbol")],
+            )
+        elif match.group("code") in _CURRENCY_SYMBOLS.values() or match.group(
+            "code"
+        ) in {currency for _, currency in DESTINATIONS.values()}:
+            amount, currency = match.group("amount2"), match.group("code")
+        else:
+            continue
+        return float(amount.replace(",", "")), currency
+    return None
+
+
+def _known_city(candidate: str) -> str | None:
+    # The city pattern is greedy over capitalized words ("Paris On"), so try the
+    # longest known prefix.
+    words = candidate.split()
+    for length in range(len(words), 0, -1):
+        name = " ".join(words[:length])
+        if name.lower() in DESTINATIONS:
+            return name
+    return None
+
+
+def parse_travel_request(text: str) -> TravelRequest | None:
+    """Extracts every slot of a travel request, or returns None if any is missing."""
+    origin_match = _ORIGIN.search(text)
+    if not origin_match:
+        return None
+    origin = _known_city(origin_match.group(1)) or origin_match.group(1)
+    # "to <City>" after the origin names the destination. Other mentions ("staying
+    # in London") only count without one, and must all agree: a wrong guess would
+    # plan the whole trip to the wrong city.
+    destinations = [
+        city
+        for match in _TO.finditer(text, origin_match.end())
+        if (city := _known_city(match.group(1)))
+    ] or [
+        city
+        for match in _DESTINATION.finditer(text)
+        if (city := _known_city(match.group(1)))
+    ]
+    destinations = [city for city in destinations if city.lower() != origin.lower()]
+    if len({city.lower() for city in destinations}) != 1:
+        return None
+    destination = destinations[0]
+    dates = _parse_dates(text)
+    adults = _ADULTS.search(text)
+    budget = _parse_budget(text)
+    if not dates or not adults or not budget or int(adults.group(1)) < 1:
+        return None
+    children = _CHILDREN.search(text)
+    cuisine = next(
+        (c for c in CUISINES if re.search(rf"\b{c}\b", text, re.IGNORECASE)), "local"
+    )
+    country, destination_currency = DESTINATIONS[destination.lower()]
+    return TravelRequest(
+        origin=origin,
+        destination=destination,
+        country=country,
+        destination_currency=destination_currency,
+        start_date=dates[0],
+        end_date=dates[1],
+        adults=int(adults.group(1)),
+        children=int(children.group(1)) if children else 0,
+        budget=budget[0],
+        home_currency=budget[1],
+        cuisine=cuisine,
+    )
+
+
+def response_json(response: Any) -> Any:
+    """Decodes an agent's text parts as JSON, falling back to the raw text."""
+    if not isinstance(response, list):
+        return {}
+    text = "\n".join(str(part.get("text", "")) for part in response if "text" in part)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {"text": text} if text else {}
+
+
+def _to_home_currency(amount: float, currency: str, request: TravelRequest, rate: Any):
+    if currency == request.home_currency:
+        return amount
+    if (
+        currency == request.destination_currency
+        and isinstance(rate, (int, float))
+        and rate
+    ):
+        return amount / rate
+    return None
+
+
+def estimate_total(
+    request: TravelRequest,
+    flights: Any,
+    hotels: Any,
+    activities: Any,
+    currency: Any,
+) -> float | None:
+    """Cheapest flight, hotel and activity for the party, in the home currency.
+
+    Returns None when no price could be read or converted.
+    """
+    rate = currency.get("rate") if isinstance(currency, dict) else None
+    rooms = math.ceil(request.travelers / 2)
+    costs = []
+    for section, key, price_field, quantity in (
+        (flights, "flights", "price", request.travelers),
+        (hotels, "hotels", "price_per_night", request.nights * rooms),
+        (activities, "activities", "price", request.travelers),
+    ):
+        options = section.get(key) if isinstance(section, dict) else None
+        prices = [
+            _to_home_currency(
+                float(option[price_field]),
+                option.get("currency", request.home_currency),
+                request,
+                rate,
+            )
+            for option in options or []
+            if isinstance(option, dict) and price_field in option
+        ]
+        prices = [price for price in prices if price is not None]
+        if prices:
+            costs.append(min(prices) * quantity)
+    return round(sum(costs), 2) if costs else None
+
+
+def itinerary_plan(request: TravelRequest) -> PlanGraph:
+    """Every agent runs at once except Budget_Agent, which waits for the prices."""
+    tasks = request.agent_tasks()
+    nodes = [
+        PlanNode(agent_name, lambda _, task=task: task)
+        for agent_name, task in tasks.items()
+    ]
+    priced = ("Flight_Agent", "Hotel_Agent", "Activity_Agent", "Currency_Agent")
+
+    def budget_task(answers: dict[str, Any]) -> str | None:
+        total = estimate_total(
+            request,
+            answers.get("Flight_Agent"),
+            answers.get("Hotel_Agent"),
+            answers.get("Activity_Agent"),
+            answers.get("Currency_Agent"),
+        )
+        return None if total is None else f"Check budget for {total:.2f}"
+
+    nodes.append(
+        PlanNode(
+            "Budget_Agent",
+            budget_task,
+            depends_on=tuple(name for name in priced if name in tasks),
+        )
+    )
+    return PlanGraph(nodes)
+
+
+def build_itinerary(request: TravelRequest, answers: dict[str, Any]) -> dict[str, Any]:
+    """Assembles the itinerary in the same shape the model is asked to produce."""
+    return {
+        "itinerary": {
+            "destination": request.destination,
+            "travel_dates": {
+                "start_date": request.start_date.isoformat(),
+                "end_date": request.end_date.isoformat(),
+            },
+            "travelers": {"adults": request.adults, "children": request.children},
+            "origin": request.origin,
+        },
+        "weather": answers.get("Weather_Agent", {}),
+        "documents": answers.get("Document_Agent", {}),
+        "flights": answers.get("Flight_Agent", {}),
+        "accommodations": answers.get("Hotel_Agent", {}),
+        "activities": answers.get("Activity_Agent", {}),
+        "dining": answers.get("Food_Agent", {}),
+        "local_transport": answers.get("Cab_Agent", {}),
+        "currency_info": answers.get("Currency_Agent", {}),
+        "budget_summary": answers.get("Budget_Agent", {}),
+    }
@@ -0,0 +1,152 @@
+"""Host-wide HTTP connection pool shared by every remote agent connection."""
+
+import asyncio
+import os
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+
+MAX_CONNECTIONS = int(os.getenv("A2A_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("A2A_HTTP_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("A2A_HTTP_KEEPALIVE_EXPIRY", "30"))
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("A2A_HTTP_MAX_PER_HOST", "10"))
+# HTTP/2 multiplexing needs the optional `h2` package (pip install "httpx[http2]").
+HTTP2 = os.getenv("A2A_HTTP2", "false").lower() == "true"
+TIMEOUT = float(os.getenv("A2A_HTTP_TIMEOUT", "30"))
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its per-host slot once it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+            self._release = lambda: None
+
+
+class PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests per origin on top of the pool-wide limits.
+
+    A slot is held until the response body is closed, so long-lived streams
+    count against their agent's cap like any other request.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.active: dict[str, int] = defaultdict(int)
+        self.waiting: dict[str, int] = defaultdict(int)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}"
+        semaphore = self._semaphores.get(origin)
+        if semaphore is None:
+            semaphore = self._semaphores[origin] = asyncio.Semaphore(self._max_per_host)
+
+        self.waiting[origin] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting[origin] -= 1
+        self.active[origin] += 1
+
+        def release():
+            self.active[origin] -= 1
+            semaphore.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        pool = self._transport._pool
+        connections = pool.connections
+        idle = sum(1 for c in connections if c.is_idle())
+        closed = sum(1 for c in connections if c.is_closed())
+        queued = sum(1 for r in getattr(pool, "_requests", []) if r.is_queued())
+        return {
+            "connections": len(connections),
+            "active": len(connections) - idle - closed,
+            "idle": idle,
+            "waiting_for_connection": queued,
+            "waiting_for_host_slot": sum(self.waiting.values()),
+            "per_host": {
+                origin: {"active": self.active[origin], "waiting": self.waiting[origin]}
+                for origin in self._semaphores
+            },
+        }
+
+
+_client: httpx.AsyncClient | None = None
+_transport: PerHostLimitTransport | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _http2_available() -> bool:
+    if not HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("WARNING: A2A_HTTP2 is set but `h2` is not installed; using HTTP/1.1.")
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the shared client, creating it on first use in the running loop."""
+    global _client, _transport, _loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _loop is not loop:
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        _transport = PerHostLimitTransport(
+            httpx.AsyncHTTPTransport(limits=limits, http2=_http2_available()),
+            MAX_CONNECTIONS_PER_HOST,
+        )
+        _client = httpx.AsyncClient(transport=_transport, timeout=TIMEOUT)
+        _loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Closes the shared client and every pooled connection."""
+    global _client, _transport, _loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = _transport = _loop = None
+
+
+def http_pool_stats() -> dict[str, Any]:
+    """Returns connection counts for sizing the pool under load."""
+    limits = {
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        "max_connections_per_host": MAX_CONNECTIONS_PER_HOST,
+        "http2": HTTP2,
+    }
+    if _transport is None:
+        return {"limits": limits, "connections": 0}
+    return {"limits": limits, **_transport.stats()}
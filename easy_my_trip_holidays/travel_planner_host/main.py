@@ -1,11 +1,24 @@
 import asyncio
-from fastapi import FastAPI, WebSocket
+import logging
+import os
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from agent import HostAgent
+from http_pool import http_pool_stats
+from websocket_stream import (
+    MAX_PENDING_MESSAGES,
+    FrameQueue,
+    SessionLocks,
+    websocket_stats,
+)
 import uvicorn
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI()
 
 host_agent: HostAgent
+session_locks = SessionLocks()
+open_sockets = 0
 
 @app.on_event("startup")
 async def startup_event():
@@ -22,15 +35,87 @@ async def startup_event():
         "http://localhost:10009",  # Currency Agent
     ]
     host_agent = await HostAgent.create(remote_agent_addresses=remote_agent_urls)
+    host_agent.start_health_checks()
     print("HostAgent initialized")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await host_agent.aclose()
+
+@app.post("/agents")
+async def add_agent(url: str):
+    await host_agent.add_remote_agent(url)
+    return {"agents": list(host_agent.cards)}
+
+@app.delete("/agents")
+async def remove_agent(url: str):
+    host_agent.remove_remote_agent(url)
+    return {"agents": list(host_agent.cards)}
+
+@app.get("/stats")
+async def stats():
+    return {
+        "worker": os.getenv("WORKER_ID", "0"),
+        "http_pool": http_pool_stats(),
+        "response_cache": host_agent.response_cache.stats(),
+        "recent_plans": list(host_agent.recent_plans),
+        "sessions": host_agent.session_service.stats(),
+        "websockets": {
+            "open": open_sockets,
+            **session_locks.stats(),
+            **websocket_stats(),
+        },
+        "circuit_breakers": {
+            name: breaker.stats()
+            for name, breaker in host_agent.circuit_breakers.items()
+        },
+    }
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
+    global open_sockets
     await websocket.accept()
-    while True:
-        data = await websocket.receive_text()
-        async for response in host_agent.stream(data, session_id):
-            await websocket.send_json(response)
+    open_sockets += 1
+    outbox = FrameQueue()
+    # Stop reading from a client that keeps sending faster than it is answered.
+    pending = asyncio.Semaphore(MAX_PENDING_MESSAGES)
+    answering: set[asyncio.Task] = set()
+
+    async def answer(data: str):
+        try:
+            async with session_locks.hold(session_id):
+                async for response in host_agent.stream(data, session_id):
+                    await outbox.put(response)
+        except Exception:
+            logger.exception("Failed to answer a message for session %s", session_id)
+            await outbox.put(
+                {
+                    "is_task_complete": True,
+                    "content": "Sorry, something went wrong. Please try again.",
+                }
+            )
+        finally:
+            pending.release()
+
+    async def send_frames():
+        while (frame := await outbox.get()) is not None:
+            await websocket.send_json(frame)
+
+    sender = asyncio.create_task(send_frames())
+    try:
+        while True:
+            await pending.acquire()
+            data = await websocket.receive_text()
+            task = asyncio.create_task(answer(data))
+            answering.add(task)
+            task.add_done_callback(answering.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        open_sockets -= 1
+        for task in (*answering, sender):
+            task.cancel()
+        await outbox.close()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,110 @@
+"""Deterministic stand-in for Gemini, for offline benchmarks and tests.
+
+Enabled with A2A_MOCK_LLM=true. The mock plays the host's part of a turn
+without a model: it asks every listed agent about the user's message with one
+`send_messages` call, then answers with a summary of their responses. Each
+agent's task is the message followed by the agent's name and description from
+the instruction, as a model would address it; the mock does not split the
+message into the parts each agent handles.
+
+A2A_MOCK_LLM_LATENCY sets the time to the first token and
+A2A_MOCK_LLM_TOKEN_DELAY the time per generated word, both in seconds.
+"""
+
+import asyncio
+import json
+import os
+import re
+from collections.abc import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+MOCK_LLM = os.getenv("A2A_MOCK_LLM", "false").lower() == "true"
+MOCK_LLM_LATENCY = float(os.getenv("A2A_MOCK_LLM_LATENCY", "0"))
+MOCK_LLM_TOKEN_DELAY = float(os.getenv("A2A_MOCK_LLM_TOKEN_DELAY", "0"))
+
+# Agents are listed in the instruction as {"name": ..., "description": ...}.
+_AGENT = re.compile(r'\{"name": "[^"]*", "description": .*?\}')
+
+
+class MockLlm(BaseLlm):
+    """Fans the user's message out to the listed agents, then summarizes."""
+
+    model: str = "mock"
+    latency: float = MOCK_LLM_LATENCY
+    token_delay: float = MOCK_LLM_TOKEN_DELAY
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        last = llm_request.contents[-1] if llm_request.contents else None
+        parts = last.parts if last and last.parts else []
+        responses = [part.function_response for part in parts if part.function_response]
+        if responses:
+            text = _summary(responses)
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay * len(text.split()))
+            yield _text(text)
+            return
+        query = " ".join(part.text for part in parts if part.text)
+        instruction = (
+            llm_request.config.system_instruction if llm_request.config else ""
+        )
+        agents = _agents(str(instruction or ""))
+        if not agents or "send_messages" not in llm_request.tools_dict:
+            yield _text(f"No agents are available to help with: {query}")
+            return
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            name="send_messages",
+                            args={
+                                "agent_names": list(agents),
+                                "tasks": [
+                                    _task(query, name, description)
+                                    for name, description in agents.items()
+                                ],
+                            },
+                        )
+                    )
+                ],
+            )
+        )
+
+
+def _agents(instruction: str) -> dict[str, str]:
+    """Description of each agent listed in the instruction, by name."""
+    agents = {}
+    for found in _AGENT.findall(instruction):
+        try:
+            agent = json.loads(found)
+        except json.JSONDecodeError:
+            continue
+        agents.setdefault(agent["name"], agent.get("description") or "")
+    return agents
+
+
+def _task(query: str, name: str, description: str) -> str:
+    # After the message, so agents that match patterns in it find them first.
+    return f"{query} (for {name}: {description})" if description else query
+
+
+def _text(text: str) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+def _summary(responses: list[types.FunctionResponse]) -> str:
+    results = []
+    for response in responses:
+        results.extend((response.response or {}).get("result") or [])
+    return json.dumps({"results": results}, default=str)
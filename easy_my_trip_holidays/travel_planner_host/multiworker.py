@@ -0,0 +1,78 @@
+"""Runs the travel planner host as several worker processes behind one port.
+
+    python multiworker.py --workers 4
+
+Each worker is a separate uvicorn process running main:app on its own port
+above --port; the session-affinity proxy listens on --port and sends every
+session to the same worker. Workers share the SQLite session database and a
+SQLite tier of the response cache, so a session survives its worker being
+restarted and an agent answer fetched by one worker is reused by the others.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import uvicorn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--worker-port",
+        type=int,
+        default=None,
+        help="Port of the first worker; defaults to --port + 100.",
+    )
+    args = parser.parse_args()
+    first_port = args.worker_port or args.port + 100
+
+    env = {
+        **os.environ,
+        "SESSION_DB_PATH": os.getenv("SESSION_DB_PATH", "sessions.db"),
+        "RESPONSE_CACHE_DB_PATH": os.getenv("RESPONSE_CACHE_DB_PATH", "cache.db"),
+    }
+    workers = []
+    worker_urls = []
+    for worker_id in range(args.workers):
+        port = first_port + worker_id
+        worker_urls.append(f"http://127.0.0.1:{port}")
+        workers.append(
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "uvicorn",
+                    "main:app",
+                    "--host",
+                    "127.0.0.1",
+                    "--port",
+                    str(port),
+                ],
+                env={**env, "WORKER_ID": str(worker_id)},
+            )
+        )
+    print(f"Started {args.workers} worker(s) on {', '.join(worker_urls)}")
+
+    # The proxy reads its workers when it is imported.
+    os.environ["WORKER_URLS"] = ",".join(worker_urls)
+    from proxy import app
+
+    try:
+        uvicorn.run(app, host=args.host, port=args.port)
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            try:
+                worker.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Dependency-aware execution of remote agent calls.
+
+A plan is a DAG of agent calls. Each node builds its task from the answers of
+the nodes it depends on, so independent calls run concurrently and dependent
+ones start as soon as their inputs resolve. Per-node timings are kept so the
+critical path of a run can be reported.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+# Builds a node's task from its dependencies' answers; None skips the node.
+TaskBuilder = Callable[[dict[str, Any]], str | None]
+# Sends one task to one agent and returns (status, answer).
+AgentCall = Callable[[str, str], Awaitable[tuple[str, Any]]]
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    agent_name: str
+    task: TaskBuilder
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class NodeRun:
+    status: str = "pending"
+    answer: Any = None
+    task: str | None = None
+    started: float = 0.0
+    finished: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass
+class PlanRun:
+    runs: dict[str, NodeRun] = field(default_factory=dict)
+    started: float = 0.0
+    finished: float = 0.0
+
+    def answers(self) -> dict[str, Any]:
+        """Answers of the nodes that succeeded."""
+        return {
+            name: run.answer
+            for name, run in self.runs.items()
+            if run.status == "success"
+        }
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """Start offset and duration of every node, in milliseconds."""
+        return {
+            name: {
+                "status": run.status,
+                "start_ms": round((run.started - self.started) * 1000),
+                "duration_ms": round(run.elapsed * 1000),
+            }
+            for name, run in self.runs.items()
+        }
+
+
+class PlanGraph:
+    """A DAG of agent calls, validated and topologically sorted on creation."""
+
+    def __init__(self, nodes: list[PlanNode]):
+        self.nodes = {node.agent_name: node for node in nodes}
+        if len(self.nodes) != len(nodes):
+            raise ValueError("Each agent may appear only once in a plan")
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str, path: tuple[str, ...]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Plan has a cycle: {' -> '.join(path + (name,))}")
+            if name not in self.nodes:
+                raise ValueError(f"{path[-1]} depends on unknown node {name}")
+            state[name] = "visiting"
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency, path + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name, ())
+        return order
+
+    async def run(self, call: AgentCall) -> PlanRun:
+        """Runs every node as soon as the nodes it depends on have finished.
+
+        A node whose dependency did not succeed still runs; its task builder
+        sees only the answers that are available and may skip the node.
+        """
+        plan = PlanRun(runs={name: NodeRun() for name in self.order})
+        plan.started = time.perf_counter()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_node(node: PlanNode):
+            for dependency in node.depends_on:
+                await tasks[dependency]
+            run = plan.runs[node.agent_name]
+            run.started = time.perf_counter()
+            inputs = {
+                name: plan.runs[name].answer
+                for name in node.depends_on
+                if plan.runs[name].status == "success"
+            }
+            run.task = node.task(inputs)
+            if run.task is None:
+                run.status = "skipped"
+            else:
+                run.status, run.answer = await call(node.agent_name, run.task)
+            run.finished = time.perf_counter()
+
+        for name in self.order:
+            tasks[name] = asyncio.create_task(run_node(self.nodes[name]))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        plan.finished = time.perf_counter()
+        return plan
+
+    def critical_path(self, plan: PlanRun) -> list[str]:
+        """The chain of nodes that determined when the plan finished.
+
+        Starting from the node that finished last, repeatedly steps to the
+        dependency that finished last, i.e. the one the node was waiting on.
+        """
+        finished = [name for name in self.order if plan.runs[name].finished]
+        if not finished:
+            return []
+        name = max(finished, key=lambda n: plan.runs[n].finished)
+        path = [name]
+        while dependencies := self.nodes[name].depends_on:
+            name = max(dependencies, key=lambda n: plan.runs[n].finished)
+            path.append(name)
+        return path[::-1]
+
+    def summary(self, plan: PlanRun) -> dict[str, Any]:
+        return {
+            "total_ms": round((plan.finished - plan.started) * 1000),
+            "critical_path": self.critical_path(plan),
+            "nodes": plan.timings(),
+        }
@@ -0,0 +1,135 @@
+"""Session-affinity front proxy for a multi-worker travel planner host.
+
+Every websocket for a session_id is forwarded to the same worker, picked by
+rendezvous hashing over the worker URLs, so a session's hot state stays in one
+process. Adding or removing a worker only moves the sessions that hashed to it.
+Agent registration is broadcast to every worker and /stats collects theirs.
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import Counter
+
+import httpx
+import websockets
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+# Comma-separated worker base URLs, e.g. "http://127.0.0.1:8100,http://127.0.0.1:8101".
+WORKER_URLS = [
+    url.strip().rstrip("/")
+    for url in os.getenv("WORKER_URLS", "").split(",")
+    if url.strip()
+]
+
+app = FastAPI()
+
+_client: httpx.AsyncClient
+_routed: Counter[str] = Counter()
+_open: Counter[str] = Counter()
+
+
+def worker_for(session_id: str, workers: list[str]) -> str:
+    """The worker that owns `session_id`: the one with the highest hash weight."""
+    return max(
+        workers,
+        key=lambda worker: hashlib.blake2b(
+            f"{worker}|{session_id}".encode(), digest_size=8
+        ).digest(),
+    )
+
+
+@app.on_event("startup")
+async def startup_event():
+    global _client
+    if not WORKER_URLS:
+        raise RuntimeError("WORKER_URLS is not set.")
+    _client = httpx.AsyncClient(timeout=10)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await _client.aclose()
+
+
+async def _broadcast(method: str, path: str, **kwargs) -> list[httpx.Response]:
+    return await asyncio.gather(
+        *(_client.request(method, f"{url}{path}", **kwargs) for url in WORKER_URLS)
+    )
+
+
+@app.post("/agents")
+async def add_agent(url: str):
+    responses = await _broadcast("POST", "/agents", params={"url": url})
+    return responses[0].json()
+
+
+@app.delete("/agents")
+async def remove_agent(url: str):
+    responses = await _broadcast("DELETE", "/agents", params={"url": url})
+    return responses[0].json()
+
+
+@app.get("/stats")
+async def stats():
+    responses = await asyncio.gather(
+        *(_client.get(f"{url}/stats") for url in WORKER_URLS),
+        return_exceptions=True,
+    )
+    return {
+        "proxy": {
+            url: {"open": _open[url], "routed": _routed[url]} for url in WORKER_URLS
+        },
+        "workers": {
+            url: (
+                response.json()
+                if isinstance(response, httpx.Response)
+                else {"error": str(response)}
+            )
+            for url, response in zip(WORKER_URLS, responses)
+        },
+    }
+
+
+@app.websocket("/ws/{session_id}")
+async def websocket_endpoint(websocket: WebSocket, session_id: str):
+    await websocket.accept()
+    worker = worker_for(session_id, WORKER_URLS)
+    upstream_url = f"ws{worker.removeprefix('http')}/ws/{session_id}"
+    try:
+        upstream = await websockets.connect(upstream_url)
+    except (OSError, websockets.WebSocketException):
+        # 1013: try again later.
+        await websocket.close(code=1013)
+        return
+    _routed[worker] += 1
+    _open[worker] += 1
+
+    async def client_to_worker():
+        while True:
+            await upstream.send(await websocket.receive_text())
+
+    async def worker_to_client():
+        async for message in upstream:
+            await websocket.send_text(message)
+
+    pumps = [
+        asyncio.create_task(client_to_worker()),
+        asyncio.create_task(worker_to_client()),
+    ]
+    try:
+        done, _ = await asyncio.wait(pumps, return_when=asyncio.FIRST_COMPLETED)
+        for pump in done:
+            error = pump.exception()
+            if error and not isinstance(
+                error, (WebSocketDisconnect, websockets.ConnectionClosed)
+            ):
+                raise error
+    finally:
+        _open[worker] -= 1
+        for pump in pumps:
+            pump.cancel()
+        await upstream.close()
+    if pumps[1] in done:
+        # The worker went away; let the client reconnect.
+        await websocket.close(code=1012)
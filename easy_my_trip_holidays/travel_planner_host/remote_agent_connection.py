@@ -1,17 +1,20 @@
-from typing import Callable
+from typing import AsyncIterator, Callable
 
-import httpx
 from a2a.client import A2AClient
 from a2a.types import (
     AgentCard,
     SendMessageRequest,
     SendMessageResponse,
+    SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
     Task,
     TaskArtifactUpdateEvent,
     TaskStatusUpdateEvent,
 )
 from dotenv import load_dotenv
 
+from http_pool import get_http_client
+
 load_dotenv()
 
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
@@ -24,13 +27,21 @@ class RemoteAgentConnections:
     def __init__(self, agent_card: AgentCard, agent_url: str):
         print(f"agent_card: {agent_card}")
         print(f"agent_url: {agent_url}")
-        self._httpx_client = httpx.AsyncClient(timeout=30)
-        self.agent_client = A2AClient(self._httpx_client, agent_card, url=agent_url)
+        self.agent_url = agent_url
         self.card = agent_card
         self.conversation_name = None
         self.conversation = None
         self.pending_tasks = set()
 
+    @property
+    def agent_client(self) -> A2AClient:
+        # Built per call on top of the host-wide pool; A2AClient holds no state.
+        return A2AClient(get_http_client(), self.card, url=self.agent_url)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return bool(self.card.capabilities and self.card.capabilities.streaming)
+
     def get_agent(self) -> AgentCard:
         return self.card
 
@@ -38,3 +49,9 @@ class RemoteAgentConnections:
         self, message_request: SendMessageRequest
     ) -> SendMessageResponse:
         return await self.agent_client.send_message(message_request)
+
+    async def send_message_streaming(
+        self, message_request: SendStreamingMessageRequest
+    ) -> AsyncIterator[SendStreamingMessageResponse]:
+        async for response in self.agent_client.send_message_streaming(message_request):
+            yield response
@@ -0,0 +1,126 @@
+"""TTL/LRU cache for remote agent responses, keyed on agent name and task text."""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from a2a.types import AgentCard
+
+# Agents advertise caching hints with this AgentCard extension, e.g.
+# AgentExtension(uri=CACHE_EXTENSION_URI, params={"ttl": 600}). A ttl of 0 opts out.
+CACHE_EXTENSION_URI = "urn:easy-my-trip:response-cache:v1"
+
+DEFAULT_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+# Per-agent overrides, e.g. "Weather_Agent=600,Flight_Agent=0".
+AGENT_TTLS = os.getenv("RESPONSE_CACHE_AGENT_TTLS", "")
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    payload: str
+
+
+def normalize_task(task: str) -> str:
+    """Folds case, whitespace and trailing punctuation so equivalent tasks match."""
+    return " ".join(task.lower().split()).rstrip(".?!")
+
+
+def _parse_agent_ttls(spec: str) -> dict[str, float]:
+    ttls = {}
+    for item in spec.split(","):
+        name, sep, ttl = item.partition("=")
+        if sep:
+            ttls[name.strip()] = float(ttl)
+    return ttls
+
+
+class ResponseCache:
+    """Caches successful agent responses with per-agent TTLs and a byte budget.
+
+    Entries are evicted least-recently-used first once the serialized size of
+    all cached responses exceeds `max_bytes`. get() and put() are coroutines so
+    that subclasses can add tiers that do I/O.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES, default_ttl: float = DEFAULT_TTL):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._ttls: dict[str, float] = {}
+        self._overrides = _parse_agent_ttls(AGENT_TTLS)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def configure_agent(self, card: AgentCard):
+        """Applies the caching hint from an agent's card, unless overridden."""
+        ttl = self.default_ttl
+        extensions = card.capabilities.extensions if card.capabilities else None
+        for extension in extensions or []:
+            if extension.uri == CACHE_EXTENSION_URI and extension.params:
+                ttl = float(extension.params.get("ttl", ttl))
+        self._ttls[card.name] = self._overrides.get(card.name, ttl)
+
+    def ttl_for(self, agent_name: str) -> float:
+        return self._ttls.get(
+            agent_name, self._overrides.get(agent_name, self.default_ttl)
+        )
+
+    async def get(self, agent_name: str, task: str) -> Any | None:
+        key = (agent_name, normalize_task(task))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Hand out a fresh copy so callers cannot mutate the cached value.
+        return json.loads(entry.payload)
+
+    async def put(self, agent_name: str, task: str, response: Any):
+        ttl = self.ttl_for(agent_name)
+        if ttl <= 0:
+            return
+        payload = json.dumps(response)
+        if len(payload) > self.max_bytes:
+            return
+        self._insert((agent_name, normalize_task(task)), payload, ttl)
+
+    def _insert(self, key: tuple[str, str], payload: str, ttl: float):
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(time.monotonic() + ttl, payload)
+        self.bytes += len(payload)
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: tuple[str, str]):
+        entry = self._entries.pop(key)
+        self.bytes -= len(entry.payload)
+
+    def close(self):
+        """Releases the cache's resources; the in-memory cache holds none."""
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,148 @@
+"""In-memory ADK session service with a session cap, idle TTL and history trimming."""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+MAX_SESSIONS = int(os.getenv("SESSION_MAX_SESSIONS", "1000"))
+IDLE_TTL = float(os.getenv("SESSION_IDLE_TTL", "3600"))
+# Keep at most this many events per session (0 keeps them all). Older turns are
+# dropped whole so a function call is never separated from its response.
+MAX_EVENTS = int(os.getenv("SESSION_MAX_EVENTS", "0"))
+
+_Key = tuple[str, str, str]
+
+
+class BoundedSessionService(InMemorySessionService):
+    """Evicts sessions idle longer than `idle_ttl`, then least-recently-used
+    sessions once more than `max_sessions` are held."""
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        idle_ttl: float = IDLE_TTL,
+        max_events: int = MAX_EVENTS,
+    ):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_events = max_events
+        # Session keys in least-recently-used order, with their last access time.
+        self._last_access: OrderedDict[_Key, float] = OrderedDict()
+        self.expired = 0
+        self.evicted = 0
+        self.trimmed_events = 0
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch((app_name, user_id, session.id))
+        await self._enforce_limits()
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        await self._enforce_limits()
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            self._touch((app_name, user_id, session_id))
+        return session
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        self._last_access.pop((app_name, user_id, session_id), None)
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        key = (session.app_name, session.user_id, session.id)
+        if key in self._last_access:
+            self._touch(key)
+            self._trim(self.sessions[session.app_name][session.user_id][session.id])
+        return event
+
+    def _touch(self, key: _Key):
+        self._last_access[key] = time.monotonic()
+        self._last_access.move_to_end(key)
+
+    def _trim(self, session: Session):
+        """Drops the oldest turns once the stored history exceeds max_events."""
+        excess = len(session.events) - self.max_events
+        if self.max_events <= 0 or excess <= 0:
+            return
+        for start in range(excess, len(session.events)):
+            if session.events[start].author == "user":
+                del session.events[:start]
+                self.trimmed_events += start
+                return
+
+    async def _enforce_limits(self):
+        deadline = time.monotonic() - self.idle_ttl
+        while self._last_access:
+            key, last_access = next(iter(self._last_access.items()))
+            if last_access < deadline:
+                self.expired += 1
+            elif len(self._last_access) > self.max_sessions:
+                self.evicted += 1
+            else:
+                break
+            await self._evict(key)
+
+    async def _evict(self, key: _Key):
+        app_name, user_id, session_id = key
+        self._last_access.pop(key, None)
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+
+    async def aclose(self):
+        """Nothing to release; subclasses that persist sessions flush here."""
+
+    def stats(self) -> dict[str, Any]:
+        """Session counts, approximate memory use and eviction counters."""
+        sessions = [
+            session
+            for users in self.sessions.values()
+            for user_sessions in users.values()
+            for session in user_sessions.values()
+        ]
+        events = sum(len(session.events) for session in sessions)
+        approx_bytes = sum(
+            len(event.model_dump_json(exclude_none=True))
+            for session in sessions
+            for event in session.events
+        )
+        return {
+            "sessions": len(sessions),
+            "max_sessions": self.max_sessions,
+            "idle_ttl_seconds": self.idle_ttl,
+            "events": events,
+            "approx_bytes": approx_bytes,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "trimmed_events": self.trimmed_events,
+        }
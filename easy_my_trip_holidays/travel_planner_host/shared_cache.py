@@ -0,0 +1,142 @@
+"""Response cache shared by the worker processes of a multi-worker host."""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from response_cache import ResponseCache, normalize_task
+
+# Set by the multi-worker launcher; every worker opens the same file.
+CACHE_DB_PATH = os.getenv("RESPONSE_CACHE_DB_PATH", "")
+# Expired rows are purged by whichever worker writes after this interval.
+PURGE_INTERVAL = float(os.getenv("RESPONSE_CACHE_PURGE_INTERVAL", "60"))
+# Seconds to wait for another worker's write lock before giving up.
+BUSY_TIMEOUT = float(os.getenv("RESPONSE_CACHE_BUSY_TIMEOUT", "0.05"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    agent_name TEXT NOT NULL,
+    task TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (agent_name, task)
+);
+"""
+
+
+class SharedResponseCache(ResponseCache):
+    """ResponseCache with a second, SQLite tier that all workers read and write.
+
+    Lookups are served from process memory first; a local miss falls through
+    to the database, and a hit there is copied into memory for the rest of
+    its TTL. Responses are written through to both tiers. The database is a
+    local file in WAL mode with synchronous=NORMAL, used from one executor
+    thread so a worker waiting on another's write lock never stalls the event
+    loop. A lock held longer than BUSY_TIMEOUT makes a read a miss and skips a
+    write; the cache is an optimization, not the record.
+    """
+
+    def __init__(self, db_path: str = CACHE_DB_PATH, **limits: Any):
+        super().__init__(**limits)
+        self.db_path = db_path
+        # The connection is only ever used from this thread.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="response-cache-db"
+        )
+        self._db: sqlite3.Connection | None = None
+        self._last_purge = 0.0
+        self.shared_hits = 0
+        self.db_errors = 0
+
+    async def get(self, agent_name: str, task: str) -> Any | None:
+        response = await super().get(agent_name, task)
+        if response is not None:
+            return response
+        key = (agent_name, normalize_task(task))
+        row = await self._run(self._select, key)
+        if row is None:
+            return None
+        expires_at, payload = row
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return None
+        self._insert(key, payload, ttl)
+        self.shared_hits += 1
+        return json.loads(payload)
+
+    async def put(self, agent_name: str, task: str, response: Any):
+        await super().put(agent_name, task, response)
+        ttl = self.ttl_for(agent_name)
+        payload = json.dumps(response)
+        if ttl <= 0 or len(payload) > self.max_bytes:
+            return
+        await self._run(self._upsert, (agent_name, normalize_task(task)), ttl, payload)
+
+    def close(self):
+        self._executor.submit(self._close).result()
+        self._executor.shutdown()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "db_path": self.db_path,
+            "shared_hits": self.shared_hits,
+            "db_errors": self.db_errors,
+        }
+
+    async def _run(self, fn: Callable, *args: Any) -> Any:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, fn, *args
+            )
+        except sqlite3.Error:
+            # Usually another worker holding the write lock past BUSY_TIMEOUT.
+            self.db_errors += 1
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT)
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.executescript(_SCHEMA)
+            except sqlite3.Error:
+                # Set up again on the next call.
+                db.close()
+                raise
+            self._db = db
+        return self._db
+
+    def _select(self, key: tuple[str, str]) -> tuple[float, str] | None:
+        return (
+            self._connect()
+            .execute(
+                "SELECT expires_at, payload FROM responses "
+                "WHERE agent_name = ? AND task = ? AND expires_at > ?",
+                (*key, time.time()),
+            )
+            .fetchone()
+        )
+
+    def _upsert(self, key: tuple[str, str], ttl: float, payload: str):
+        db = self._connect()
+        now = time.time()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (*key, now + ttl, payload),
+            )
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
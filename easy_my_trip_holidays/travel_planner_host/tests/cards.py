@@ -0,0 +1,46 @@
+from a2a.types import AgentCapabilities, AgentCard, AgentExtension, AgentSkill
+from response_cache import CACHE_EXTENSION_URI
+
+# Name, port, description and skill tags of the agents the travel host registers.
+TRAVEL_AGENTS = [
+    ("Flight_Agent", 10001, "An agent that finds flights.", ["flights", "travel"]),
+    ("Hotel_Agent", 10002, "An agent that finds hotels.", ["hotels", "travel"]),
+    ("Cab_Agent", 10003, "An agent that finds cabs.", ["cabs", "transport"]),
+    ("Activity_Agent", 10004, "An agent that finds activities.", ["activities"]),
+    ("Weather_Agent", 10005, "An agent that provides weather forecasts.", ["weather"]),
+    ("Budget_Agent", 10006, "An agent that checks a travel budget.", ["budget"]),
+    ("Document_Agent", 10007, "An agent that checks travel documents.", ["documents"]),
+    ("Food_Agent", 10008, "An agent that finds restaurants.", ["food", "dining"]),
+    ("Currency_Agent", 10009, "An agent that gets exchange rates.", ["currency"]),
+]
+
+
+def agent_card(
+    name: str,
+    port: int = 10001,
+    description: str = "A test agent.",
+    tags: list[str] | None = None,
+    cache_ttl: float | None = None,
+) -> AgentCard:
+    extensions = None
+    if cache_ttl is not None:
+        extensions = [
+            AgentExtension(uri=CACHE_EXTENSION_URI, params={"ttl": cache_ttl})
+        ]
+    return AgentCard(
+        name=name,
+        description=description,
+        url=f"http://localhost:{port}/",
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        skills=[
+            AgentSkill(
+                id=name.lower(),
+                name=name.replace("_", " "),
+                description=description,
+                tags=tags or [],
+            )
+        ],
+        version="1.0.0",
+        capabilities=AgentCapabilities(extensions=extensions),
+    )
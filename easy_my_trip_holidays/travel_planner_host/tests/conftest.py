@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# The host's modules import each other by bare name, as when run from its directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Keep the host's databases out of the working tree and the model offline.
+_tmp = tempfile.mkdtemp(prefix="travel-host-tests-")
+os.environ.setdefault("SESSION_DB_PATH", os.path.join(_tmp, "sessions.db"))
+os.environ.setdefault("RESPONSE_CACHE_DB_PATH", "")
+os.environ.setdefault("A2A_MOCK_LLM", "true")
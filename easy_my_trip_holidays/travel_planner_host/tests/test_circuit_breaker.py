@@ -0,0 +1,83 @@
+import circuit_breaker
+from circuit_breaker import MIN_CALLS, SLOW_CALL_SECONDS, CircuitBreaker
+
+
+def _tripped() -> CircuitBreaker:
+    breaker = CircuitBreaker("Flight_Agent")
+    for _ in range(MIN_CALLS):
+        breaker.record_failure(0.1)
+    return breaker
+
+
+def test_too_many_errors_open_the_circuit():
+    breaker = CircuitBreaker("Flight_Agent")
+    for _ in range(MIN_CALLS - 1):
+        breaker.record_failure(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure(0.1)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.trips == 1
+
+
+def test_too_many_slow_calls_open_the_circuit():
+    breaker = CircuitBreaker("Flight_Agent")
+    for _ in range(MIN_CALLS):
+        breaker.record_success(SLOW_CALL_SECONDS)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_an_open_circuit_lets_one_probe_through_after_the_wait(monkeypatch):
+    breaker = _tripped()
+    monkeypatch.setattr(circuit_breaker, "OPEN_SECONDS", 0)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_a_successful_probe_closes_the_circuit(monkeypatch):
+    breaker = _tripped()
+    monkeypatch.setattr(circuit_breaker, "OPEN_SECONDS", 0)
+    assert breaker.allow_request()
+
+    breaker.record_success(0.1)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["window_calls"] == 1
+
+
+def test_a_failed_probe_opens_the_circuit_again(monkeypatch):
+    breaker = _tripped()
+    monkeypatch.setattr(circuit_breaker, "OPEN_SECONDS", 0)
+    assert breaker.allow_request()
+    monkeypatch.setattr(circuit_breaker, "OPEN_SECONDS", 60)
+
+    breaker.record_failure(0.1)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.trips == 2
+
+
+def test_a_cancelled_probe_frees_the_probe_slot(monkeypatch):
+    breaker = _tripped()
+    monkeypatch.setattr(circuit_breaker, "OPEN_SECONDS", 0)
+    assert breaker.allow_request()
+
+    breaker.record_cancelled()
+
+    assert breaker.allow_request()
+
+
+def test_hedging_waits_for_the_recent_p95_latency():
+    breaker = CircuitBreaker("Flight_Agent")
+    assert breaker.hedge_delay() is None
+
+    for latency in (0.2, 0.3, 0.4, 0.5, 0.6):
+        breaker.record_success(latency)
+
+    assert breaker.hedge_delay() == 0.6
@@ -0,0 +1,68 @@
+from datetime import date
+
+from fast_router import parse_travel_request
+
+
+def test_parses_a_fully_specified_request():
+    request = parse_travel_request(
+        "Plan a trip from Boston to Rome from 2026-11-01 to 2026-11-05 "
+        "for 2 adults, budget $3000, italian food"
+    )
+
+    assert request is not None
+    assert (request.origin, request.destination) == ("Boston", "Rome")
+    assert (request.country, request.destination_currency) == ("Italy", "EUR")
+    assert (request.start_date, request.end_date) == (
+        date(2026, 11, 1),
+        date(2026, 11, 5),
+    )
+    assert (request.adults, request.children) == (2, 0)
+    assert (request.budget, request.home_currency) == (3000.0, "USD")
+    assert request.cuisine == "italian"
+
+
+def test_to_after_the_origin_names_the_destination():
+    request = parse_travel_request(
+        "I am staying in London this week. Plan a trip from Boston to Rome "
+        "from 2026-11-01 to 2026-11-05 for 2 adults, budget $3000, italian food"
+    )
+
+    assert request is not None
+    assert request.destination == "Rome"
+
+
+def test_other_mentions_are_used_without_a_to_city():
+    request = parse_travel_request(
+        "From Boston, I want to visit Tokyo on 2026-11-01 for 7 nights, "
+        "1 adult, budget $5000"
+    )
+
+    assert request is not None
+    assert request.destination == "Tokyo"
+
+
+def test_several_candidate_destinations_go_to_the_model():
+    assert (
+        parse_travel_request(
+            "Plan a trip from Boston to Rome or to Paris from 2026-11-01 to "
+            "2026-11-05 for 2 adults, budget $3000"
+        )
+        is None
+    )
+    assert (
+        parse_travel_request(
+            "I am staying in London or visiting Paris. Plan a trip from Boston "
+            "from 2026-11-01 to 2026-11-05 for 2 adults, budget $3000"
+        )
+        is None
+    )
+
+
+def test_the_origin_is_not_a_destination():
+    assert (
+        parse_travel_request(
+            "Plan a trip from Rome to Rome from 2026-11-01 to 2026-11-05 "
+            "for 2 adults, budget $3000"
+        )
+        is None
+    )
@@ -0,0 +1,69 @@
+import asyncio
+
+from agent import HostAgent
+from cards import agent_card
+from circuit_breaker import MIN_CALLS, CircuitBreaker
+
+PRIMARY = "http://localhost:10001"
+REPLICA = "http://localhost:11001"
+
+
+def _host_with_replica() -> HostAgent:
+    host = HostAgent()
+    card = agent_card("Flight_Agent", 10001, "Finds flights.", ["flight"])
+    host._register_agent(card, PRIMARY)
+    host._register_agent(card, REPLICA)
+    return host
+
+
+def _send_with(host: HostAgent, delays: dict[str, float], answers: dict[str, list]):
+    """Sends one task with each address answering after its delay."""
+    sent = []
+
+    async def send(agent_name, task, state, client=None):
+        address = (client or host.remote_agent_connections[agent_name]).agent_url
+        sent.append(address)
+        await asyncio.sleep(delays[address])
+        return answers[address]
+
+    host._send_task_unbounded = send
+    breaker = CircuitBreaker("Flight_Agent")
+    for _ in range(MIN_CALLS):
+        breaker.record_success(0.01)
+    return (
+        asyncio.run(host._send_hedged("Flight_Agent", "task", {}, breaker)),
+        sent,
+    )
+
+
+def test_a_slow_primary_is_hedged_to_a_replica():
+    result, sent = _send_with(
+        _host_with_replica(),
+        {PRIMARY: 1.0, REPLICA: 0.0},
+        {PRIMARY: [{"text": "primary"}], REPLICA: [{"text": "replica"}]},
+    )
+
+    assert result == [{"text": "replica"}]
+    assert sent == [PRIMARY, REPLICA]
+
+
+def test_a_fast_primary_is_not_hedged():
+    result, sent = _send_with(
+        _host_with_replica(),
+        {PRIMARY: 0.0, REPLICA: 0.0},
+        {PRIMARY: [{"text": "primary"}], REPLICA: [{"text": "replica"}]},
+    )
+
+    assert result == [{"text": "primary"}]
+    assert sent == [PRIMARY]
+
+
+def test_an_error_from_the_replica_waits_for_the_primary():
+    result, sent = _send_with(
+        _host_with_replica(),
+        {PRIMARY: 0.2, REPLICA: 0.0},
+        {PRIMARY: [{"text": "primary"}], REPLICA: [{"text": "Error: down"}]},
+    )
+
+    assert result == [{"text": "primary"}]
+    assert sent == [PRIMARY, REPLICA]
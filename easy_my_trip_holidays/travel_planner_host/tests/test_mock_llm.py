@@ -0,0 +1,44 @@
+import asyncio
+import json
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from mock_llm import MockLlm
+
+QUERY = "Find flights from Boston to Rome on 2026-11-01"
+
+
+def _first_response(instruction: str):
+    async def generate():
+        request = LlmRequest(
+            contents=[types.Content(role="user", parts=[types.Part(text=QUERY)])],
+            config=types.GenerateContentConfig(system_instruction=instruction),
+        )
+        request.tools_dict["send_messages"] = None
+        async for response in MockLlm().generate_content_async(request):
+            return response
+
+    return asyncio.run(generate())
+
+
+def test_each_agent_gets_a_task_naming_its_card():
+    agents = [
+        {"name": "Flight_Agent", "description": "An agent that books flights."},
+        {"name": "Weather_Agent", "description": "An agent that gives forecasts."},
+    ]
+    instruction = "Agents:\n" + "\n".join(json.dumps(agent) for agent in agents)
+
+    call = _first_response(instruction).content.parts[0].function_call
+
+    assert call.name == "send_messages"
+    assert call.args["agent_names"] == ["Flight_Agent", "Weather_Agent"]
+    assert call.args["tasks"] == [
+        f"{QUERY} (for Flight_Agent: An agent that books flights.)",
+        f"{QUERY} (for Weather_Agent: An agent that gives forecasts.)",
+    ]
+
+
+def test_without_agents_it_answers_in_text():
+    response = _first_response("No agents are registered.")
+
+    assert response.content.parts[0].text.startswith("No agents are available")
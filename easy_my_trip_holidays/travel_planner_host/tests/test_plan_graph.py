@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from plan_graph import PlanGraph, PlanNode
+
+
+def _node(name: str, *depends_on: str, skip: bool = False) -> PlanNode:
+    def task(inputs: dict) -> str | None:
+        return None if skip else f"{name} after {sorted(inputs)}"
+
+    return PlanNode(name, task, depends_on)
+
+
+def _recording_call(delays: dict[str, float], failing: tuple[str, ...] = ()):
+    events = []
+
+    async def call(agent_name: str, task: str):
+        events.append(("start", agent_name))
+        await asyncio.sleep(delays.get(agent_name, 0))
+        events.append(("end", agent_name))
+        if agent_name in failing:
+            return "error", None
+        return "success", task
+
+    return call, events
+
+
+def test_dependencies_finish_before_their_dependents_start():
+    graph = PlanGraph(
+        [_node("Budget", "Flight", "Hotel"), _node("Flight"), _node("Hotel")]
+    )
+    call, events = _recording_call({"Flight": 0.02, "Hotel": 0.01})
+
+    plan = asyncio.run(graph.run(call))
+
+    assert events[:2] == [("start", "Flight"), ("start", "Hotel")]
+    assert events.index(("end", "Flight")) < events.index(("start", "Budget"))
+    assert plan.runs["Budget"].task == "Budget after ['Flight', 'Hotel']"
+    assert graph.critical_path(plan) == ["Flight", "Budget"]
+
+
+def test_a_failed_dependency_is_left_out_of_the_inputs():
+    graph = PlanGraph([_node("Flight"), _node("Budget", "Flight")])
+    call, _ = _recording_call({}, failing=("Flight",))
+
+    plan = asyncio.run(graph.run(call))
+
+    assert plan.runs["Flight"].status == "error"
+    assert plan.runs["Budget"].task == "Budget after []"
+    assert plan.answers() == {"Budget": "Budget after []"}
+
+
+def test_a_node_whose_task_builder_returns_none_is_skipped():
+    graph = PlanGraph([_node("Flight", skip=True)])
+    call, events = _recording_call({})
+
+    plan = asyncio.run(graph.run(call))
+
+    assert plan.runs["Flight"].status == "skipped"
+    assert events == []
+
+
+@pytest.mark.parametrize(
+    "nodes, error",
+    [
+        ([_node("A", "B"), _node("B", "A")], "cycle"),
+        ([_node("A", "Missing")], "unknown node"),
+        ([_node("A"), _node("A")], "only once"),
+    ],
+)
+def test_invalid_plans_are_rejected(nodes, error):
+    with pytest.raises(ValueError, match=error):
+        PlanGraph(nodes)
@@ -0,0 +1,104 @@
+import progress
+import pytest
+from progress import (
+    AGENT_CALL,
+    AGENT_PROGRESS,
+    THINKING,
+    ProgressCoalescer,
+    progress_event,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(progress.time, "monotonic", fake)
+    return fake
+
+
+def _texts(events: list[dict]) -> list[str]:
+    return [event["updates"] for event in events]
+
+
+def test_an_event_repeating_the_last_one_sent_is_dropped(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+    call = progress_event(AGENT_CALL, "Calling Flight_Agent...", "Flight_Agent")
+
+    assert coalescer.offer(call) == [call]
+    assert coalescer.offer(dict(call)) == []
+    assert coalescer.suppressed == 1
+
+
+def test_only_the_newest_held_event_is_sent_once_the_window_passes(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+    relay = [
+        progress_event(AGENT_PROGRESS, text, "Flight_Agent")
+        for text in ("searching", "found 3", "found 5")
+    ]
+
+    assert coalescer.offer(relay[0]) == [relay[0]]
+    clock.now += 0.2
+    assert coalescer.offer(relay[1]) == []
+    assert coalescer.offer(relay[2]) == []
+    assert coalescer.wait_time() == pytest.approx(0.8)
+
+    clock.now += 0.8
+    assert coalescer.due() == [relay[2]]
+    assert coalescer.wait_time() is None
+    assert coalescer.suppressed == 1
+
+
+def test_each_agent_is_debounced_on_its_own(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+
+    sent = [
+        *coalescer.offer(progress_event(AGENT_PROGRESS, "flights", "Flight_Agent")),
+        *coalescer.offer(progress_event(AGENT_PROGRESS, "hotels", "Hotel_Agent")),
+    ]
+
+    assert _texts(sent) == ["flights", "hotels"]
+
+
+def test_a_call_is_sent_at_once_and_makes_held_progress_stale(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+    coalescer.offer(progress_event(AGENT_PROGRESS, "searching", "Flight_Agent"))
+    coalescer.offer(progress_event(AGENT_PROGRESS, "found 3", "Flight_Agent"))
+
+    sent = coalescer.offer(
+        progress_event(AGENT_CALL, "Calling Flight_Agent again...", "Flight_Agent")
+    )
+
+    assert _texts(sent) == ["Calling Flight_Agent again..."]
+    clock.now += 1.0
+    assert coalescer.due() == []
+
+
+def test_held_thinking_is_dropped_once_anything_else_is_sent(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+    coalescer.offer(progress_event(THINKING, "Thinking..."))
+    coalescer.offer(progress_event(THINKING, "Still thinking..."))
+
+    coalescer.offer(progress_event(AGENT_CALL, "Calling Hotel_Agent...", "Hotel_Agent"))
+
+    assert coalescer.wait_time() is None
+    assert coalescer.suppressed == 1
+
+
+def test_discard_drops_held_events(clock):
+    coalescer = ProgressCoalescer(interval=1.0)
+    coalescer.offer(progress_event(AGENT_PROGRESS, "searching", "Flight_Agent"))
+    coalescer.offer(progress_event(AGENT_PROGRESS, "found 3", "Flight_Agent"))
+
+    coalescer.discard()
+
+    clock.now += 1.0
+    assert coalescer.due() == []
+    assert coalescer.suppressed == 1
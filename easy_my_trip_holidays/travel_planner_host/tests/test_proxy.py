@@ -0,0 +1,41 @@
+from collections import Counter
+
+from proxy import worker_for
+
+WORKERS = [f"http://127.0.0.1:{port}" for port in range(8100, 8104)]
+SESSIONS = [f"session-{n}" for n in range(2000)]
+
+
+def _owners(workers: list[str]) -> dict[str, str]:
+    return {session: worker_for(session, workers) for session in SESSIONS}
+
+
+def test_a_session_always_goes_to_the_same_worker_in_any_order():
+    assert _owners(WORKERS) == _owners(list(reversed(WORKERS)))
+
+
+def test_sessions_are_spread_across_the_workers():
+    counts = Counter(_owners(WORKERS).values())
+
+    assert set(counts) == set(WORKERS)
+    assert min(counts.values()) > len(SESSIONS) / len(WORKERS) * 0.8
+
+
+def test_removing_a_worker_only_moves_its_own_sessions():
+    before = _owners(WORKERS)
+    after = _owners(WORKERS[:-1])
+
+    moved = {session for session in SESSIONS if before[session] != after[session]}
+
+    assert moved == {s for s in SESSIONS if before[s] == WORKERS[-1]}
+
+
+def test_adding_a_worker_only_takes_sessions_for_itself():
+    before = _owners(WORKERS)
+    added = "http://127.0.0.1:8104"
+    after = _owners([*WORKERS, added])
+
+    moved = [session for session in SESSIONS if before[session] != after[session]]
+
+    assert moved
+    assert all(after[session] == added for session in moved)
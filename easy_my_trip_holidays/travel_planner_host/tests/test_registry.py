@@ -0,0 +1,101 @@
+import asyncio
+
+import agent
+import httpx
+import pytest
+from agent import HEALTH_CHECK_FAILURES, HostAgent
+from cards import agent_card
+
+FLIGHT = agent_card("Flight_Agent", 10001, "Finds flights.", ["flight"])
+HOTEL = agent_card("Hotel_Agent", 10002, "Finds hotels.", ["hotel"])
+PRIMARY = "http://localhost:10001"
+REPLICA = "http://localhost:11001"
+
+
+class FakeResolvers:
+    """Stands in for A2ACardResolver, serving the card set for each address."""
+
+    def __init__(self, cards: dict):
+        self.cards = cards
+
+    def __call__(self, client, address):
+        resolvers = self
+
+        class Resolver:
+            async def get_agent_card(self, **kwargs):
+                card = resolvers.cards.get(address)
+                if card is None:
+                    raise httpx.ConnectError(f"{address} is down")
+                return card
+
+        return Resolver()
+
+
+@pytest.fixture
+def resolvers(monkeypatch) -> FakeResolvers:
+    fake = FakeResolvers({})
+    monkeypatch.setattr(agent, "A2ACardResolver", fake)
+    return fake
+
+
+def test_discovery_registers_agents_and_replicas(resolvers):
+    resolvers.cards.update({PRIMARY: FLIGHT, REPLICA: FLIGHT, "http://x:1": None})
+    host = HostAgent()
+
+    asyncio.run(host._async_init_components([PRIMARY, REPLICA, "http://x:1"]))
+
+    assert host.remote_agent_connections["Flight_Agent"].agent_url == PRIMARY
+    assert list(host.replica_connections["Flight_Agent"]) == [REPLICA]
+    assert '"name": "Flight_Agent"' in host.agents
+
+
+def test_removing_the_primary_promotes_a_replica():
+    host = HostAgent()
+    host._register_agent(FLIGHT, PRIMARY)
+    host._register_agent(FLIGHT, REPLICA)
+
+    host.remove_remote_agent(PRIMARY)
+
+    assert host.remote_agent_connections["Flight_Agent"].agent_url == REPLICA
+    assert host.replica_connections["Flight_Agent"] == {}
+    assert "Flight_Agent" in host.cards
+
+
+def test_removing_the_last_address_unlists_the_agent():
+    host = HostAgent()
+    host._register_agent(FLIGHT, PRIMARY)
+
+    host.remove_remote_agent(PRIMARY)
+
+    assert "Flight_Agent" not in host.remote_agent_connections
+    assert host.agents == "No remote agents found"
+
+
+def test_an_agent_is_dropped_after_failed_checks_and_back_when_healthy(resolvers):
+    host = HostAgent()
+    host.remote_agent_addresses = [PRIMARY]
+    host._register_agent(FLIGHT, PRIMARY)
+
+    async def probe(times: int):
+        for _ in range(times):
+            await host._probe_agent(PRIMARY)
+
+    asyncio.run(probe(HEALTH_CHECK_FAILURES - 1))
+    assert "Flight_Agent" in host.remote_agent_connections
+
+    asyncio.run(probe(1))
+    assert "Flight_Agent" not in host.remote_agent_connections
+
+    resolvers.cards[PRIMARY] = FLIGHT
+    asyncio.run(probe(1))
+    assert host.remote_agent_connections["Flight_Agent"].agent_url == PRIMARY
+
+
+def test_a_check_finding_another_agent_replaces_the_old_one(resolvers):
+    host = HostAgent()
+    host._register_agent(FLIGHT, PRIMARY)
+    resolvers.cards[PRIMARY] = HOTEL
+
+    asyncio.run(host._probe_agent(PRIMARY))
+
+    assert list(host.remote_agent_connections) == ["Hotel_Agent"]
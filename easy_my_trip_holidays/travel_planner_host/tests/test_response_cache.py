@@ -0,0 +1,86 @@
+import asyncio
+import sqlite3
+import time
+
+from agent import HostAgent
+from cards import agent_card
+from shared_cache import SharedResponseCache
+
+FLIGHTS = "Find flights from Boston to Rome"
+
+
+def test_registering_an_opted_out_card_disables_caching():
+    host = HostAgent()
+    host._register_agent(
+        agent_card("Flight_Agent", cache_ttl=0), "http://localhost:10001"
+    )
+    cache = host.response_cache
+
+    async def put_then_get():
+        await cache.put("Flight_Agent", FLIGHTS, [{"text": "ok"}])
+        return await cache.get("Flight_Agent", FLIGHTS)
+
+    assert cache.ttl_for("Flight_Agent") == 0
+    assert asyncio.run(put_then_get()) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_a_changed_card_updates_the_agent_ttl():
+    host = HostAgent()
+    address = "http://localhost:10005"
+    host._register_agent(agent_card("Weather_Agent", 10005, cache_ttl=600), address)
+    assert host.response_cache.ttl_for("Weather_Agent") == 600
+
+    host._register_agent(agent_card("Weather_Agent", 10005, cache_ttl=0), address)
+
+    assert host.response_cache.ttl_for("Weather_Agent") == 0
+
+
+def test_workers_share_responses_through_the_database(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    writer, reader = SharedResponseCache(db_path), SharedResponseCache(db_path)
+
+    async def share():
+        await writer.put("Flight_Agent", FLIGHTS, [{"text": "ok"}])
+        return await reader.get("Flight_Agent", FLIGHTS)
+
+    try:
+        assert asyncio.run(share()) == [{"text": "ok"}]
+        assert reader.stats()["shared_hits"] == 1
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_a_locked_database_is_a_miss_without_blocking_the_loop(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = SharedResponseCache(db_path)
+    other_worker = sqlite3.connect(db_path, isolation_level=None)
+
+    async def put_and_tick():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.create_task(tick())
+        await cache.get("Flight_Agent", FLIGHTS)  # Creates the table.
+        other_worker.execute("BEGIN EXCLUSIVE")
+        started = time.perf_counter()
+        await cache.put("Flight_Agent", FLIGHTS, [{"text": "ok"}])
+        elapsed = time.perf_counter() - started
+        ticker.cancel()
+        return elapsed, ticks
+
+    try:
+        elapsed, ticks = asyncio.run(put_and_tick())
+        assert elapsed < 1
+        assert ticks > 1
+        assert cache.stats()["db_errors"] == 1
+    finally:
+        other_worker.execute("ROLLBACK")
+        other_worker.close()
+        cache.close()
@@ -0,0 +1,55 @@
+import json
+from types import SimpleNamespace
+
+import agent
+from agent import HostAgent
+from cards import TRAVEL_AGENTS, agent_card
+from google.genai import types
+
+FULL_TRIP = (
+    "Plan a full itinerary from Boston to Rome from 2026-11-01 to 2026-11-05 for "
+    "2 adults with flights, hotels, cabs, activities, weather, documents, "
+    "italian food, currency and a budget of $3000"
+)
+
+
+def _travel_host() -> HostAgent:
+    host = HostAgent()
+    for name, port, description, tags in TRAVEL_AGENTS:
+        host._register_agent(
+            agent_card(name, port, description, tags), f"http://localhost:{port}"
+        )
+    return host
+
+
+def _context(query: str, contacted: list[str] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        user_content=types.Content(role="user", parts=[types.Part(text=query)]),
+        state={"contacted_agents": contacted or []},
+    )
+
+
+def _listed(agents: str) -> list[str]:
+    return [json.loads(line)["name"] for line in agents.splitlines()]
+
+
+def test_a_full_trip_query_lists_all_travel_agents_by_default():
+    host = _travel_host()
+
+    listed = _listed(host._agents_for(_context(FULL_TRIP)))
+
+    assert sorted(listed) == sorted(name for name, *_ in TRAVEL_AGENTS)
+
+
+def test_large_registries_list_only_the_relevant_agents(monkeypatch):
+    monkeypatch.setattr(agent, "ROUTING_MIN_AGENTS", 4)
+    monkeypatch.setattr(agent, "ROUTING_TOP_K", 2)
+    host = _travel_host()
+
+    listed = _listed(
+        host._agents_for(_context("Get weather in Rome", ["Flight_Agent"]))
+    )
+
+    assert listed[0] == "Weather_Agent"
+    assert "Flight_Agent" in listed
+    assert len(listed) <= 3
@@ -0,0 +1,56 @@
+import asyncio
+
+from google.adk.events import Event
+from session_service import BoundedSessionService
+
+APP, USER = "travel", "user"
+
+
+async def _create(service: BoundedSessionService, *session_ids: str):
+    for session_id in session_ids:
+        await service.create_session(app_name=APP, user_id=USER, session_id=session_id)
+
+
+async def _get(service: BoundedSessionService, session_id: str):
+    return await service.get_session(app_name=APP, user_id=USER, session_id=session_id)
+
+
+def test_the_least_recently_used_session_is_evicted_past_the_cap():
+    async def run():
+        service = BoundedSessionService(max_sessions=2, idle_ttl=3600)
+        await _create(service, "a", "b")
+        await _get(service, "a")
+        await _create(service, "c")
+        return [await _get(service, name) is not None for name in "abc"], service
+
+    present, service = asyncio.run(run())
+
+    assert present == [True, False, True]
+    assert service.stats()["evicted"] == 1
+
+
+def test_idle_sessions_expire():
+    async def run():
+        service = BoundedSessionService(max_sessions=10, idle_ttl=0.01)
+        await _create(service, "a")
+        await asyncio.sleep(0.02)
+        return await _get(service, "a"), service
+
+    session, service = asyncio.run(run())
+
+    assert session is None
+    assert service.stats()["expired"] == 1
+
+
+def test_history_is_trimmed_by_whole_turns():
+    async def run():
+        service = BoundedSessionService(max_events=3)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        for author in ("user", "host", "host", "user", "host"):
+            await service.append_event(session, Event(author=author))
+        return await _get(service, session.id), service
+
+    session, service = asyncio.run(run())
+
+    assert [event.author for event in session.events] == ["user", "host"]
+    assert service.stats()["trimmed_events"] == 3
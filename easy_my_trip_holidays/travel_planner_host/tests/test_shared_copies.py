@@ -0,0 +1,54 @@
+"""The projects in this repository are installed separately, so modules they
+share are copied into each. These copies must not drift apart."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+TRAVEL = ROOT / "easy_my_trip_holidays"
+FRIENDS = ROOT / "a2a_friend_scheduling"
+
+COPIES = [
+    [
+        TRAVEL / "trip_common" / "task_store.py",
+        FRIENDS / "friend_common" / "task_store.py",
+        ROOT / "a2a_simple" / "task_store.py",
+    ],
+    [
+        TRAVEL / "travel_planner_host" / "session_service.py",
+        FRIENDS / "friend_common" / "session_service.py",
+    ],
+    [
+        TRAVEL / "travel_planner_host" / "sqlite_session_service.py",
+        FRIENDS / "friend_common" / "sqlite_session_service.py",
+    ],
+] + [
+    [
+        TRAVEL / "travel_planner_host" / name,
+        FRIENDS / "host_agent_adk" / "host" / name,
+    ]
+    for name in (
+        "agent_index.py",
+        "circuit_breaker.py",
+        "http_pool.py",
+        "mock_llm.py",
+        "progress.py",
+    )
+]
+
+
+def _code(path: Path) -> str:
+    # The modules are imported per project, "from session_service import" in
+    # one and "from friend_common.session_service import" in another, which
+    # also sorts them differently, so only the code after the imports counts.
+    code = re.sub(r"^(?:from|import) .*\n", "", path.read_text(), flags=re.MULTILINE)
+    return re.sub(r"\n{3,}", "\n\n", code)
+
+
+@pytest.mark.parametrize("paths", COPIES, ids=lambda paths: paths[0].name)
+def test_copies_are_identical(paths: list[Path]):
+    first, *others = paths
+    for other in others:
+        assert _code(other) == _code(first), f"{other} differs from {first}"
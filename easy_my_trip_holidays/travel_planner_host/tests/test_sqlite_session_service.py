@@ -0,0 +1,120 @@
+import asyncio
+
+import sqlite_session_service
+from google.adk.events import Event, EventActions
+from sqlite_session_service import SqliteSessionService
+
+APP, USER = "travel", "user"
+
+
+def _service(tmp_path, **kwargs) -> SqliteSessionService:
+    return SqliteSessionService(str(tmp_path / "sessions.db"), **kwargs)
+
+
+async def _append(service: SqliteSessionService, session, *authors: str):
+    for author in authors:
+        await service.append_event(session, Event(author=author))
+
+
+def test_shutdown_flushes_writes_queued_behind_the_interval(tmp_path, monkeypatch):
+    # Queued writes would otherwise wait an hour for the background flush.
+    monkeypatch.setattr(sqlite_session_service, "FLUSH_INTERVAL", 3600)
+
+    async def write_then_close():
+        service = _service(tmp_path)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        await _append(service, session, "user", "host")
+        pending = service.stats()["pending_writes"]
+        await service.aclose()
+        return session.id, pending
+
+    session_id, pending = asyncio.run(write_then_close())
+    assert pending > 0
+
+    async def reopen():
+        service = _service(tmp_path)
+        session = await service.get_session(
+            app_name=APP, user_id=USER, session_id=session_id
+        )
+        await service.aclose()
+        return session
+
+    session = asyncio.run(reopen())
+    assert [event.author for event in session.events] == ["user", "host"]
+
+
+def test_writes_are_batched_into_one_flush(tmp_path):
+    async def write():
+        service = _service(tmp_path)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        await _append(service, session, "user", "host", "host")
+        await asyncio.sleep(sqlite_session_service.FLUSH_INTERVAL * 4)
+        stats = service.stats()
+        await service.aclose()
+        return stats
+
+    stats = asyncio.run(write())
+
+    assert stats["flushes"] == 1
+    assert stats["flushed_writes"] == 8
+    assert stats["pending_writes"] == 0
+
+
+def test_an_evicted_session_is_loaded_back_from_disk(tmp_path):
+    async def run():
+        service = _service(tmp_path, max_sessions=1)
+        first = await service.create_session(app_name=APP, user_id=USER)
+        await _append(service, first, "user")
+        await service.create_session(app_name=APP, user_id=USER)
+        loaded = await service.get_session(
+            app_name=APP, user_id=USER, session_id=first.id
+        )
+        stats = service.stats()
+        await service.aclose()
+        return loaded, stats
+
+    loaded, stats = asyncio.run(run())
+
+    assert [event.author for event in loaded.events] == ["user"]
+    assert stats["evicted"] >= 1
+    assert stats["loaded_sessions"] == 1
+
+
+def test_user_state_survives_a_restart(tmp_path):
+    async def write():
+        service = _service(tmp_path)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        await service.append_event(
+            session,
+            Event(
+                author="host", actions=EventActions(state_delta={"user:home": "NYC"})
+            ),
+        )
+        await service.aclose()
+
+    async def restart():
+        service = _service(tmp_path)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        await service.aclose()
+        return session.state
+
+    asyncio.run(write())
+
+    assert asyncio.run(restart())["user:home"] == "NYC"
+
+
+def test_deleting_a_session_removes_it_from_disk(tmp_path):
+    async def run():
+        service = _service(tmp_path)
+        session = await service.create_session(app_name=APP, user_id=USER)
+        await _append(service, session, "user")
+        await service.delete_session(app_name=APP, user_id=USER, session_id=session.id)
+        await service.aclose()
+        service = _service(tmp_path)
+        found = await service.get_session(
+            app_name=APP, user_id=USER, session_id=session.id
+        )
+        await service.aclose()
+        return found
+
+    assert asyncio.run(run()) is None
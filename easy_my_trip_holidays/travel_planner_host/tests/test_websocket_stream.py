@@ -0,0 +1,128 @@
+import asyncio
+
+import main
+import pytest
+from fastapi.testclient import TestClient
+from websocket_stream import FrameQueue, SessionLocks
+
+
+def _progress(agent: str, text: str) -> dict:
+    return {"is_task_complete": False, "agent": agent, "content": text}
+
+
+def _final(text: str) -> dict:
+    return {"is_task_complete": True, "content": text}
+
+
+async def _drain(queue: FrameQueue):
+    while (frame := await queue.get()) is not None:
+        yield frame
+
+
+def test_messages_for_one_session_run_in_turn_and_others_concurrently():
+    locks = SessionLocks()
+    events = []
+
+    async def answer(session_id: str, name: str):
+        async with locks.hold(session_id):
+            events.append(("start", name))
+            await asyncio.sleep(0.01)
+            events.append(("end", name))
+
+    async def run():
+        await asyncio.gather(answer("a", "a1"), answer("a", "a2"), answer("b", "b1"))
+
+    asyncio.run(run())
+
+    assert events.index(("end", "a1")) < events.index(("start", "a2"))
+    assert events.index(("start", "b1")) < events.index(("end", "a1"))
+    assert locks.stats() == {"busy_sessions": 0, "contended": 1}
+
+
+def test_a_newer_progress_frame_replaces_one_from_the_same_agent():
+    async def run():
+        queue = FrameQueue(maxsize=8)
+        await queue.put(_progress("Flight_Agent", "searching"))
+        await queue.put(_progress("Hotel_Agent", "searching"))
+        await queue.put(_progress("Flight_Agent", "found 3"))
+        await queue.close()
+        return [frame async for frame in _drain(queue)]
+
+    assert asyncio.run(run()) == [
+        _progress("Flight_Agent", "found 3"),
+        _progress("Hotel_Agent", "searching"),
+    ]
+
+
+def test_a_full_queue_drops_the_oldest_progress_frame():
+    async def run():
+        queue = FrameQueue(maxsize=2)
+        await queue.put(_progress("Flight_Agent", "1"))
+        await queue.put(_progress("Hotel_Agent", "2"))
+        await queue.put(_progress("Cab_Agent", "3"))
+        await queue.close()
+        return [frame async for frame in _drain(queue)]
+
+    assert asyncio.run(run()) == [
+        _progress("Hotel_Agent", "2"),
+        _progress("Cab_Agent", "3"),
+    ]
+
+
+def test_a_final_frame_waits_for_room_instead_of_being_dropped():
+    async def run():
+        queue = FrameQueue(maxsize=1)
+        await queue.put(_final("first"))
+        second = asyncio.create_task(queue.put(_final("second")))
+        await asyncio.sleep(0.01)
+        waiting = not second.done()
+        first = await queue.get()
+        await second
+        return waiting, first, await queue.get()
+
+    waiting, first, second = asyncio.run(run())
+
+    assert waiting
+    assert (first, second) == (_final("first"), _final("second"))
+
+
+def test_closing_the_queue_ends_the_sender():
+    async def run():
+        queue = FrameQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        await queue.close()
+        await queue.put(_final("late"))
+        return await getter
+
+    assert asyncio.run(run()) is None
+
+
+class FakeHost:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def stream(self, query: str, session_id: str):
+        yield _progress("Flight_Agent", f"{session_id}: {query}")
+        if self.fail:
+            raise RuntimeError("agent crashed")
+        yield _final(query.upper())
+
+
+@pytest.mark.parametrize(
+    "fail, answer",
+    [
+        (False, "PARIS"),
+        (True, "Sorry, something went wrong. Please try again."),
+    ],
+)
+def test_the_websocket_answers_each_message(monkeypatch, fail, answer):
+    monkeypatch.setattr(main, "host_agent", FakeHost(fail), raising=False)
+
+    with TestClient(main.app).websocket_connect("/ws/s1") as websocket:
+        websocket.send_text("paris")
+        frames = [websocket.receive_json()]
+        while not frames[-1]["is_task_complete"]:
+            frames.append(websocket.receive_json())
+
+    assert frames[-1]["content"] == answer
@@ -0,0 +1,137 @@
+"""Per-session serialization and bounded, coalescing outbound queues for websockets."""
+
+import asyncio
+import os
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+# Frames waiting to be written to one socket before progress frames are dropped.
+SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "32"))
+# Messages a socket may have waiting behind the one being answered before the
+# server stops reading from it.
+MAX_PENDING_MESSAGES = int(os.getenv("WS_MAX_PENDING_MESSAGES", "4"))
+
+# Frame counters summed over every socket since startup.
+_totals: Counter[str] = Counter()
+
+
+def _is_progress(frame: dict[str, Any]) -> bool:
+    return not frame.get("is_task_complete")
+
+
+def _source(frame: dict[str, Any]) -> str:
+    """Which agent a progress frame is about, e.g. "Flight_Agent"."""
+    return frame.get("agent", "")
+
+
+class SessionLocks:
+    """One lock per session id, held while a message for that session is answered.
+
+    Messages for the same session run one after another, in arrival order,
+    whichever socket they came from; different sessions run concurrently. A
+    lock is dropped as soon as nobody holds or waits for it.
+    """
+
+    def __init__(self):
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: Counter[str] = Counter()
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, session_id: str) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(session_id, asyncio.Lock())
+        if lock.locked():
+            self.contended += 1
+        self._users[session_id] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[session_id] -= 1
+            if not self._users[session_id]:
+                del self._users[session_id]
+                del self._locks[session_id]
+
+    def stats(self) -> dict[str, Any]:
+        return {"busy_sessions": len(self._locks), "contended": self.contended}
+
+
+class FrameQueue:
+    """Bounded queue of frames waiting to be sent on one websocket.
+
+    Final frames are never dropped: when the queue is full, put() waits for the
+    sender to catch up. Progress frames never wait. A newer progress frame
+    replaces a queued one from the same agent, and when the queue is full the
+    oldest queued progress frame is dropped to make room.
+    """
+
+    def __init__(self, maxsize: int = SEND_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._frames: deque[dict[str, Any]] = deque()
+        self._changed = asyncio.Condition()
+        self._closed = False
+
+    async def put(self, frame: dict[str, Any]):
+        async with self._changed:
+            if self._closed:
+                return
+            if _is_progress(frame):
+                self._put_progress(frame)
+            else:
+                while (
+                    len(self._frames) >= self.maxsize
+                    and not self._drop_progress()
+                    and not self._closed
+                ):
+                    await self._changed.wait()
+                self._frames.append(frame)
+            self._changed.notify_all()
+
+    def _put_progress(self, frame: dict[str, Any]):
+        source = _source(frame)
+        # Only frames queued after the last final frame belong to this answer.
+        for i in range(len(self._frames) - 1, -1, -1):
+            queued = self._frames[i]
+            if not _is_progress(queued):
+                break
+            if _source(queued) == source:
+                self._frames[i] = frame
+                _totals["coalesced"] += 1
+                return
+        if len(self._frames) >= self.maxsize and not self._drop_progress():
+            _totals["dropped"] += 1
+            return
+        self._frames.append(frame)
+
+    def _drop_progress(self) -> bool:
+        for i, queued in enumerate(self._frames):
+            if _is_progress(queued):
+                del self._frames[i]
+                _totals["dropped"] += 1
+                return True
+        return False
+
+    async def get(self) -> dict[str, Any] | None:
+        """Next frame to send, or None once the queue is closed and empty."""
+        async with self._changed:
+            while not self._frames and not self._closed:
+                await self._changed.wait()
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            _totals["sent"] += 1
+            self._changed.notify_all()
+            return frame
+
+    async def close(self):
+        """Discards further frames and wakes anyone waiting on the queue."""
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+
+def websocket_stats() -> dict[str, int]:
+    """Frames sent, coalesced and dropped across all sockets since startup."""
+    return {key: _totals[key] for key in ("sent", "coalesced", "dropped")}
@@ -0,0 +1,8 @@
+"""Modules shared by the travel agents.
+
+Each agent runs from its own directory, so its __main__.py adds
+easy_my_trip_holidays/ to sys.path before importing from here. task_store is
+also used by the other projects in this repository, which are installed
+separately and keep their own copies; the travel host's tests check that the
+copies stay identical apart from their imports.
+"""